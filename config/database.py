@@ -1,22 +1,34 @@
 """
 Конфигурация базы данных.
+
+Конфигурация строится лениво при первом обращении к DB_CONFIG
+(или вызове get_db_config), поэтому импорт модуля не читает .env.
 """
 import os
+import functools
 from typing import Dict, Any
 
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    pass
 
-# Конфигурация базы данных
-DB_CONFIG: Dict[str, Any] = {
-    'host': os.getenv('DB_HOST'),
-    'port': int(os.getenv('DB_PORT')),
-    'user': os.getenv('DB_USER'),
-    'password': os.getenv('DB_PASSWORD'),
-    'db': os.getenv('DB_NAME'),
-    'charset': 'utf8mb4',
-}
+@functools.lru_cache(maxsize=1)
+def get_db_config() -> Dict[str, Any]:
+    """Возвращает конфигурацию подключения к базе данных"""
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        pass
+
+    return {
+        'host': os.getenv('DB_HOST'),
+        'port': int(os.getenv('DB_PORT') or 3306),
+        'user': os.getenv('DB_USER'),
+        'password': os.getenv('DB_PASSWORD'),
+        'db': os.getenv('DB_NAME'),
+        'charset': 'utf8mb4',
+    }
+
 
+def __getattr__(name):
+    if name == 'DB_CONFIG':
+        return get_db_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -226,6 +226,17 @@ CREATE TABLE `theatre` (
   `updated_at` timestamp NULL DEFAULT NULL ON UPDATE current_timestamp() COMMENT 'Дата и время последнего обновления записи'
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='Таблица театров';
 
+-- --------------------------------------------------------
+
+--
+-- Структура для представления `role_with_play`
+--
+
+CREATE OR REPLACE VIEW `role_with_play` AS
+SELECT `r`.*, `p`.`title` AS `play_title`
+FROM `role` `r`
+LEFT JOIN `play` `p` ON `r`.`play_id` = `p`.`id`;
+
 --
 -- Индексы сохранённых таблиц
 --
@@ -234,7 +245,9 @@ CREATE TABLE `theatre` (
 -- Индексы таблицы `actor`
 --
 ALTER TABLE `actor`
-  ADD PRIMARY KEY (`id`);
+  ADD PRIMARY KEY (`id`),
+  ADD KEY `idx_actor_full_name` (`full_name`),
+  ADD FULLTEXT KEY `ft_actor_search` (`full_name`,`experience`);
 
 --
 -- Индексы таблицы `actor_production`
@@ -262,7 +275,9 @@ ALTER TABLE `actor_role`
 -- Индексы таблицы `author`
 --
 ALTER TABLE `author`
-  ADD PRIMARY KEY (`id`);
+  ADD PRIMARY KEY (`id`),
+  ADD KEY `idx_author_full_name` (`full_name`),
+  ADD FULLTEXT KEY `ft_author_search` (`full_name`,`biography`);
 
 --
 -- Индексы таблицы `author_play`
@@ -275,14 +290,18 @@ ALTER TABLE `author_play`
 -- Индексы таблицы `director`
 --
 ALTER TABLE `director`
-  ADD PRIMARY KEY (`id`);
+  ADD PRIMARY KEY (`id`),
+  ADD KEY `idx_director_full_name` (`full_name`),
+  ADD FULLTEXT KEY `ft_director_search` (`full_name`,`biography`);
 
 --
 -- Индексы таблицы `location`
 --
 ALTER TABLE `location`
   ADD PRIMARY KEY (`id`),
-  ADD UNIQUE KEY `unique_location_theatre_hall` (`theatre_id`,`hall_name`);
+  ADD UNIQUE KEY `unique_location_theatre_hall` (`theatre_id`,`hall_name`),
+  ADD KEY `idx_location_hall_name` (`hall_name`),
+  ADD FULLTEXT KEY `ft_location_hall_name` (`hall_name`);
 
 --
 -- Индексы таблицы `performance`
@@ -296,7 +315,10 @@ ALTER TABLE `performance`
 -- Индексы таблицы `play`
 --
 ALTER TABLE `play`
-  ADD PRIMARY KEY (`id`);
+  ADD PRIMARY KEY (`id`),
+  ADD KEY `idx_play_title` (`title`),
+  ADD KEY `idx_play_genre` (`genre`),
+  ADD FULLTEXT KEY `ft_play_search` (`title`,`genre`,`description`);
 
 --
 -- Индексы таблицы `production`
@@ -304,7 +326,9 @@ ALTER TABLE `play`
 ALTER TABLE `production`
   ADD PRIMARY KEY (`id`),
   ADD KEY `idx_production_play` (`play_id`),
-  ADD KEY `idx_production_director` (`director_id`);
+  ADD KEY `idx_production_director` (`director_id`),
+  ADD KEY `idx_production_title` (`title`),
+  ADD FULLTEXT KEY `ft_production_search` (`title`,`description`);
 
 --
 -- Индексы таблицы `rehearsal`
@@ -319,14 +343,17 @@ ALTER TABLE `rehearsal`
 --
 ALTER TABLE `role`
   ADD PRIMARY KEY (`id`),
-  ADD KEY `idx_role_play` (`play_id`);
+  ADD KEY `idx_role_play` (`play_id`),
+  ADD KEY `idx_role_title` (`title`);
 
 --
 -- Индексы таблицы `theatre`
 --
 ALTER TABLE `theatre`
   ADD PRIMARY KEY (`id`),
-  ADD UNIQUE KEY `unique_theatre_name` (`name`);
+  ADD UNIQUE KEY `unique_theatre_name` (`name`),
+  ADD FULLTEXT KEY `ft_theatre_search` (`name`,`city`,`street`,`house_number`,`postal_code`),
+  ADD FULLTEXT KEY `ft_theatre_name` (`name`);
 
 --
 -- AUTO_INCREMENT для сохранённых таблиц
@@ -0,0 +1,23 @@
+--
+-- FULLTEXT индексы для поиска (DatabaseManager._search_records).
+-- Применяется к базам, созданным до появления индексов в database_structure.sql:
+--   mysql -u theater_user -p bd < sql/migrations/001_fulltext_search.sql
+--
+
+ALTER TABLE `actor`
+  ADD FULLTEXT KEY `ft_actor_search` (`full_name`,`experience`);
+
+ALTER TABLE `author`
+  ADD FULLTEXT KEY `ft_author_search` (`full_name`,`biography`);
+
+ALTER TABLE `director`
+  ADD FULLTEXT KEY `ft_director_search` (`full_name`,`biography`);
+
+ALTER TABLE `play`
+  ADD FULLTEXT KEY `ft_play_search` (`title`,`genre`,`description`);
+
+ALTER TABLE `production`
+  ADD FULLTEXT KEY `ft_production_search` (`title`,`description`);
+
+ALTER TABLE `theatre`
+  ADD FULLTEXT KEY `ft_theatre_search` (`name`,`city`,`street`,`house_number`,`postal_code`);
@@ -0,0 +1,27 @@
+--
+-- Индексы для выборки уникальных значений (DatabaseManager._get_unique_values):
+-- DISTINCT ... ORDER BY читается по индексу без полного сканирования и сортировки.
+--   mysql -u theater_user -p bd < sql/migrations/002_unique_value_indexes.sql
+--
+
+ALTER TABLE `actor`
+  ADD KEY `idx_actor_full_name` (`full_name`);
+
+ALTER TABLE `author`
+  ADD KEY `idx_author_full_name` (`full_name`);
+
+ALTER TABLE `director`
+  ADD KEY `idx_director_full_name` (`full_name`);
+
+ALTER TABLE `location`
+  ADD KEY `idx_location_hall_name` (`hall_name`);
+
+ALTER TABLE `play`
+  ADD KEY `idx_play_title` (`title`),
+  ADD KEY `idx_play_genre` (`genre`);
+
+ALTER TABLE `production`
+  ADD KEY `idx_production_title` (`title`);
+
+ALTER TABLE `role`
+  ADD KEY `idx_role_title` (`title`);
@@ -0,0 +1,9 @@
+--
+-- Представление ролей с названием пьесы (DatabaseManager.TABLE_CONFIG['roles']).
+--   mysql -u theater_user -p bd < sql/migrations/003_role_with_play_view.sql
+--
+
+CREATE OR REPLACE VIEW `role_with_play` AS
+SELECT `r`.*, `p`.`title` AS `play_title`
+FROM `role` `r`
+LEFT JOIN `play` `p` ON `r`.`play_id` = `p`.`id`;
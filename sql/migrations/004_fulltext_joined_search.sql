@@ -0,0 +1,11 @@
+--
+-- FULLTEXT индексы для поиска по связанным таблицам (DatabaseManager._search_records):
+-- места проведения ищутся по залу, спектакли и репетиции - по названию театра и залу.
+--   mysql -u theater_user -p bd < sql/migrations/004_fulltext_joined_search.sql
+--
+
+ALTER TABLE `location`
+  ADD FULLTEXT KEY `ft_location_hall_name` (`hall_name`);
+
+ALTER TABLE `theatre`
+  ADD FULLTEXT KEY `ft_theatre_name` (`name`);
@@ -1,9 +1,26 @@
 """
 API endpoints для театральной системы.
+
+Модуль reports импортируется лениво при первом обращении к атрибуту,
+чтобы импорт пакета не загружал wxPython.
 """
-from .reports import ReportExportDialog, show_export_dialog
+import importlib
 
 __all__ = [
     'ReportExportDialog',
     'show_export_dialog',
 ]
+
+_LAZY_ATTRS = {
+    'ReportExportDialog': '.reports',
+    'show_export_dialog': '.reports',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -3,12 +3,34 @@ API для генерации и экспорта отчетов.
 """
 import wx
 import os
-from datetime import datetime
+import time
 from typing import Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Директория отчетов по умолчанию (вычисляется один раз при импорте)
+_REPORTS_DIR = os.path.join(os.getcwd(), 'reports')
+
+# Фильтры файлового диалога по расширению формата
+_WILDCARDS = {
+    'pdf': "PDF файлы (*.pdf)|*.pdf",
+    'xlsx': "Excel файлы (*.xlsx)|*.xlsx",
+}
+
+# Таблица для удаления переносов строк из пути за один проход
+_NL_STRIP = str.maketrans('', '', '\r\n')
+
+
+def _ensure_dir(path: str) -> bool:
+    """Создает директорию одним вызовом makedirs, без предварительной проверки"""
+    try:
+        os.makedirs(path, exist_ok=True)
+        return True
+    except OSError as e:
+        logger.error("Не удалось создать директорию %s: %s", path, e)
+        return False
+
 
 class ReportExportDialog(wx.Dialog):
     """Диалог выбора формата и пути сохранения отчета"""
@@ -21,9 +43,28 @@ class ReportExportDialog(wx.Dialog):
         self.selected_format = None
         self.selected_path = None
         self.default_formats = default_formats or ['PDF', 'XLSX']
-        
+        self._format_exts = [fmt.lower() for fmt in self.default_formats]
+        self._timestamp = None
+        # Интерфейс строится при первом показе диалога
+        self._built = False
+    
+    def _ensure_built(self):
+        """Создает интерфейс диалога, если он еще не создан"""
+        if self._built:
+            return
         self._create_ui()
         self.Center()
+        self._built = True
+    
+    def ShowModal(self):
+        # Метка времени для имени файла, общая для пути по умолчанию и диалога обзора;
+        # обновляется при каждом показе, чтобы повторный показ не предлагал старое имя
+        self._timestamp = time.strftime("%Y%m%d_%H%M%S", time.localtime())
+        if self._built:
+            self._update_default_path()
+        else:
+            self._ensure_built()
+        return super().ShowModal()
     
     def _create_ui(self):
         """Создание интерфейса диалога"""
@@ -90,9 +131,7 @@ class ReportExportDialog(wx.Dialog):
         panel.SetSizer(main_sizer)
         
         # Установка пути по умолчанию
-        default_path = os.path.join(os.getcwd(), 'reports')
-        if not os.path.exists(default_path):
-            os.makedirs(default_path, exist_ok=True)
+        _ensure_dir(_REPORTS_DIR)
         self._update_default_path()
     
     def _update_default_path(self):
@@ -100,31 +139,24 @@ class ReportExportDialog(wx.Dialog):
         try:
             format_idx = self.format_choice.GetSelection()
             if format_idx >= 0:
-                format_ext = self.default_formats[format_idx].lower()
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                default_filename = f"{self.report_name}_{timestamp}.{format_ext}"
-                default_path = os.path.join(os.getcwd(), 'reports', default_filename)
+                format_ext = self._format_exts[format_idx]
+                default_filename = f"{self.report_name}_{self._timestamp}.{format_ext}"
+                default_path = os.path.join(_REPORTS_DIR, default_filename)
                 self.path_text.SetValue(default_path)
         except Exception as e:
             logging.error(f"Ошибка обновления пути: {e}")
     
     def _on_browse(self, event):
         """Обработчик кнопки обзора"""
-        format_ext = self.default_formats[self.format_choice.GetSelection()].lower()
-        wildcard = f"*.{format_ext}|*.{format_ext}"
-        
-        if format_ext == 'pdf':
-            wildcard = "PDF файлы (*.pdf)|*.pdf"
-        elif format_ext == 'xlsx':
-            wildcard = "Excel файлы (*.xlsx)|*.xlsx"
+        format_ext = self._format_exts[self.format_choice.GetSelection()]
+        wildcard = _WILDCARDS.get(format_ext, f"*.{format_ext}|*.{format_ext}")
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        default_filename = f"{self.report_name}_{timestamp}.{format_ext}"
+        default_filename = f"{self.report_name}_{self._timestamp}.{format_ext}"
         
         with wx.FileDialog(
             self,
             "Сохранить отчет как",
-            defaultDir=os.path.join(os.getcwd(), 'reports'),
+            defaultDir=_REPORTS_DIR,
             defaultFile=default_filename,
             wildcard=wildcard,
             style=wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT
@@ -144,19 +176,14 @@ class ReportExportDialog(wx.Dialog):
             
             # Убираем переносы строк из пути
             if selected_path:
-                selected_path = selected_path.replace('\n', '').replace('\r', '')
+                selected_path = selected_path.translate(_NL_STRIP)
             
             if selected_path and selected_format:
-                # Проверяем, что путь валидный
-                try:
-                    # Создаем директорию если её нет
-                    dir_path = os.path.dirname(selected_path)
-                    if dir_path and not os.path.exists(dir_path):
-                        os.makedirs(dir_path, exist_ok=True)
-                    return selected_format, selected_path
-                except Exception as e:
-                    logger.error(f"Ошибка валидации пути: {e}")
+                # Создаем директорию если её нет
+                dir_path = os.path.dirname(selected_path)
+                if dir_path and not _ensure_dir(dir_path):
                     return None, None
+                return selected_format, selected_path
         
         return None, None
 
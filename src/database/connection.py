@@ -2,19 +2,307 @@
 Модуль управления базой данных.
 """
 import asyncio
+import functools
+import inspect
 import logging
+import random
+import threading
+import time
+import weakref
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import aiomysql
-from config.database import DB_CONFIG
+from pymysql.constants import CR, ER
+from config.database import get_db_config
+
+# mysqlclient (MySQLdb) разбирает строки результата на C; если он установлен,
+# большие выборки _select_all выполняются через него в пуле потоков
+try:
+    import MySQLdb
+    import MySQLdb.cursors
+    MYSQLDB_AVAILABLE = True
+except ImportError:
+    MYSQLDB_AVAILABLE = False
 from src.utils.validators import (
     validate_full_name, validate_title, validate_year,
     validate_date, validate_datetime, validate_capacity
 )
 
+logger = logging.getLogger(__name__)
+
+# Коды потери соединения с сервером: только при них соединение закрывается
+# и запрос повторяется; остальные OperationalError - обычные ошибки сервера
+_CONNECTION_LOST_ERRORS = frozenset((
+    CR.CR_CONN_HOST_ERROR, CR.CR_SERVER_GONE_ERROR, CR.CR_SERVER_LOST,
+))
+
+
+def _is_connection_lost(exc):
+    """Ошибка означает потерю соединения, а не ошибку в самом запросе"""
+    if isinstance(exc, aiomysql.InterfaceError):
+        return True
+    return isinstance(exc, aiomysql.OperationalError) and bool(exc.args) and exc.args[0] in _CONNECTION_LOST_ERRORS
+
+
+def _is_mysqldb_connection_lost(exc):
+    """То же для ошибок mysqlclient (коды клиента у него те же)"""
+    if isinstance(exc, MySQLdb.InterfaceError):
+        return True
+    return isinstance(exc, MySQLdb.OperationalError) and bool(exc.args) and exc.args[0] in _CONNECTION_LOST_ERRORS
+
+
+def _fstrip(value):
+    """
+    Обрезает пробелы по краям; пустое значение -> None. Строка без пробелов
+    по краям (обычный случай для полей формы) возвращается без вызова strip.
+    """
+    if not value:
+        return None
+    if value[0].isspace() or value[-1].isspace():
+        return value.strip()
+    return value
+
+
+def _required(message):
+    """Проверка обязательного значения в форме (is_valid, error_msg)"""
+    def check(value):
+        return (True, None) if value else (False, message)
+    return check
+
+
+_LOCATION_REQUIRED = _required("Место проведения обязательно")
+_THEATRE_REQUIRED = _required("Необходимо указать театр")
+
+
+def _safe_query(default, message):
+    """
+    Декоратор методов чтения для интерфейса: ошибка запроса записывается в лог
+    как "message: ошибка", вместо исключения возвращается default().
+    Отмена задачи (CancelledError) не перехватывается.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                logger.error(f"{message}: {e}")
+                return default()
+        return wrapper
+    return decorator
+
+
+def _empty_label_counts():
+    return {'labels': [], 'counts': []}
+
+
+def _validated(**validators):
+    """
+    Проверяет аргументы метода перед вызовом. validators: имя параметра ->
+    функция, возвращающая (is_valid, error_msg); при ошибке ValueError.
+    Позиции параметров определяются один раз при декорировании.
+    """
+    def decorator(method):
+        parameters = list(inspect.signature(method).parameters.values())[1:]
+        positions = {parameter.name: index for index, parameter in enumerate(parameters)}
+        checks = tuple(
+            (name, positions[name], parameters[positions[name]].default, validator)
+            for name, validator in validators.items()
+        )
+
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            for name, index, default, validator in checks:
+                if index < len(args):
+                    value = args[index]
+                else:
+                    value = kwargs.get(name, default)
+                is_valid, error_msg = validator(value)
+                if not is_valid:
+                    raise ValueError(error_msg)
+            return await method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+@functools.lru_cache(maxsize=32)
+def _in_placeholders(count):
+    """Строка '%s, %s, ...' для IN (...) на count значений"""
+    return ", ".join(["%s"] * count)
+
+
+# Условия фильтра по периоду для статистики репетиций ('весь' - без ограничения)
+_PERIOD_SQL = {
+    'неделя': "r.datetime >= DATE_SUB(NOW(), INTERVAL 1 WEEK)",
+    'месяц': "r.datetime >= DATE_SUB(NOW(), INTERVAL 1 MONTH)",
+    'квартал': "r.datetime >= DATE_SUB(NOW(), INTERVAL 3 MONTH)",
+    'год': "r.datetime >= DATE_SUB(NOW(), INTERVAL 1 YEAR)",
+}
+# Время берется с сервера БД (NOW()), а не с клиента: окна периодов и граница
+# «предстоящих» не зависят от часов и часового пояса приложения
+
+# JOIN фильтров по псевдониму присоединяемой таблицы
+_JOIN_DIRECTOR = {
+    'pr': "JOIN production pr ON r.production_id = pr.id",
+    'd': "JOIN director d ON pr.director_id = d.id",
+}
+_JOIN_THEATRE = {
+    'loc': "JOIN location loc ON r.location_id = loc.id",
+    't': "JOIN theatre t ON loc.theatre_id = t.id",
+}
+
+
+def _rehearsal_filter_clauses(period, has_director, has_theatre):
+    """JOIN и условия WHERE фильтров репетиций; параметры: режиссер, затем театр"""
+    # JOIN по псевдониму: повторное соединение той же таблицы не добавляется
+    joins = {}
+    conditions = []
+    if period in _PERIOD_SQL:
+        conditions.append(_PERIOD_SQL[period])
+    if has_director:
+        joins.update(_JOIN_DIRECTOR)
+        conditions.append("d.full_name = %s")
+    if has_theatre:
+        joins.update(_JOIN_THEATRE)
+        conditions.append("t.name = %s")
+    return " ".join(joins.values()), conditions
+
+
+@functools.lru_cache(maxsize=64)
+def _rehearsals_by_month_sql(period, has_director, has_theatre):
+    join_clause, conditions = _rehearsal_filter_clauses(period, has_director, has_theatre)
+    # Если нет условий по дате, ограничиваем последним годом для производительности
+    if period not in _PERIOD_SQL:
+        conditions.insert(0, _PERIOD_SQL['год'])
+    return f"""
+        SELECT DATE_FORMAT(r.datetime, '%%Y-%%m') as month, COUNT(*) as count 
+        FROM rehearsal r
+        {join_clause}
+        WHERE {" AND ".join(conditions)}
+        GROUP BY month 
+        ORDER BY month
+    """
+
+
+@functools.lru_cache(maxsize=64)
+def _rehearsals_count_sql(period, has_director, has_theatre):
+    join_clause, conditions = _rehearsal_filter_clauses(period, has_director, has_theatre)
+    where_clause = " AND ".join(conditions) if conditions else "1=1"
+    return f"""
+        SELECT COUNT(*) as count 
+        FROM rehearsal r
+        {join_clause}
+        WHERE {where_clause}
+    """
+
+
+@functools.lru_cache(maxsize=64)
+def _upcoming_rehearsals_sql(period, has_director, has_theatre):
+    # Таблицы уже соединены в запросе, JOIN фильтров не нужны
+    _, conditions = _rehearsal_filter_clauses(period, has_director, has_theatre)
+    # Показываем только будущие репетиции
+    conditions.append("r.datetime >= NOW()")
+    return f"""
+        SELECT r.*, pr.title as production_title, d.full_name as director_name, 
+               pl.title as play_title, pl.genre, t.name as theatre_name, l.hall_name as location_name
+        FROM rehearsal r
+        JOIN production pr ON r.production_id = pr.id
+        JOIN play pl ON pr.play_id = pl.id
+        JOIN director d ON pr.director_id = d.id
+        JOIN location l ON r.location_id = l.id
+        JOIN theatre t ON l.theatre_id = t.id
+        WHERE {" AND ".join(conditions)}
+        ORDER BY r.datetime ASC
+        LIMIT %s
+    """
+
+
+def _statement_keyword(query):
+    """Первое слово запроса (SELECT/INSERT/UPDATE/DELETE) без копирования всей строки"""
+    i = 0
+    n = len(query)
+    while i < n and query[i] in ' \t\r\n':
+        i += 1
+    return query[i:i + 6].upper()
+
+
+def _event_search_where(alias):
+    """
+    Условие поиска спектаклей/репетиций: фильтр по связанным таблицам
+    через EXISTS, соединения основного запроса нужны только для вывода.
+    """
+    return (
+        f"CAST({alias}.datetime AS CHAR) LIKE %s"
+        f" OR EXISTS (SELECT 1 FROM location sl JOIN theatre st ON sl.theatre_id = st.id"
+        f" WHERE sl.id = {alias}.location_id AND (st.name LIKE %s OR sl.hall_name LIKE %s))"
+        f" OR EXISTS (SELECT 1 FROM production sp"
+        f" WHERE sp.id = {alias}.production_id AND sp.title LIKE %s)"
+    )
+
+
+def _event_fulltext_where(alias):
+    """
+    То же условие с FULLTEXT по названию театра и залу: места проведения
+    выбираются один раз по индексам, а не подзапросом для каждой строки.
+    Параметры: LIKE, MATCH, MATCH, LIKE (см. fulltext_params).
+    """
+    return (
+        f"CAST({alias}.datetime AS CHAR) LIKE %s"
+        f" OR {alias}.location_id IN (SELECT sl.id FROM location sl JOIN theatre st ON sl.theatre_id = st.id"
+        f" WHERE MATCH(st.name) AGAINST (%s IN BOOLEAN MODE)"
+        f" OR MATCH(sl.hall_name) AGAINST (%s IN BOOLEAN MODE))"
+        f" OR EXISTS (SELECT 1 FROM production sp"
+        f" WHERE sp.id = {alias}.production_id AND sp.title LIKE %s)"
+    )
+
+
+def _compile_write_queries(columns_by_table):
+    """Тексты INSERT/UPDATE/DELETE по id для каждой таблицы"""
+    queries = {}
+    for table, columns in columns_by_table.items():
+        placeholders = ", ".join(["%s"] * len(columns))
+        assignments = ", ".join(f"{column}=%s" for column in columns)
+        queries[('insert', table)] = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+        queries[('update', table)] = f"UPDATE {table} SET {assignments} WHERE id=%s"
+        queries[('delete', table)] = f"DELETE FROM {table} WHERE id=%s"
+    return queries
+
+
+def _compile_table_config(config):
+    """Заранее собирает SQL фрагменты конфигурации таблицы"""
+    query = f"SELECT {config['select']} FROM {config['from']}"
+    if config.get('joins'):
+        query = f"{query} {config['joins']}"
+    config['_base_sql'] = query
+    config['_order_sql'] = {
+        (column_key, ascending): f"{expr} {'ASC' if ascending else 'DESC'}"
+        for column_key, expr in config['orderable'].items()
+        for ascending in (True, False)
+    }
+    if config.get('search_where'):
+        config['_search_where'] = config['search_where']
+        config['_search_count'] = config['search_where'].count('%s')
+    else:
+        config['_search_where'] = " OR ".join(f"{expr} LIKE %s" for expr in config['searchable'])
+        config['_search_count'] = len(config['searchable'])
+    # Условие FULLTEXT поиска и вид каждого параметра: 'match' - строка для
+    # AGAINST, 'like' - шаблон %текст% для столбцов без FULLTEXT индекса
+    if config.get('fulltext_where'):
+        config['_fulltext_where'] = config['fulltext_where']
+        config['_fulltext_params'] = config['fulltext_params']
+    else:
+        fulltext = config.get('fulltext') or []
+        config['_fulltext_where'] = " OR ".join(
+            f"MATCH({', '.join(columns)}) AGAINST (%s IN BOOLEAN MODE)" for columns in fulltext
+        )
+        config['_fulltext_params'] = ('match',) * len(fulltext)
+
 
 class DatabaseManager:
     TABLE_CONFIG = {
         'actors': {
             'from': 'actor a',
+            'tables': ('actor',),
             'select': 'a.*',
             'orderable': {
                 'id': 'a.id',
@@ -23,9 +311,11 @@ class DatabaseManager:
             },
             'default_sort': 'id',
             'searchable': ['a.full_name', 'a.experience'],
+            'fulltext': [('a.full_name', 'a.experience')],
         },
         'authors': {
             'from': 'author a',
+            'tables': ('author',),
             'select': 'a.*',
             'orderable': {
                 'id': 'a.id',
@@ -34,9 +324,11 @@ class DatabaseManager:
             },
             'default_sort': 'id',
             'searchable': ['a.full_name', 'a.biography'],
+            'fulltext': [('a.full_name', 'a.biography')],
         },
         'directors': {
             'from': 'director d',
+            'tables': ('director',),
             'select': 'd.*',
             'orderable': {
                 'id': 'd.id',
@@ -45,9 +337,11 @@ class DatabaseManager:
             },
             'default_sort': 'id',
             'searchable': ['d.full_name', 'd.biography'],
+            'fulltext': [('d.full_name', 'd.biography')],
         },
         'plays': {
             'from': 'play p',
+            'tables': ('play',),
             'select': 'p.*',
             'orderable': {
                 'id': 'p.id',
@@ -58,9 +352,11 @@ class DatabaseManager:
             },
             'default_sort': 'id',
             'searchable': ['p.title', 'p.genre', 'p.description'],
+            'fulltext': [('p.title', 'p.genre', 'p.description')],
         },
         'productions': {
             'from': 'production p',
+            'tables': ('production',),
             'select': 'p.*',
             'orderable': {
                 'id': 'p.id',
@@ -70,9 +366,11 @@ class DatabaseManager:
             },
             'default_sort': 'id',
             'searchable': ['p.title', 'p.description'],
+            'fulltext': [('p.title', 'p.description')],
         },
         'performances': {
             'from': 'performance p',
+            'tables': ('performance', 'location', 'theatre', 'production'),
             'select': 'p.*, t.name AS theatre_name, l.hall_name, pr.title AS production_title',
             'joins': 'JOIN location l ON p.location_id = l.id '
                      'JOIN theatre t ON l.theatre_id = t.id '
@@ -82,10 +380,13 @@ class DatabaseManager:
                 'datetime': 'p.datetime',
             },
             'default_sort': 'id',
-            'searchable': ['CAST(p.datetime AS CHAR)', 't.name', 'l.hall_name', 'pr.title'],
+            'search_where': _event_search_where('p'),
+            'fulltext_where': _event_fulltext_where('p'),
+            'fulltext_params': ('like', 'match', 'match', 'like'),
         },
         'rehearsals': {
             'from': 'rehearsal r',
+            'tables': ('rehearsal', 'location', 'theatre', 'production'),
             'select': 'r.*, t.name AS theatre_name, l.hall_name, pr.title AS production_title',
             'joins': 'JOIN location l ON r.location_id = l.id '
                      'JOIN theatre t ON l.theatre_id = t.id '
@@ -95,22 +396,26 @@ class DatabaseManager:
                 'datetime': 'r.datetime',
             },
             'default_sort': 'id',
-            'searchable': ['CAST(r.datetime AS CHAR)', 't.name', 'l.hall_name', 'pr.title'],
+            'search_where': _event_search_where('r'),
+            'fulltext_where': _event_fulltext_where('r'),
+            'fulltext_params': ('like', 'match', 'match', 'like'),
         },
         'roles': {
-            'from': 'role r',
-            'select': 'r.*, p.title AS play_title',
-            'joins': 'LEFT JOIN play p ON r.play_id = p.id',
+            # Представление role_with_play: роль вместе с названием пьесы
+            'from': 'role_with_play r',
+            'tables': ('role', 'play'),
+            'select': 'r.*',
             'orderable': {
                 'id': 'r.id',
                 'title': 'r.title',
                 'description': 'r.description',
             },
             'default_sort': 'id',
-            'searchable': ['r.title', 'r.description', 'p.title'],
+            'searchable': ['r.title', 'r.description', 'r.play_title'],
         },
         'theatres': {
             'from': 'theatre t',
+            'tables': ('theatre',),
             'select': 't.*',
             'orderable': {
                 'id': 't.id',
@@ -122,9 +427,11 @@ class DatabaseManager:
             },
             'default_sort': 'name',
             'searchable': ['t.name', 't.city', 't.street', 't.house_number', 't.postal_code'],
+            'fulltext': [('t.name', 't.city', 't.street', 't.house_number', 't.postal_code')],
         },
         'locations': {
             'from': 'location l',
+            'tables': ('location', 'theatre'),
             'select': 'l.*, t.name AS theatre_name, t.city, t.street, t.house_number, t.postal_code',
             'joins': 'JOIN theatre t ON l.theatre_id = t.id',
             'orderable': {
@@ -134,14 +441,218 @@ class DatabaseManager:
                 'capacity': 'l.capacity',
             },
             'default_sort': 'hall_name',
+            'search_sort': 'theatre_name',
             'searchable': ['t.name', 'l.hall_name', 't.city', 't.street', 't.house_number', 't.postal_code'],
+            'fulltext': [('t.name', 't.city', 't.street', 't.house_number', 't.postal_code'), ('l.hall_name',)],
         },
     }
+    for _config in TABLE_CONFIG.values():
+        _compile_table_config(_config)
+    del _config
+
+    # Время жизни кэша результатов (секунды) по ключу TABLE_CONFIG
+    CACHE_TTL = {
+        'performances': 5,
+        'rehearsals': 5,
+    }
+    DEFAULT_CACHE_TTL = 30
+    # Максимум записей в кэше результатов (LRU)
+    CACHE_MAX_ENTRIES = 128
+
+    # Запросы выборки одной записи по id, по имени таблицы
+    BY_ID_QUERIES = {
+        'actor': "SELECT * FROM actor WHERE id = %s",
+        'author': "SELECT * FROM author WHERE id = %s",
+        'director': "SELECT * FROM director WHERE id = %s",
+        'play': "SELECT * FROM play WHERE id = %s",
+        'production': "SELECT * FROM production WHERE id = %s",
+        'performance': "SELECT * FROM performance WHERE id = %s",
+        'rehearsal': "SELECT * FROM rehearsal WHERE id = %s",
+        'role': "SELECT * FROM role WHERE id = %s",
+        'theatre': "SELECT * FROM theatre WHERE id = %s",
+        'location': (
+            "SELECT l.*, t.name as theatre_name, t.city, t.street, t.house_number, t.postal_code "
+            "FROM location l JOIN theatre t ON l.theatre_id = t.id WHERE l.id = %s"
+        ),
+    }
+
+    # Столбцы, которые заполняют методы add_*/update_*, в порядке параметров
+    WRITE_COLUMNS = {
+        'actor': ('full_name', 'experience'),
+        'author': ('full_name', 'biography'),
+        'director': ('full_name', 'biography'),
+        'play': ('title', 'genre', 'year_written', 'description'),
+        'production': ('title', 'production_date', 'description', 'play_id', 'director_id'),
+        'performance': ('datetime', 'location_id', 'production_id'),
+        'rehearsal': ('datetime', 'location_id', 'production_id'),
+        'role': ('title', 'description', 'play_id'),
+        'theatre': ('name', 'city', 'street', 'house_number', 'postal_code'),
+        'location': ('theatre_id', 'hall_name', 'capacity'),
+    }
+    # Тексты запросов собираются один раз: ключ (операция, таблица)
+    WRITE_QUERIES = _compile_write_queries(WRITE_COLUMNS)
+    # Проверки значений перед записью: столбец (он же параметр метода) -> валидатор
+    WRITE_VALIDATORS = {
+        'actor': {'full_name': validate_full_name},
+        'author': {'full_name': validate_full_name},
+        'director': {'full_name': validate_full_name},
+        'play': {'title': validate_title, 'year_written': validate_year},
+        'production': {'title': validate_title, 'production_date': validate_date},
+        'performance': {'datetime': validate_datetime, 'location_id': _LOCATION_REQUIRED},
+        'rehearsal': {'datetime': validate_datetime, 'location_id': _LOCATION_REQUIRED},
+        'role': {'title': validate_title},
+        'theatre': {'name': validate_title},
+        'location': {'theatre_id': _THEATRE_REQUIRED, 'hall_name': validate_title, 'capacity': validate_capacity},
+    }
+    # Обязательные текстовые столбцы, у которых обрезаются пробелы по краям
+    _STRIPPED_COLUMNS = frozenset({'full_name', 'title', 'name', 'hall_name'})
+
+    # Столбцы, для которых допускается выборка уникальных значений
+    # (у каждого есть индекс, см. sql/migrations/002_unique_value_indexes.sql)
+    _UNIQUE_VALUE_COLUMNS = {
+        'actor': {'full_name'},
+        'author': {'full_name'},
+        'director': {'full_name'},
+        'location': {'hall_name'},
+        'play': {'genre', 'title'},
+        'production': {'title'},
+        'role': {'title'},
+        'theatre': {'name'},
+    }
+    # Текст запроса для каждой допустимой пары (таблица, столбец)
+    _UNIQUE_VALUE_QUERIES = {
+        (table, column): (
+            f"SELECT DISTINCT {column} AS value FROM {table} "
+            f"WHERE {column} IS NOT NULL AND {column} != '' ORDER BY value"
+        )
+        for table, columns in _UNIQUE_VALUE_COLUMNS.items()
+        for column in columns
+    }
+    # Списки уникальных значений почти не меняются
+    UNIQUE_VALUES_CACHE_TTL = 60
+    # Количество ролей сбрасывается любой записью в role, TTL только на случай
+    # изменений из других клиентов
+    TOTAL_ROLES_CACHE_TTL = 300
+
+    # Параметры пула соединений: пул фиксированного размера, все соединения
+    # открываются при создании пула, и запросы не ждут установки нового соединения;
+    # pool_recycle меньше wait_timeout сервера, чтобы не получать закрытые соединения
+    POOL_MAXSIZE = 20
+    POOL_MINSIZE = POOL_MAXSIZE
+    POOL_RECYCLE = 3600
+
+    # Максимум строк в одном многострочном INSERT (ограничение max_allowed_packet)
+    INSERT_BATCH_SIZE = 500
+
+    # Минимальная длина слова, которое попадает в FULLTEXT индекс InnoDB
+    # (innodb_ft_min_token_size). Более короткие запросы выполняются через LIKE.
+    FULLTEXT_MIN_WORD_LENGTH = 3
+    # Операторы BOOLEAN MODE, которые не должны попадать в запрос из строки поиска
+    _FULLTEXT_OPERATORS = str.maketrans({char: ' ' for char in '+-<>()~*"@'})
 
     def __init__(self, loop):
         self.pool = None
         self.loop = loop
-        self._lock = asyncio.Lock()
+        # Блокировки транзакций set_* по сущности: разные id выполняются параллельно
+        self._entity_locks = weakref.WeakValueDictionary()
+        # Таблицы, для которых в БД не найден FULLTEXT индекс
+        self._fulltext_unavailable = set()
+        # Кэш результатов: ключ -> (истекает, таблицы, строки)
+        self._cache = OrderedDict()
+        # Выполняющиеся загрузки: параллельные промахи ждут один запрос
+        self._inflight = {}
+        # Версии таблиц, увеличиваются при каждом изменении данных
+        self._table_versions = Counter()
+        # Соединения mysqlclient: по одному на поток пула
+        self._mysqldb_executor = None
+        self._mysqldb_local = threading.local()
+        self._mysqldb_connections = []
+
+    def __getattr__(self, name):
+        """
+        Методы выборки по ключу TABLE_CONFIG и таблице BY_ID_QUERIES:
+        get_all_<key>[_sorted], search_<key>[_sorted], add_<key>_bulk,
+        delete_<key>, get_<table>_by_id.
+        """
+        if name.startswith('get_all_'):
+            key = name[len('get_all_'):]
+            key = key[:-len('_sorted')] if key.endswith('_sorted') else key
+            if key in self.TABLE_CONFIG:
+                method = functools.partial(self._select_all, key)
+                self.__dict__[name] = method
+                return method
+        elif name.startswith('search_'):
+            key = name[len('search_'):]
+            key = key[:-len('_sorted')] if key.endswith('_sorted') else key
+            if key in self.TABLE_CONFIG:
+                method = functools.partial(self._search_records, key)
+                self.__dict__[name] = method
+                return method
+        elif name.startswith('add_') and name.endswith('_bulk'):
+            key = name[len('add_'):-len('_bulk')]
+            if key in self.TABLE_CONFIG:
+                method = functools.partial(self._bulk_insert, self.TABLE_CONFIG[key]['tables'][0])
+                self.__dict__[name] = method
+                return method
+        elif name.startswith('delete_'):
+            key = name[len('delete_'):]
+            if key in self.TABLE_CONFIG:
+                method = functools.partial(self._delete_many, self.TABLE_CONFIG[key]['tables'][0])
+                self.__dict__[name] = method
+                return method
+        elif name.startswith('get_') and name.endswith('_by_id'):
+            table = name[len('get_'):-len('_by_id')]
+            if table in self.BY_ID_QUERIES:
+                method = functools.partial(self._fetch_by_id, table)
+                self.__dict__[name] = method
+                return method
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def _entity_lock(self, table, entity_id):
+        lock = self._entity_locks.get((table, entity_id))
+        if lock is None:
+            lock = asyncio.Lock()
+            self._entity_locks[(table, entity_id)] = lock
+        return lock
+
+    async def _cached(self, cache_key, tables, ttl, loader, force_refresh=False):
+        """Возвращает результат loader() из кэша с TTL, сбрасываемого при изменении tables"""
+        if not force_refresh:
+            entry = self._cache.get(cache_key)
+            if entry and entry[0] > time.monotonic():
+                self._cache.move_to_end(cache_key)
+                return entry[2]
+            inflight = self._inflight.get(cache_key)
+            if inflight:
+                return await asyncio.shield(inflight[1])
+
+        versions = [self._table_versions[table] for table in tables]
+        task = asyncio.ensure_future(loader())
+        self._inflight[cache_key] = (tables, task)
+        try:
+            result = await asyncio.shield(task)
+        finally:
+            if self._inflight.get(cache_key, (None, None))[1] is task:
+                del self._inflight[cache_key]
+        # Не сохраняем результат, если данные изменились во время загрузки
+        if versions == [self._table_versions[table] for table in tables]:
+            self._cache[cache_key] = (time.monotonic() + ttl, tables, result)
+            self._cache.move_to_end(cache_key)
+            # Вытесняем давно не использованные записи
+            while len(self._cache) > self.CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+        return result
+
+    def _invalidate(self, *tables):
+        """Сбрасывает кэшированные результаты, зависящие от указанных таблиц"""
+        self._table_versions.update(tables)
+        changed = set(tables)
+        for cache_key, entry in list(self._cache.items()):
+            if changed.intersection(entry[1]):
+                del self._cache[cache_key]
+        for cache_key, (inflight_tables, _) in list(self._inflight.items()):
+            if changed.intersection(inflight_tables):
+                del self._inflight[cache_key]
 
     def _get_table_config(self, key):
         config = self.TABLE_CONFIG.get(key)
@@ -149,107 +660,198 @@ class DatabaseManager:
             raise ValueError(f"Неизвестная конфигурация таблицы: {key}")
         return config
 
-    def _resolve_sort_column(self, config, sort_column):
-        orderable = config['orderable']
-        fallback = config['default_sort']
-        column_key = sort_column if sort_column in orderable else fallback
-        return orderable[column_key]
-
-    def _build_base_query(self, config):
-        query = f"SELECT {config['select']} FROM {config['from']}"
-        joins = config.get('joins')
-        if joins:
-            query = f"{query} {joins}"
-        return query
+    def _order_sql(self, config, sort_column, sort_ascending):
+        column_key = sort_column if sort_column in config['orderable'] else config['default_sort']
+        return config['_order_sql'][(column_key, bool(sort_ascending))]
 
     async def _select_all(self, key, sort_column=None, sort_ascending=True, force_refresh=False):
         config = self._get_table_config(key)
-        order_expr = self._resolve_sort_column(config, sort_column or config['default_sort'])
-        direction = 'ASC' if sort_ascending else 'DESC'
-        query = f"{self._build_base_query(config)} ORDER BY {order_expr} {direction}"
-        return await self.execute_query(query, force_refresh=force_refresh)
+        order_sql = self._order_sql(config, sort_column, sort_ascending)
+        query = f"{config['_base_sql']} ORDER BY {order_sql}"
+        return await self._cached(
+            ('select', key, order_sql),
+            config['tables'],
+            self.CACHE_TTL.get(key, self.DEFAULT_CACHE_TTL),
+            lambda: self._fast_select(query),
+            force_refresh=force_refresh,
+        )
+
+    def _build_fulltext_query(self, search_text):
+        """Строка поиска для MATCH ... AGAINST в BOOLEAN MODE: каждое слово обязательно, по префиксу"""
+        words = search_text.translate(self._FULLTEXT_OPERATORS).split()
+        if not words or any(len(word) < self.FULLTEXT_MIN_WORD_LENGTH for word in words):
+            return None
+        return " ".join(f"+{word}*" for word in words)
 
     async def _search_records(self, key, search_text, sort_column=None, sort_ascending=True, force_refresh=False):
         if not search_text:
             return await self._select_all(key, sort_column, sort_ascending, force_refresh)
         config = self._get_table_config(key)
-        pattern = f"%{search_text}%"
-        conditions = [f"{expr} LIKE %s" for expr in config['searchable']]
-        where_clause = " OR ".join(conditions)
-        order_expr = self._resolve_sort_column(config, sort_column or config['default_sort'])
-        direction = 'ASC' if sort_ascending else 'DESC'
-        query = (
-            f"{self._build_base_query(config)} "
-            f"WHERE {where_clause} "
-            f"ORDER BY {order_expr} {direction}"
+        fulltext_query = None
+        if config['_fulltext_where'] and key not in self._fulltext_unavailable:
+            fulltext_query = self._build_fulltext_query(search_text)
+        if fulltext_query:
+            where_clause = config['_fulltext_where']
+            like = f"%{search_text}%"
+            params = tuple(
+                fulltext_query if kind == 'match' else like for kind in config['_fulltext_params']
+            )
+        else:
+            where_clause = config['_search_where']
+            params = (f"%{search_text}%",) * config['_search_count']
+        order_sql = self._order_sql(
+            config, sort_column or config.get('search_sort'), sort_ascending
         )
-        params = tuple(pattern for _ in config['searchable'])
-        return await self.execute_query(query, params, force_refresh=force_refresh)
+        query = f"{config['_base_sql']} WHERE {where_clause} ORDER BY {order_sql}"
+        try:
+            return await self.execute_query(query, params, is_select=True)
+        except aiomysql.Error as exc:
+            # БД без миграции FULLTEXT индексов: переходим на поиск через LIKE
+            if not fulltext_query or not exc.args or exc.args[0] != ER.FT_MATCHING_KEY_NOT_FOUND:
+                raise
+            logger.warning(f"FULLTEXT индекс для {key} не найден, используется поиск через LIKE")
+            self._fulltext_unavailable.add(key)
+            return await self._search_records(key, search_text, sort_column, sort_ascending, force_refresh)
+
+    # Выборка и поиск по ключу TABLE_CONFIG без промежуточных оберток
+    get_all = _select_all
+    search = _search_records
 
     async def _get_unique_values(self, table, column):
-        query = f"""
-            SELECT DISTINCT {column} AS value
-            FROM {table}
-            WHERE {column} IS NOT NULL AND {column} != ''
-            ORDER BY value
-        """
-        try:
-            rows = await self.execute_query(query)
+        query = self._UNIQUE_VALUE_QUERIES.get((table, column))
+        if query is None:
+            raise ValueError(f"Недопустимый столбец для уникальных значений: {table}.{column}")
+
+        async def load():
+            rows = await self.execute_query(query, is_select=True)
             return [row['value'] for row in rows] if rows else []
+
+        try:
+            return await self._cached(('unique', table, column), (table,), self.UNIQUE_VALUES_CACHE_TTL, load)
         except Exception as exc:
-            logging.error(f"Ошибка получения уникальных значений из {table}: {exc}")
+            logger.error(f"Ошибка получения уникальных значений из {table}: {exc}")
             return []
     
     async def init_pool(self):
         try:
-            self.pool = await aiomysql.create_pool(**DB_CONFIG, loop=self.loop)
-            logging.warning("Пул соединений с базой данных инициализирован")
+            self.pool = await aiomysql.create_pool(
+                **get_db_config(),
+                loop=self.loop,
+                minsize=self.POOL_MINSIZE,
+                maxsize=self.POOL_MAXSIZE,
+                pool_recycle=self.POOL_RECYCLE,
+            )
+            if MYSQLDB_AVAILABLE:
+                self._mysqldb_executor = ThreadPoolExecutor(
+                    max_workers=self.pool.maxsize, thread_name_prefix='mysqldb'
+                )
+            logger.warning("Пул соединений с базой данных инициализирован")
             return True
         except Exception as e:
-            logging.error(f"Ошибка инициализации пула: {e}")
+            logger.error(f"Ошибка инициализации пула: {e}")
             return False
     
+    def get_stats(self):
+        """Состояние пула соединений: размер, свободные и занятые соединения"""
+        if not self.pool:
+            return {'size': 0, 'free': 0, 'used': 0, 'minsize': 0, 'maxsize': 0}
+        return {
+            'size': self.pool.size,
+            'free': self.pool.freesize,
+            'used': self.pool.size - self.pool.freesize,
+            'minsize': self.pool.minsize,
+            'maxsize': self.pool.maxsize,
+        }
+
     async def close_pool(self):
         if self.pool:
             self.pool.close()
             await self.pool.wait_closed()
             # Не логируем закрытие пула (слишком часто)
-    
-    async def execute_query(self, query, args=None, max_retries=3, force_refresh=False):
+        if self._mysqldb_executor:
+            # Ожидание потоков mysqlclient не блокирует цикл событий
+            executor, self._mysqldb_executor = self._mysqldb_executor, None
+            await asyncio.get_running_loop().run_in_executor(None, executor.shutdown)
+            for conn in self._mysqldb_connections:
+                conn.close()
+            self._mysqldb_connections.clear()
+    
+    def _mysqldb_fetchall(self, query, args):
+        """Выполняет SELECT через mysqlclient в текущем потоке пула"""
+        conn = getattr(self._mysqldb_local, 'conn', None)
+        if conn is None:
+            conn = MySQLdb.connect(**get_db_config(), cursorclass=MySQLdb.cursors.DictCursor, autocommit=True)
+            self._mysqldb_local.conn = conn
+            self._mysqldb_connections.append(conn)
+        try:
+            cur = conn.cursor()
+            try:
+                cur.execute(query, args or ())
+                return list(cur.fetchall())
+            finally:
+                cur.close()
+        except MySQLdb.Error as e:
+            if not _is_mysqldb_connection_lost(e):
+                raise
+            # Соединение оборвалось: следующий запрос откроет новое
+            self._mysqldb_local.conn = None
+            self._mysqldb_connections.remove(conn)
+            conn.close()
+            raise
+    
+    async def _fast_select(self, query, args=None):
+        """SELECT через mysqlclient, если он доступен, иначе через пул aiomysql"""
+        if self._mysqldb_executor is None:
+            return await self.execute_query(query, args, is_select=True)
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._mysqldb_executor, self._mysqldb_fetchall, query, args)
+        except MySQLdb.Error as e:
+            # Ошибка в самом запросе повторится и в aiomysql
+            if not _is_mysqldb_connection_lost(e):
+                raise
+            logger.warning(f"Ошибка выполнения запроса через mysqlclient, повтор через aiomysql: {e}")
+            return await self.execute_query(query, args, is_select=True)
+    
+    async def execute_query(self, query, args=None, max_retries=3, is_select=None, as_dict=True):
         """
         Выполняет SQL запрос к базе данных с повторными попытками при ошибках.
         
         Логирование:
-        - DEBUG: выполнение SELECT запросов
-        - INFO: выполнение INSERT/UPDATE/DELETE операций
+        - DEBUG: выполнение INSERT/UPDATE/DELETE операций (SELECT не логируются)
         - ERROR: ошибки выполнения запросов
+        
+        Повтор выполняется только при потере соединения (InterfaceError,
+        OperationalError с кодами 2003/2006/2013) с экспоненциальной задержкой
+        со случайным разбросом; остальные ошибки сервера пробрасываются сразу.
+        
+        is_select можно передать явно, чтобы не определять тип по тексту запроса.
+        При as_dict=False строки SELECT возвращаются кортежами.
         """
         if not self.pool:
-            logging.error("Попытка выполнить запрос при неинициализированном пуле соединений")
+            logger.error("Попытка выполнить запрос при неинициализированном пуле соединений")
             raise RuntimeError("Пул соединений не инициализирован")
         
-        query_type = query.strip().upper().split()[0] if query.strip() else "UNKNOWN"
-        is_select = query_type == 'SELECT'
+        if is_select is None:
+            query_type = _statement_keyword(query)
+            is_select = query_type == 'SELECT'
+        else:
+            query_type = 'SELECT' if is_select else _statement_keyword(query)
         
-        async with self._lock:
-            for attempt in range(max_retries):
-                try:
-                    async with self.pool.acquire() as conn:
-                        # Если нужно принудительное обновление, отключаем кэш запросов
-                        if force_refresh and is_select:
-                            try:
-                                async with conn.cursor(aiomysql.DictCursor) as temp_cur:
-                                    await temp_cur.execute("SET SESSION query_cache_type = OFF")
-                            except:
-                                # Если не поддерживается, игнорируем
-                                pass
-                        async with conn.cursor(aiomysql.DictCursor) as cur:
+        # Изменяющим запросам нужен только lastrowid: строки в словари не превращаем
+        cursor_class = aiomysql.DictCursor if is_select and as_dict else aiomysql.Cursor
+        
+        for attempt in range(max_retries):
+            try:
+                async with self.pool.acquire() as conn:
+                    try:
+                        async with conn.cursor(cursor_class) as cur:
                             # Логируем только важные операции (не SELECT)
                             if not is_select:
-                                logging.warning(f"Выполнение {query_type} запроса (попытка {attempt + 1}/{max_retries})")
-                            
+                                logger.debug("Выполнение %s запроса (попытка %s/%s)", query_type, attempt + 1, max_retries)
+                                
                             await cur.execute(query, args or ())
-                            
+                                
                             if is_select:
                                 result = await cur.fetchall()
                                 # SELECT запросы не логируем (слишком много)
@@ -257,120 +859,76 @@ class DatabaseManager:
                             else:
                                 await conn.commit()
                                 lastrowid = cur.lastrowid
-                                logging.warning(f"{query_type} запрос выполнен успешно, lastrowid: {lastrowid}")
+                                logger.debug("%s запрос выполнен успешно, lastrowid: %s", query_type, lastrowid)
                                 return lastrowid
-                except Exception as e:
-                    if attempt == max_retries - 1:
-                        logging.error(f"Ошибка выполнения запроса после {max_retries} попыток: {e}")
-                        logging.error(f"Запрос: {query[:200]}...")  # Логируем первые 200 символов
-                        raise e
-                    logging.warning(f"Ошибка выполнения запроса (попытка {attempt + 1}/{max_retries}): {e}, повтор...")
-                    await asyncio.sleep(0.1)
-                    continue
-    
-    async def get_all_actors(self, force_refresh=False):
-        return await self._select_all('actors', force_refresh=force_refresh)
-    
-    async def get_all_authors(self, force_refresh=False):
-        return await self._select_all('authors', force_refresh=force_refresh)
-    
-    async def get_all_directors(self, force_refresh=False):
-        return await self._select_all('directors', force_refresh=force_refresh)
-    
-    async def get_all_plays(self, force_refresh=False):
-        return await self._select_all('plays', force_refresh=force_refresh)
-    
-    async def get_all_productions(self, force_refresh=False):
-        return await self._select_all('productions', force_refresh=force_refresh)
-    
-    async def get_all_performances(self, force_refresh=False):
-        return await self._select_all('performances', force_refresh=force_refresh)
-    
-    async def get_all_rehearsals(self, force_refresh=False):
-        return await self._select_all('rehearsals', force_refresh=force_refresh)
-    
-    async def get_all_roles(self, force_refresh=False):
-        return await self._select_all('roles', force_refresh=force_refresh)
-    
-    async def get_all_theatres(self, force_refresh=False):
-        return await self._select_all('theatres', force_refresh=force_refresh)
-    
-    async def get_all_locations(self, force_refresh=False):
-        return await self._select_all('locations', force_refresh=force_refresh)
-    
-    async def search_actors(self, search_text):
-        return await self._search_records('actors', search_text)
-    
-    async def search_authors(self, search_text):
-        return await self._search_records('authors', search_text)
-    
-    async def search_directors(self, search_text):
-        return await self._search_records('directors', search_text)
-    
-    async def search_plays(self, search_text):
-        return await self._search_records('plays', search_text)
-    
-    async def search_productions(self, search_text):
-        return await self._search_records('productions', search_text)
-    
-    async def search_performances(self, search_text):
-        return await self._search_records('performances', search_text)
-    
-    async def search_rehearsals(self, search_text):
-        return await self._search_records('rehearsals', search_text)
-    
-    async def search_roles(self, search_text):
-        return await self._search_records('roles', search_text)
-    
-    async def search_theatres(self, search_text):
-        return await self._search_records('theatres', search_text, sort_column='name')
-    
-    async def search_locations(self, search_text):
-        return await self._search_records('locations', search_text, sort_column='theatre_name')
-    
-    async def get_theatre_by_id(self, theatre_id):
-        result = await self.execute_query("SELECT * FROM theatre WHERE id = %s", (theatre_id,))
-        return result[0] if result else None
-    
-    async def get_location_by_id(self, location_id):
-        result = await self.execute_query("""
-            SELECT l.*, t.name as theatre_name, t.city, t.street, t.house_number, t.postal_code
-            FROM location l
-            JOIN theatre t ON l.theatre_id = t.id
-            WHERE l.id = %s
-        """, (location_id,))
-        return result[0] if result else None
-    
-    async def get_actor_by_id(self, actor_id):
-        result = await self.execute_query("SELECT * FROM actor WHERE id = %s", (actor_id,))
-        return result[0] if result else None
-    
-    async def get_author_by_id(self, author_id):
-        result = await self.execute_query("SELECT * FROM author WHERE id = %s", (author_id,))
-        return result[0] if result else None
-    
-    async def get_director_by_id(self, director_id):
-        result = await self.execute_query("SELECT * FROM director WHERE id = %s", (director_id,))
-        return result[0] if result else None
-    
-    async def get_play_by_id(self, play_id):
-        result = await self.execute_query("SELECT * FROM play WHERE id = %s", (play_id,))
-        return result[0] if result else None
-    
-    async def get_production_by_id(self, production_id):
-        result = await self.execute_query("SELECT * FROM production WHERE id = %s", (production_id,))
-        return result[0] if result else None
-    
-    async def get_performance_by_id(self, performance_id):
-        result = await self.execute_query("SELECT * FROM performance WHERE id = %s", (performance_id,))
-        return result[0] if result else None
+                    except aiomysql.Error as e:
+                        # Закрытое соединение пул не выдаст повторно
+                        if _is_connection_lost(e):
+                            conn.close()
+                        raise
+            except aiomysql.Error as e:
+                if not _is_connection_lost(e):
+                    # Ошибки SQL и данных при повторе не исчезнут
+                    logger.error("Ошибка выполнения запроса: %s", e)
+                    logger.error("Запрос: %.200s...", query)
+                    raise
+                if attempt == max_retries - 1:
+                    logger.error("Ошибка выполнения запроса после %s попыток: %s", max_retries, e)
+                    logger.error("Запрос: %.200s...", query)  # Логируем первые 200 символов
+                    raise
+                logger.debug("Ошибка соединения (попытка %s/%s): %s, повтор...", attempt + 1, max_retries, e)
+                await asyncio.sleep(random.uniform(0, 0.05 * (2 ** attempt)))
+            except Exception as e:
+                # Ошибки SQL и данных при повторе не исчезнут
+                logger.error("Ошибка выполнения запроса: %s", e)
+                logger.error("Запрос: %.200s...", query)
+                raise
+    
+    async def _execute_write(self, table, query, args=None):
+        """Выполняет изменяющий запрос и сбрасывает кэш, зависящий от таблицы"""
+        result = await self.execute_query(query, args, is_select=False)
+        self._invalidate(table)
+        return result
+    
+    async def _write(self, operation, table, args):
+        """Выполняет заранее собранный INSERT/UPDATE/DELETE для таблицы"""
+        return await self._execute_write(table, self.WRITE_QUERIES[(operation, table)], args)
+    
+    async def run_pipeline(self, *ops):
+        """
+        Выполняет независимые изменения параллельно, каждое на своем соединении пула.
+        ops: кортежи (операция, таблица, параметры), операция 'insert', 'update'
+        или 'delete'; параметры в порядке WRITE_COLUMNS, для update и delete
+        последним идет id. Все значения проверяются до начала выполнения.
+        Возвращает список результатов (lastrowid) в порядке ops.
+        """
+        prepared = []
+        for operation, table, args in ops:
+            if operation != 'delete':
+                args = self._prepare_values(table, args)
+            prepared.append((operation, table, args))
+        return await asyncio.gather(
+            *(self._write(operation, table, args) for operation, table, args in prepared)
+        )
     
-    async def get_rehearsal_by_id(self, rehearsal_id):
-        result = await self.execute_query("SELECT * FROM rehearsal WHERE id = %s", (rehearsal_id,))
-        return result[0] if result else None
+    async def _delete_many(self, table, ids):
+        """
+        Удаляет записи по списку id одним DELETE ... WHERE id IN (...).
+        Число параметров округляется вверх до степени двойки (повтором
+        последнего id), чтобы различных текстов запроса было немного.
+        """
+        ids = list(dict.fromkeys(ids))
+        if not ids:
+            return 0
+        size = 1 << (len(ids) - 1).bit_length()
+        ids.extend([ids[-1]] * (size - len(ids)))
+        return await self._execute_write(
+            table, f"DELETE FROM {table} WHERE id IN ({_in_placeholders(size)})", ids
+        )
     
-    async def get_role_by_id(self, role_id):
-        result = await self.execute_query("SELECT * FROM role WHERE id = %s", (role_id,))
+    async def _fetch_by_id(self, table, entity_id):
+        """Возвращает запись таблицы по id или None"""
+        result = await self.execute_query(self.BY_ID_QUERIES[table], (entity_id,), is_select=True)
         return result[0] if result else None
     
     async def get_actors_for_production(self, production_id):
@@ -468,46 +1026,111 @@ class DatabaseManager:
             ORDER BY p.production_date DESC
         """, (actor_id,))
     
+    async def get_actor_profile_bundle(self, actor_id):
+        """Роли, репетиции и постановки актера: три запроса выполняются параллельно"""
+        return await asyncio.gather(
+            self.get_actor_roles(actor_id),
+            self.get_actor_rehearsals(actor_id),
+            self.get_actor_productions(actor_id),
+        )
+    
     async def add_actor_to_production(self, actor_id, production_id):
-        return await self.execute_query("""
+        return await self._execute_write('actor_production', """
             INSERT IGNORE INTO actor_production (actor_id, production_id)
             VALUES (%s, %s)
         """, (actor_id, production_id))
     
     async def remove_actor_from_production(self, actor_id, production_id):
-        return await self.execute_query("""
+        return await self._execute_write('actor_production', """
             DELETE FROM actor_production 
             WHERE actor_id = %s AND production_id = %s
         """, (actor_id, production_id))
     
     async def add_actor_role(self, actor_id, role_id, production_id):
-        return await self.execute_query("""
+        return await self._execute_write('actor_role', """
             INSERT IGNORE INTO actor_role (actor_id, role_id, production_id)
             VALUES (%s, %s, %s)
         """, (actor_id, role_id, production_id))
     
     async def remove_actor_role(self, actor_id, role_id, production_id):
-        return await self.execute_query("""
+        return await self._execute_write('actor_role', """
             DELETE FROM actor_role 
             WHERE actor_id = %s AND role_id = %s AND production_id = %s
         """, (actor_id, role_id, production_id))
     
     async def add_actor_to_rehearsal(self, actor_id, rehearsal_id):
-        return await self.execute_query("""
+        return await self._execute_write('actor_rehearsal', """
             INSERT IGNORE INTO actor_rehearsal (actor_id, rehearsal_id)
             VALUES (%s, %s)
         """, (actor_id, rehearsal_id))
     
     async def remove_actor_from_rehearsal(self, actor_id, rehearsal_id):
-        return await self.execute_query("""
+        return await self._execute_write('actor_rehearsal', """
             DELETE FROM actor_rehearsal 
             WHERE actor_id = %s AND rehearsal_id = %s
         """, (actor_id, rehearsal_id))
     
+    async def _insert_rows(self, cur, table, columns, rows):
+        """Вставляет строки многострочными INSERT, по одному запросу на пакет"""
+        row_placeholder = f"({', '.join(['%s'] * len(columns))})"
+        insert_prefix = f"INSERT INTO {table} ({', '.join(columns)}) VALUES "
+        for start in range(0, len(rows), self.INSERT_BATCH_SIZE):
+            batch = rows[start:start + self.INSERT_BATCH_SIZE]
+            await cur.execute(
+                insert_prefix + ", ".join([row_placeholder] * len(batch)),
+                [value for row in batch for value in row]
+            )
+
+    def _prepare_values(self, table, values):
+        """
+        Проверяет значения столбцов WRITE_COLUMNS[table] (в начале values)
+        валидаторами WRITE_VALIDATORS и обрезает пробелы в обязательных
+        текстовых столбцах. Возвращает новый список значений.
+        """
+        columns = self.WRITE_COLUMNS[table]
+        values = list(values)
+        for column, validator in self.WRITE_VALIDATORS[table].items():
+            is_valid, error_msg = validator(values[columns.index(column)])
+            if not is_valid:
+                raise ValueError(error_msg)
+        for index, column in enumerate(columns):
+            if column in self._STRIPPED_COLUMNS:
+                values[index] = _fstrip(values[index])
+        return values
+
+    async def _bulk_insert(self, table, rows):
+        """
+        Добавляет строки (значения в порядке WRITE_COLUMNS[table]) многострочными
+        INSERT в одной транзакции. Все строки проверяются до обращения к БД.
+        Возвращает число добавленных строк.
+        """
+        if not self.pool:
+            raise RuntimeError("Пул соединений не инициализирован")
+        columns = self.WRITE_COLUMNS[table]
+        prepared = []
+        for row in rows:
+            if len(row) != len(columns):
+                raise ValueError(f"Строка для {table} должна содержать {len(columns)} значений")
+            prepared.append(self._prepare_values(table, row))
+        if not prepared:
+            return 0
+        async with self.pool.acquire() as conn:
+            async with conn.cursor() as cur:
+                try:
+                    await conn.begin()
+                    await self._insert_rows(cur, table, columns, prepared)
+                    await conn.commit()
+                    self._invalidate(table)
+                except Exception as e:
+                    await conn.rollback()
+                    logger.error(f"Ошибка пакетного добавления в {table}: {e}")
+                    raise e
+        return len(prepared)
+
     async def set_rehearsal_actors(self, rehearsal_id, actor_ids):
         if not self.pool:
             raise RuntimeError("Пул соединений не инициализирован")
-        async with self._lock:
+        async with self._entity_lock('rehearsal', rehearsal_id):
             async with self.pool.acquire() as conn:
                 async with conn.cursor() as cur:
                     try:
@@ -516,13 +1139,13 @@ class DatabaseManager:
                         await cur.execute("DELETE FROM actor_rehearsal WHERE rehearsal_id = %s", (rehearsal_id,))
                         # 2. Вставляем новых
                         if actor_ids:
-                            insert_query = "INSERT INTO actor_rehearsal (actor_id, rehearsal_id) VALUES (%s, %s)"
                             tuples_to_insert = [(actor_id, rehearsal_id) for actor_id in actor_ids]
-                            await cur.executemany(insert_query, tuples_to_insert)
+                            await self._insert_rows(cur, 'actor_rehearsal', ('actor_id', 'rehearsal_id'), tuples_to_insert)
                         await conn.commit()
+                        self._invalidate('actor_rehearsal')
                     except Exception as e:
                         await conn.rollback()
-                        logging.error(f"Ошибка транзакции set_rehearsal_actors: {e}")
+                        logger.error(f"Ошибка транзакции set_rehearsal_actors: {e}")
                         raise e
 
     async def set_play_authors(self, play_id, author_ids):
@@ -531,7 +1154,8 @@ class DatabaseManager:
         if not self.pool:
             raise RuntimeError("Пул соединений не инициализирован")
 
-        async with self._lock:
+        # Общая блокировка с set_author_plays: обе транзакции меняют строки author_play
+        async with self._entity_lock('author_play', None):
             async with self.pool.acquire() as conn:
                 async with conn.cursor() as cur:
                     try:
@@ -542,14 +1166,14 @@ class DatabaseManager:
 
                         # 2. Вставляем новых
                         if author_ids:
-                            insert_query = "INSERT INTO author_play (author_id, play_id) VALUES (%s, %s)"
                             tuples_to_insert = [(author_id, play_id) for author_id in author_ids]
-                            await cur.executemany(insert_query, tuples_to_insert)
+                            await self._insert_rows(cur, 'author_play', ('author_id', 'play_id'), tuples_to_insert)
 
                         await conn.commit()
+                        self._invalidate('author_play')
                     except Exception as e:
                         await conn.rollback()
-                        logging.error(f"Ошибка транзакции set_play_authors: {e}")
+                        logger.error(f"Ошибка транзакции set_play_authors: {e}")
                         raise e
     
     async def set_author_plays(self, author_id, play_ids):
@@ -557,7 +1181,8 @@ class DatabaseManager:
         if not self.pool:
             raise RuntimeError("Пул соединений не инициализирован")
 
-        async with self._lock:
+        # Общая блокировка с set_play_authors: обе транзакции меняют строки author_play
+        async with self._entity_lock('author_play', None):
             async with self.pool.acquire() as conn:
                 async with conn.cursor() as cur:
                     try:
@@ -568,21 +1193,21 @@ class DatabaseManager:
 
                         # 2. Вставляем новые
                         if play_ids:
-                            insert_query = "INSERT INTO author_play (author_id, play_id) VALUES (%s, %s)"
                             tuples_to_insert = [(author_id, play_id) for play_id in play_ids]
-                            await cur.executemany(insert_query, tuples_to_insert)
+                            await self._insert_rows(cur, 'author_play', ('author_id', 'play_id'), tuples_to_insert)
 
                         await conn.commit()
+                        self._invalidate('author_play')
                     except Exception as e:
                         await conn.rollback()
-                        logging.error(f"Ошибка транзакции set_author_plays: {e}")
+                        logger.error(f"Ошибка транзакции set_author_plays: {e}")
                         raise e
 
     async def set_production_cast(self, production_id, cast_data):
         if not self.pool:
             raise RuntimeError("Пул соединений не инициализирован")
 
-        async with self._lock:
+        async with self._entity_lock('production', production_id):
             async with self.pool.acquire() as conn:
                 async with conn.cursor() as cur:
                     try:
@@ -593,462 +1218,288 @@ class DatabaseManager:
                         
                         # 2. Вставляем новый состав
                         if cast_data:
-                            insert_query = "INSERT INTO actor_role (actor_id, role_id, production_id) VALUES (%s, %s, %s)"
                             # Преобразуем список словарей в список кортежей
                             tuples_to_insert = [
                                 (item['actor_id'], item['role_id'], production_id) 
                                 for item in cast_data
                             ]
-                            await cur.executemany(insert_query, tuples_to_insert)
+                            await self._insert_rows(
+                                cur, 'actor_role', ('actor_id', 'role_id', 'production_id'), tuples_to_insert
+                            )
                         
                         await conn.commit()
+                        self._invalidate('actor_role')
                     except Exception as e:
                         await conn.rollback()
-                        logging.error(f"Ошибка транзакции set_production_cast: {e}")
+                        logger.error(f"Ошибка транзакции set_production_cast: {e}")
                         raise e
     
+    @_validated(**WRITE_VALIDATORS['actor'])
     async def add_actor(self, full_name, experience):
-        is_valid, error_msg = validate_full_name(full_name)
-        if not is_valid:
-            raise ValueError(error_msg)
-        return await self.execute_query(
-            "INSERT INTO actor (full_name, experience) VALUES (%s, %s)",
-            (full_name.strip(), experience)
+        return await self._write('insert', 'actor',
+            (_fstrip(full_name), experience)
         )
     
+    @_validated(**WRITE_VALIDATORS['actor'])
     async def update_actor(self, actor_id, full_name, experience):
-        is_valid, error_msg = validate_full_name(full_name)
-        if not is_valid:
-            raise ValueError(error_msg)
-        return await self.execute_query(
-            "UPDATE actor SET full_name=%s, experience=%s WHERE id=%s",
-            (full_name.strip(), experience, actor_id)
+        return await self._write('update', 'actor',
+            (_fstrip(full_name), experience, actor_id)
         )
     
     async def delete_actor(self, actor_id):
-        return await self.execute_query("DELETE FROM actor WHERE id=%s", (actor_id,))
+        return await self._write('delete', 'actor', (actor_id,))
     
+    @_validated(**WRITE_VALIDATORS['author'])
     async def add_author(self, full_name, biography):
-        is_valid, error_msg = validate_full_name(full_name)
-        if not is_valid:
-            raise ValueError(error_msg)
-        return await self.execute_query(
-            "INSERT INTO author (full_name, biography) VALUES (%s, %s)",
-            (full_name.strip(), biography)
+        return await self._write('insert', 'author',
+            (_fstrip(full_name), biography)
         )
     
+    @_validated(**WRITE_VALIDATORS['author'])
     async def update_author(self, author_id, full_name, biography):
-        is_valid, error_msg = validate_full_name(full_name)
-        if not is_valid:
-            raise ValueError(error_msg)
-        return await self.execute_query(
-            "UPDATE author SET full_name=%s, biography=%s WHERE id=%s",
-            (full_name.strip(), biography, author_id)
+        return await self._write('update', 'author',
+            (_fstrip(full_name), biography, author_id)
         )
     
     async def delete_author(self, author_id):
-        return await self.execute_query("DELETE FROM author WHERE id=%s", (author_id,))
+        return await self._write('delete', 'author', (author_id,))
     
+    @_validated(**WRITE_VALIDATORS['director'])
     async def add_director(self, full_name, biography):
-        is_valid, error_msg = validate_full_name(full_name)
-        if not is_valid:
-            raise ValueError(error_msg)
-        return await self.execute_query(
-            "INSERT INTO director (full_name, biography) VALUES (%s, %s)",
-            (full_name.strip(), biography)
+        return await self._write('insert', 'director',
+            (_fstrip(full_name), biography)
         )
     
+    @_validated(**WRITE_VALIDATORS['director'])
     async def update_director(self, director_id, full_name, biography):
-        is_valid, error_msg = validate_full_name(full_name)
-        if not is_valid:
-            raise ValueError(error_msg)
-        return await self.execute_query(
-            "UPDATE director SET full_name=%s, biography=%s WHERE id=%s",
-            (full_name.strip(), biography, director_id)
+        return await self._write('update', 'director',
+            (_fstrip(full_name), biography, director_id)
         )
     
     async def delete_director(self, director_id):
-        return await self.execute_query("DELETE FROM director WHERE id=%s", (director_id,))
+        return await self._write('delete', 'director', (director_id,))
     
+    @_validated(**WRITE_VALIDATORS['play'])
     async def add_play(self, title, genre, year_written, description):
-        is_valid, error_msg = validate_title(title)
-        if not is_valid:
-            raise ValueError(error_msg)
-        is_valid, error_msg = validate_year(year_written)
-        if not is_valid:
-            raise ValueError(error_msg)
-        return await self.execute_query(
-            "INSERT INTO play (title, genre, year_written, description) VALUES (%s, %s, %s, %s)",
-            (title.strip(), genre, year_written, description)
+        return await self._write('insert', 'play',
+            (_fstrip(title), genre, year_written, description)
         )
     
+    @_validated(**WRITE_VALIDATORS['play'])
     async def update_play(self, play_id, title, genre, year_written, description):
-        is_valid, error_msg = validate_title(title)
-        if not is_valid:
-            raise ValueError(error_msg)
-        is_valid, error_msg = validate_year(year_written)
-        if not is_valid:
-            raise ValueError(error_msg)
-        return await self.execute_query(
-            "UPDATE play SET title=%s, genre=%s, year_written=%s, description=%s WHERE id=%s",
-            (title.strip(), genre, year_written, description, play_id)
+        return await self._write('update', 'play',
+            (_fstrip(title), genre, year_written, description, play_id)
         )
     
     async def delete_play(self, play_id):
-        return await self.execute_query("DELETE FROM play WHERE id=%s", (play_id,))
+        return await self._write('delete', 'play', (play_id,))
     
+    @_validated(**WRITE_VALIDATORS['production'])
     async def add_production(self, title, production_date, description, play_id, director_id):
-        is_valid, error_msg = validate_title(title)
-        if not is_valid:
-            raise ValueError(error_msg)
-        if production_date:
-            is_valid, error_msg = validate_date(production_date)
-            if not is_valid:
-                raise ValueError(error_msg)
-        return await self.execute_query(
-            "INSERT INTO production (title, production_date, description, play_id, director_id) VALUES (%s, %s, %s, %s, %s)",
-            (title.strip(), production_date, description, play_id, director_id)
+        return await self._write('insert', 'production',
+            (_fstrip(title), production_date, description, play_id, director_id)
         )
     
+    @_validated(**WRITE_VALIDATORS['production'])
     async def update_production(self, production_id, title, production_date, description, play_id, director_id):
-        is_valid, error_msg = validate_title(title)
-        if not is_valid:
-            raise ValueError(error_msg)
-        if production_date:
-            is_valid, error_msg = validate_date(production_date)
-            if not is_valid:
-                raise ValueError(error_msg)
-        return await self.execute_query(
-            "UPDATE production SET title=%s, production_date=%s, description=%s, play_id=%s, director_id=%s WHERE id=%s",
-            (title.strip(), production_date, description, play_id, director_id, production_id)
+        return await self._write('update', 'production',
+            (_fstrip(title), production_date, description, play_id, director_id, production_id)
         )
     
     async def delete_production(self, production_id):
-        return await self.execute_query("DELETE FROM production WHERE id=%s", (production_id,))
+        return await self._write('delete', 'production', (production_id,))
     
+    @_validated(**WRITE_VALIDATORS['performance'])
     async def add_performance(self, datetime, location_id, production_id):
-        is_valid, error_msg = validate_datetime(datetime)
-        if not is_valid:
-            raise ValueError(error_msg)
-        if not location_id:
-            raise ValueError("Место проведения обязательно")
-        return await self.execute_query(
-            "INSERT INTO performance (datetime, location_id, production_id) VALUES (%s, %s, %s)",
+        return await self._write('insert', 'performance',
             (datetime, location_id, production_id)
         )
     
+    @_validated(**WRITE_VALIDATORS['performance'])
     async def update_performance(self, performance_id, datetime, location_id, production_id):
-        is_valid, error_msg = validate_datetime(datetime)
-        if not is_valid:
-            raise ValueError(error_msg)
-        if not location_id:
-            raise ValueError("Место проведения обязательно")
-        return await self.execute_query(
-            "UPDATE performance SET datetime=%s, location_id=%s, production_id=%s WHERE id=%s",
+        return await self._write('update', 'performance',
             (datetime, location_id, production_id, performance_id)
         )
     
     async def delete_performance(self, performance_id):
-        return await self.execute_query("DELETE FROM performance WHERE id=%s", (performance_id,))
+        return await self._write('delete', 'performance', (performance_id,))
     
+    @_validated(**WRITE_VALIDATORS['rehearsal'])
     async def add_rehearsal(self, datetime, location_id, production_id):
-        is_valid, error_msg = validate_datetime(datetime)
-        if not is_valid:
-            raise ValueError(error_msg)
-        if not location_id:
-            raise ValueError("Место проведения обязательно")
-        return await self.execute_query(
-            "INSERT INTO rehearsal (datetime, location_id, production_id) VALUES (%s, %s, %s)",
+        return await self._write('insert', 'rehearsal',
             (datetime, location_id, production_id)
         )
     
+    @_validated(**WRITE_VALIDATORS['rehearsal'])
     async def update_rehearsal(self, rehearsal_id, datetime, location_id, production_id):
-        is_valid, error_msg = validate_datetime(datetime)
-        if not is_valid:
-            raise ValueError(error_msg)
-        if not location_id:
-            raise ValueError("Место проведения обязательно")
-        return await self.execute_query(
-            "UPDATE rehearsal SET datetime=%s, location_id=%s, production_id=%s WHERE id=%s",
+        return await self._write('update', 'rehearsal',
             (datetime, location_id, production_id, rehearsal_id)
         )
     
     async def delete_rehearsal(self, rehearsal_id):
-        return await self.execute_query("DELETE FROM rehearsal WHERE id=%s", (rehearsal_id,))
+        return await self._write('delete', 'rehearsal', (rehearsal_id,))
     
+    @_validated(**WRITE_VALIDATORS['role'])
     async def add_role(self, title, description, play_id):
-        is_valid, error_msg = validate_title(title)
-        if not is_valid:
-            raise ValueError(error_msg)
-        return await self.execute_query(
-            "INSERT INTO role (title, description, play_id) VALUES (%s, %s, %s)",
-            (title.strip(), description, play_id)
+        return await self._write('insert', 'role',
+            (_fstrip(title), description, play_id)
         )
     
+    @_validated(**WRITE_VALIDATORS['role'])
     async def update_role(self, role_id, title, description, play_id):
-        is_valid, error_msg = validate_title(title)
-        if not is_valid:
-            raise ValueError(error_msg)
-        return await self.execute_query(
-            "UPDATE role SET title=%s, description=%s, play_id=%s WHERE id=%s",
-            (title.strip(), description, play_id, role_id)
+        return await self._write('update', 'role',
+            (_fstrip(title), description, play_id, role_id)
         )
     
+    @_validated(**WRITE_VALIDATORS['theatre'])
     async def add_theatre(self, name, city=None, street=None, house_number=None, postal_code=None):
-        is_valid, error_msg = validate_title(name)
-        if not is_valid:
-            raise ValueError(error_msg)
-        return await self.execute_query(
-            "INSERT INTO theatre (name, city, street, house_number, postal_code) VALUES (%s, %s, %s, %s, %s)",
-            (name.strip(), city.strip() if city else None, street.strip() if street else None, 
-             house_number.strip() if house_number else None, postal_code.strip() if postal_code else None)
+        return await self._write('insert', 'theatre',
+            (_fstrip(name), _fstrip(city), _fstrip(street), 
+             _fstrip(house_number), _fstrip(postal_code))
         )
     
+    @_validated(**WRITE_VALIDATORS['theatre'])
     async def update_theatre(self, theatre_id, name, city=None, street=None, house_number=None, postal_code=None):
-        is_valid, error_msg = validate_title(name)
-        if not is_valid:
-            raise ValueError(error_msg)
-        return await self.execute_query(
-            "UPDATE theatre SET name=%s, city=%s, street=%s, house_number=%s, postal_code=%s WHERE id=%s",
-            (name.strip(), city.strip() if city else None, street.strip() if street else None,
-             house_number.strip() if house_number else None, postal_code.strip() if postal_code else None, theatre_id)
+        return await self._write('update', 'theatre',
+            (_fstrip(name), _fstrip(city), _fstrip(street),
+             _fstrip(house_number), _fstrip(postal_code), theatre_id)
         )
     
     async def delete_theatre(self, theatre_id):
-        return await self.execute_query("DELETE FROM theatre WHERE id=%s", (theatre_id,))
+        return await self._write('delete', 'theatre', (theatre_id,))
     
+    @_validated(**WRITE_VALIDATORS['location'])
     async def add_location(self, theatre_id, hall_name, capacity=None):
-        if not theatre_id:
-            raise ValueError("Необходимо указать театр")
-        is_valid, error_msg = validate_title(hall_name)
-        if not is_valid:
-            raise ValueError(error_msg)
-        if capacity is not None:
-            is_valid, error_msg = validate_capacity(capacity)
-            if not is_valid:
-                raise ValueError(error_msg)
-        return await self.execute_query(
-            "INSERT INTO location (theatre_id, hall_name, capacity) VALUES (%s, %s, %s)",
-            (theatre_id, hall_name.strip(), capacity)
+        return await self._write('insert', 'location',
+            (theatre_id, _fstrip(hall_name), capacity)
         )
     
+    @_validated(**WRITE_VALIDATORS['location'])
     async def update_location(self, location_id, theatre_id, hall_name, capacity=None):
-        if not theatre_id:
-            raise ValueError("Необходимо указать театр")
-        is_valid, error_msg = validate_title(hall_name)
-        if not is_valid:
-            raise ValueError(error_msg)
-        if capacity is not None:
-            is_valid, error_msg = validate_capacity(capacity)
-            if not is_valid:
-                raise ValueError(error_msg)
-        return await self.execute_query(
-            "UPDATE location SET theatre_id=%s, hall_name=%s, capacity=%s WHERE id=%s",
-            (theatre_id, hall_name.strip(), capacity, location_id)
+        return await self._write('update', 'location',
+            (theatre_id, _fstrip(hall_name), capacity, location_id)
         )
     
     async def delete_location(self, location_id):
-        return await self.execute_query("DELETE FROM location WHERE id=%s", (location_id,))
+        return await self._write('delete', 'location', (location_id,))
     
     async def delete_role(self, role_id):
-        return await self.execute_query("DELETE FROM role WHERE id=%s", (role_id,))
+        return await self._write('delete', 'role', (role_id,))
     
+    # Таблицы, от которых зависят отфильтрованные выборки репетиций
+    _REHEARSAL_FILTER_TABLES = ('rehearsal', 'production', 'director', 'location', 'theatre')
+
+    @staticmethod
+    def _rehearsal_filter_key(filters):
+        """Нормализованные фильтры (период, режиссер, театр); 'все' и пустые значения -> None"""
+        if not filters:
+            return (None, None, None)
+
+        def normalize(value):
+            value = value.strip() if isinstance(value, str) else value
+            return None if not value or value == 'все' else value
+
+        return (
+            filters.get('period', 'весь'),
+            normalize(filters.get('director')),
+            normalize(filters.get('theatre')),
+        )
+
+    @_safe_query(_empty_label_counts, "Ошибка получения репетиций по месяцам")
     async def get_rehearsals_by_month(self, filters=None):
-        try:
-            # Базовый запрос
-            where_conditions = []
-            joins = []
-            params = []
-            
-            if filters:
-                # Фильтр по периоду
-                period = filters.get('period', 'весь')
-                if period == 'неделя':
-                    where_conditions.append("r.datetime >= DATE_SUB(NOW(), INTERVAL 1 WEEK)")
-                elif period == 'месяц':
-                    where_conditions.append("r.datetime >= DATE_SUB(NOW(), INTERVAL 1 MONTH)")
-                elif period == 'квартал':
-                    where_conditions.append("r.datetime >= DATE_SUB(NOW(), INTERVAL 3 MONTH)")
-                elif period == 'год':
-                    where_conditions.append("r.datetime >= DATE_SUB(NOW(), INTERVAL 1 YEAR)")
-                # 'весь' - без ограничения по дате
-                
-                # Фильтр по режиссеру
-                if filters.get('director') and filters['director'] != 'все':
-                    joins.append("JOIN production pr ON r.production_id = pr.id")
-                    joins.append("JOIN director d ON pr.director_id = d.id")
-                    where_conditions.append("d.full_name = %s")
-                    params.append(filters['director'])
-                
-                # Фильтр по театру
-                if filters.get('theatre') and filters['theatre'] != 'все':
-                    if "JOIN location loc" not in " ".join(joins):
-                        joins.append("JOIN location loc ON r.location_id = loc.id")
-                    if "JOIN theatre t" not in " ".join(joins):
-                        joins.append("JOIN theatre t ON loc.theatre_id = t.id")
-                    where_conditions.append("t.name = %s")
-                    params.append(filters['theatre'])
-            
-            # Если нет условий по дате, ограничиваем последним годом для производительности
-            if not any('datetime' in cond for cond in where_conditions):
-                where_conditions.append("r.datetime >= DATE_SUB(NOW(), INTERVAL 1 YEAR)")
-            
-            join_clause = " ".join(joins) if joins else ""
-            where_clause = " AND ".join(where_conditions) if where_conditions else "1=1"
-            
-            query = f"""
-                SELECT DATE_FORMAT(r.datetime, '%%Y-%%m') as month, COUNT(*) as count 
-                FROM rehearsal r
-                {join_clause}
-                WHERE {where_clause}
-                GROUP BY month 
-                ORDER BY month
-            """
-            
-            result = await self.execute_query(query, tuple(params) if params else None)
-            return result if result else []
-        except Exception as e:
-            logging.error(f"Ошибка получения репетиций по месяцам: {e}")
-            return []
+        filter_key = self._rehearsal_filter_key(filters)
+        return await self._cached(
+            ('rehearsals_by_month',) + filter_key,
+            self._REHEARSAL_FILTER_TABLES,
+            self.CACHE_TTL['rehearsals'],
+            lambda: self._load_rehearsals_by_month(*filter_key),
+        )
+
+    @staticmethod
+    def _rehearsal_filter_params(director, theatre):
+        """Параметры фильтров в порядке плейсхолдеров; пустой кортеж передается как есть"""
+        if director:
+            return (director, theatre) if theatre else (director,)
+        return (theatre,) if theatre else ()
+
+    @staticmethod
+    def _label_counts(rows):
+        """Строки (метка, количество) -> {'labels': [...], 'counts': [...]}"""
+        labels, counts = zip(*rows) if rows else ((), ())
+        return {'labels': list(labels), 'counts': list(counts)}
+
+    async def _load_rehearsals_by_month(self, period, director, theatre):
+        query = _rehearsals_by_month_sql(period, bool(director), bool(theatre))
+        result = await self.execute_query(
+            query, self._rehearsal_filter_params(director, theatre), is_select=True, as_dict=False
+        )
+        return self._label_counts(result)
     
+    @_safe_query(_empty_label_counts, "Ошибка получения пьес по жанрам")
     async def get_plays_by_genre(self):
-        try:
-            result = await self.execute_query("""
-                SELECT genre, COUNT(*) as count 
-                FROM play 
-                WHERE genre IS NOT NULL AND genre != ''
-                GROUP BY genre
-                ORDER BY count DESC
-            """)
-            return result if result else []
-        except Exception as e:
-            logging.error(f"Ошибка получения пьес по жанрам: {e}")
-            return []
-    
+        result = await self.execute_query("""
+            SELECT genre, COUNT(*) as count 
+            FROM play 
+            WHERE genre IS NOT NULL AND genre != ''
+            GROUP BY genre
+            ORDER BY count DESC
+        """, is_select=True, as_dict=False)
+        return self._label_counts(result)
+    
+    @_safe_query(list, "Ошибка получения предстоящих репетиций")
     async def get_upcoming_rehearsals(self, limit=10, filters=None):
-        try:
-            where_conditions = []
-            params = []
-            
-            if filters:
-                # Фильтр по периоду
-                period = filters.get('period', 'весь')
-                if period == 'неделя':
-                    where_conditions.append("r.datetime >= DATE_SUB(NOW(), INTERVAL 1 WEEK)")
-                elif period == 'месяц':
-                    where_conditions.append("r.datetime >= DATE_SUB(NOW(), INTERVAL 1 MONTH)")
-                elif period == 'квартал':
-                    where_conditions.append("r.datetime >= DATE_SUB(NOW(), INTERVAL 3 MONTH)")
-                elif period == 'год':
-                    where_conditions.append("r.datetime >= DATE_SUB(NOW(), INTERVAL 1 YEAR)")
-                # 'весь' - без ограничения по дате, но показываем только будущие
-                if period == 'весь':
-                    where_conditions.append("r.datetime >= NOW()")
-                else:
-                    where_conditions.append("r.datetime >= NOW()")
-                
-                # Фильтр по режиссеру
-                if filters.get('director') and filters['director'] != 'все':
-                    where_conditions.append("d.full_name = %s")
-                    params.append(filters['director'])
-                
-                # Фильтр по театру
-                if filters.get('theatre') and filters['theatre'] != 'все':
-                    where_conditions.append("t.name = %s")
-                    params.append(filters['theatre'])
-            else:
-                # По умолчанию показываем только будущие репетиции
-                where_conditions.append("r.datetime >= NOW()")
-            
-            where_clause = " AND ".join(where_conditions) if where_conditions else "r.datetime >= NOW()"
-            
-            query = f"""
-                SELECT r.*, pr.title as production_title, d.full_name as director_name, 
-                       pl.title as play_title, pl.genre, t.name as theatre_name, l.hall_name as location_name
-                FROM rehearsal r
-                JOIN production pr ON r.production_id = pr.id
-                JOIN play pl ON pr.play_id = pl.id
-                JOIN director d ON pr.director_id = d.id
-                JOIN location l ON r.location_id = l.id
-                JOIN theatre t ON l.theatre_id = t.id
-                WHERE {where_clause}
-                ORDER BY r.datetime ASC
-                LIMIT {limit}
-            """
-            
-            result = await self.execute_query(query, tuple(params) if params else None)
-            return result if result else []
-        except Exception as e:
-            logging.error(f"Ошибка получения предстоящих репетиций: {e}")
-            return []
+        period, director, theatre = self._rehearsal_filter_key(filters)
+        query = _upcoming_rehearsals_sql(period, bool(director), bool(theatre))
+        params = self._rehearsal_filter_params(director, theatre) + (int(limit),)
+        result = await self.execute_query(query, params, is_select=True)
+        return result if result else []
     
+    @_safe_query(int, "Ошибка получения количества репетиций")
     async def get_filtered_rehearsals_count(self, filters=None):
-        try:
-            where_conditions = []
-            joins = []
-            params = []
-            
-            if filters:
-                period = filters.get('period', 'весь')
-                if period == 'неделя':
-                    where_conditions.append("r.datetime >= DATE_SUB(NOW(), INTERVAL 1 WEEK)")
-                elif period == 'месяц':
-                    where_conditions.append("r.datetime >= DATE_SUB(NOW(), INTERVAL 1 MONTH)")
-                elif period == 'квартал':
-                    where_conditions.append("r.datetime >= DATE_SUB(NOW(), INTERVAL 3 MONTH)")
-                elif period == 'год':
-                    where_conditions.append("r.datetime >= DATE_SUB(NOW(), INTERVAL 1 YEAR)")
-                # 'весь' - без ограничения по дате
-                
-                if filters.get('director') and filters['director'] != 'все':
-                    joins.append("JOIN production pr ON r.production_id = pr.id")
-                    joins.append("JOIN director d ON pr.director_id = d.id")
-                    where_conditions.append("d.full_name = %s")
-                    params.append(filters['director'])
-                
-                if filters.get('theatre') and filters['theatre'] != 'все':
-                    if "JOIN location loc" not in " ".join(joins):
-                        joins.append("JOIN location loc ON r.location_id = loc.id")
-                    if "JOIN theatre t" not in " ".join(joins):
-                        joins.append("JOIN theatre t ON loc.theatre_id = t.id")
-                    where_conditions.append("t.name = %s")
-                    params.append(filters['theatre'])
-            
-            join_clause = " ".join(joins) if joins else ""
-            where_clause = " AND ".join(where_conditions) if where_conditions else "1=1"
-            
-            query = f"""
-                SELECT COUNT(*) as count 
-                FROM rehearsal r
-                {join_clause}
-                WHERE {where_clause}
-            """
-            
-            result = await self.execute_query(query, tuple(params) if params else None)
-            return result[0]['count'] if result and len(result) > 0 else 0
-        except Exception as e:
-            logging.error(f"Ошибка получения количества репетиций: {e}")
-            return 0
+        filter_key = self._rehearsal_filter_key(filters)
+        return await self._cached(
+            ('rehearsals_count',) + filter_key,
+            self._REHEARSAL_FILTER_TABLES,
+            self.CACHE_TTL['rehearsals'],
+            lambda: self._load_filtered_rehearsals_count(*filter_key),
+        )
+
+    async def _load_filtered_rehearsals_count(self, period, director, theatre):
+        query = _rehearsals_count_sql(period, bool(director), bool(theatre))
+        result = await self.execute_query(
+            query, self._rehearsal_filter_params(director, theatre), is_select=True
+        )
+        return result[0]['count'] if result and len(result) > 0 else 0
     
+    async def get_rehearsal_dashboard(self, filters=None, limit=10):
+        """
+        Данные панели репетиций с одними фильтрами: три запроса выполняются
+        параллельно на разных соединениях пула.
+        Возвращает {'by_month': ..., 'upcoming': [...], 'count': int}.
+        """
+        by_month, upcoming, count = await asyncio.gather(
+            self.get_rehearsals_by_month(filters),
+            self.get_upcoming_rehearsals(limit, filters),
+            self.get_filtered_rehearsals_count(filters),
+        )
+        return {'by_month': by_month, 'upcoming': upcoming, 'count': count}
+    
+    @_safe_query(int, "Ошибка получения количества актеров")
     async def get_actors_count_by_production(self, production_id):
-        try:
-            result = await self.execute_query("""
-                SELECT COUNT(*) as count 
-                FROM actor_production 
-                WHERE production_id = %s
-            """, (production_id,))
-            return result[0]['count'] if result and len(result) > 0 else 0
-        except Exception as e:
-            logging.error(f"Ошибка получения количества актеров: {e}")
-            return 0
+        result = await self.execute_query("""
+            SELECT COUNT(*) as count 
+            FROM actor_production 
+            WHERE production_id = %s
+        """, (production_id,))
+        return result[0]['count'] if result and len(result) > 0 else 0
     
+    @_safe_query(int, "Ошибка получения количества ролей")
     async def get_total_roles(self):
-        try:
-            result = await self.execute_query("SELECT COUNT(*) as count FROM role")
+        async def load():
+            result = await self.execute_query("SELECT COUNT(*) as count FROM role", is_select=True)
             return result[0]['count'] if result and len(result) > 0 else 0
-        except Exception as e:
-            logging.error(f"Ошибка получения количества ролей: {e}")
-            return 0
+
+        return await self._cached(('total_roles',), ('role',), self.TOTAL_ROLES_CACHE_TTL, load)
     
     async def get_unique_genres(self):
         return await self._get_unique_values('play', 'genre')
@@ -1076,64 +1527,4 @@ class DatabaseManager:
     
     async def get_unique_role_titles(self):
         return await self._get_unique_values('role', 'title')
-    
-    async def get_all_actors_sorted(self, sort_column='id', sort_ascending=True, force_refresh=False):
-        return await self._select_all('actors', sort_column, sort_ascending, force_refresh)
-    
-    async def get_all_authors_sorted(self, sort_column='id', sort_ascending=True, force_refresh=False):
-        return await self._select_all('authors', sort_column, sort_ascending, force_refresh)
-    
-    async def get_all_directors_sorted(self, sort_column='id', sort_ascending=True, force_refresh=False):
-        return await self._select_all('directors', sort_column, sort_ascending, force_refresh)
-    
-    async def get_all_plays_sorted(self, sort_column='id', sort_ascending=True, force_refresh=False):
-        return await self._select_all('plays', sort_column, sort_ascending, force_refresh)
-    
-    async def get_all_productions_sorted(self, sort_column='id', sort_ascending=True, force_refresh=False):
-        return await self._select_all('productions', sort_column, sort_ascending, force_refresh)
-    
-    async def get_all_performances_sorted(self, sort_column='id', sort_ascending=True, force_refresh=False):
-        return await self._select_all('performances', sort_column, sort_ascending, force_refresh)
-    
-    async def get_all_rehearsals_sorted(self, sort_column='id', sort_ascending=True, force_refresh=False):
-        return await self._select_all('rehearsals', sort_column, sort_ascending, force_refresh)
-    
-    async def get_all_roles_sorted(self, sort_column='id', sort_ascending=True, force_refresh=False):
-        return await self._select_all('roles', sort_column, sort_ascending, force_refresh)
-    
-    async def get_all_theatres_sorted(self, sort_column='name', sort_ascending=True, force_refresh=False):
-        return await self._select_all('theatres', sort_column, sort_ascending, force_refresh)
-    
-    async def get_all_locations_sorted(self, sort_column='hall_name', sort_ascending=True, force_refresh=False):
-        return await self._select_all('locations', sort_column, sort_ascending, force_refresh)
-    
-    async def search_actors_sorted(self, search_text, sort_column='id', sort_ascending=True):
-        return await self._search_records('actors', search_text, sort_column, sort_ascending)
-    
-    async def search_authors_sorted(self, search_text, sort_column='id', sort_ascending=True):
-        return await self._search_records('authors', search_text, sort_column, sort_ascending)
-    
-    async def search_directors_sorted(self, search_text, sort_column='id', sort_ascending=True):
-        return await self._search_records('directors', search_text, sort_column, sort_ascending)
-    
-    async def search_plays_sorted(self, search_text, sort_column='id', sort_ascending=True):
-        return await self._search_records('plays', search_text, sort_column, sort_ascending)
-    
-    async def search_productions_sorted(self, search_text, sort_column='id', sort_ascending=True):
-        return await self._search_records('productions', search_text, sort_column, sort_ascending)
-    
-    async def search_performances_sorted(self, search_text, sort_column='id', sort_ascending=True):
-        return await self._search_records('performances', search_text, sort_column, sort_ascending)
-    
-    async def search_rehearsals_sorted(self, search_text, sort_column='id', sort_ascending=True):
-        return await self._search_records('rehearsals', search_text, sort_column, sort_ascending)
-    
-    async def search_roles_sorted(self, search_text, sort_column='id', sort_ascending=True):
-        return await self._search_records('roles', search_text, sort_column, sort_ascending)
-    
-    async def search_theatres_sorted(self, search_text, sort_column='name', sort_ascending=True):
-        return await self._search_records('theatres', search_text, sort_column, sort_ascending)
-    
-    async def search_locations_sorted(self, search_text, sort_column='hall_name', sort_ascending=True):
-        return await self._search_records('locations', search_text, sort_column, sort_ascending)
 
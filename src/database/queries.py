@@ -4,12 +4,30 @@ SQL запросы для работы с базой данных.
 """
 from typing import Dict, Any, Optional, List
 
+# Таблицы, для которых подготавливаются запросы подсчета записей
+_TABLES = (
+    'actor', 'author', 'director', 'play', 'production',
+    'performance', 'rehearsal', 'role', 'theatre', 'location',
+)
+
 
 class Queries:
     """Класс с часто используемыми SQL запросами"""
     
     # Запросы для получения статистики
     GET_TOTAL_COUNT = "SELECT COUNT(*) as total FROM {table}"
+    GET_NEW_RECORDS_LAST_MONTH = (
+        "SELECT COUNT(*) as count FROM {table} "
+        "WHERE created_at >= DATE_SUB(NOW(), INTERVAL 1 MONTH)"
+    )
+    
+    # Подсчет записей по имени таблицы: тексты подставляются один раз при импорте
+    COUNT_BY_TABLE = {}
+    NEW_RECORDS_LAST_MONTH_BY_TABLE = {}
+    for _table in _TABLES:
+        COUNT_BY_TABLE[_table] = GET_TOTAL_COUNT.format(table=_table)
+        NEW_RECORDS_LAST_MONTH_BY_TABLE[_table] = GET_NEW_RECORDS_LAST_MONTH.format(table=_table)
+    del _table
     
     GET_ACTORS_WITH_STATS = """
         SELECT 
@@ -117,16 +135,21 @@ class Queries:
         LIMIT %s
     """
     
+    # Топ актеров для типичных размеров: LIMIT подставлен в текст при импорте
+    TOP_ACTORS_BY_REHEARSALS = {}
+    for _limit in (5, 10, 20, 50, 100):
+        TOP_ACTORS_BY_REHEARSALS[_limit] = GET_TOP_ACTORS_BY_REHEARSALS.replace("LIMIT %s", f"LIMIT {_limit}")
+    del _limit
+    
     @staticmethod
-    def format_query(query: str, **kwargs) -> str:
+    def top_actors_by_rehearsals(limit: int):
         """
-        Форматирует SQL запрос с подстановкой параметров.
-        
-        Args:
-            query: SQL запрос с плейсхолдерами {param}
-            **kwargs: Параметры для подстановки
+        Запрос топа актеров по количеству репетиций.
         
         Returns:
-            Отформатированный запрос
+            (запрос, параметры): готовый текст для типичных limit, иначе LIMIT %s
         """
-        return query.format(**kwargs)
+        query = Queries.TOP_ACTORS_BY_REHEARSALS.get(limit)
+        if query:
+            return query, ()
+        return Queries.GET_TOP_ACTORS_BY_REHEARSALS, (int(limit),)
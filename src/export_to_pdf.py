@@ -15,168 +15,655 @@
   - reportlab.lib.units: единицы измерения (inch)
   - reportlab.pdfbase: базовая функциональность PDF
   - reportlab.pdfbase.ttfonts: работа с TTF шрифтами для поддержки кириллицы
-- matplotlib: создание графиков и диаграмм для вставки в PDF
-  - matplotlib.use('Agg'): использование неинтерактивного бэкенда (без GUI)
-  - matplotlib.pyplot: создание графиков (pie charts, bar charts)
-- io: работа с байтовыми потоками для сохранения графиков в память перед вставкой в PDF
+  - reportlab.graphics: векторные диаграммы (Pie, VerticalBarChart) прямо в PDF
+- rl_accel (необязательно): C-ускоритель reportlab для разметки абзацев
 """
 import os
 import asyncio
+import functools
+import importlib.util
 import logging
+import re
+import time
 from datetime import datetime, timedelta
+from types import SimpleNamespace
 from reportlab.lib.pagesizes import A4
 from reportlab.pdfgen import canvas
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, Image
+from reportlab.platypus import SimpleDocTemplate, Table, LongTable, TableStyle, Paragraph, Spacer, PageBreak, Flowable
+from reportlab.platypus.paragraph import cleanBlockQuotedText, textTransformFrags
+from reportlab.platypus.paraparser import ParaParser
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib import colors
 from reportlab.lib.units import inch
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
-import matplotlib.pyplot as plt
-import matplotlib
-matplotlib.use('Agg')  # Неинтерактивный бэкенд для генерации графиков без GUI
-import io
+from reportlab.graphics.shapes import Drawing, Group, String
+from reportlab.graphics.charts.piecharts import Pie
+from reportlab.graphics.charts.barcharts import VerticalBarChart
+
+# C-ускоритель reportlab (пакет rl_accel): ширина строк и перенос абзацев
+# считаются на C; без него - чистый Python в reportlab.lib.rl_accel.
+# reportlab подключает его сам, здесь только проверяется наличие
+RL_ACCEL_AVAILABLE = importlib.util.find_spec('_rl_accel') is not None
 
 # Универсальный импорт - работает и как модуль, и при прямом запуске
 try:
-    # Пытаемся импортировать как модуль (относительный импорт)
-    from config.database import DB_CONFIG
     from src.database.connection import DatabaseManager
+    from src.database.queries import Queries
 except ImportError:
-    # Если не работает, пытаемся абсолютный импорт
-    try:
-        from config.database import DB_CONFIG
-        from src.database.connection import DatabaseManager
-    except ImportError:
-        # Если и это не работает, добавляем родительскую директорию в путь
-        import sys
-        import os
-        sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        from config.database import DB_CONFIG
-        from src.database.connection import DatabaseManager
+    # При прямом запуске добавляем корень проекта в путь и повторяем импорт
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from src.database.connection import DatabaseManager
+    from src.database.queries import Queries
 
 db_manager = None
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# Итоговые показатели статистического отчета: ключ metrics_data -> подзапрос
+_TOTALS_SUBQUERIES = {
+    'total_actors': "SELECT COUNT(*) FROM actor",
+    'total_productions': "SELECT COUNT(*) FROM production",
+    'total_rehearsals': "SELECT COUNT(*) FROM rehearsal",
+    'total_roles': "SELECT COUNT(*) FROM role",
+    'total_plays': "SELECT COUNT(*) FROM play",
+    'total_performances': "SELECT COUNT(*) FROM performance",
+    'new_actors_month': "SELECT COUNT(*) FROM actor WHERE created_at >= DATE_SUB(NOW(), INTERVAL 1 MONTH)",
+    'new_productions_month': "SELECT COUNT(*) FROM production WHERE created_at >= DATE_SUB(NOW(), INTERVAL 1 MONTH)",
+}
+# Все показатели одной строкой за один запрос,
+# включая новые записи за месяц (отдельные запросы или UNION ALL не нужны)
+_TOTALS_QUERY = "SELECT " + ", ".join(
+    f"({subquery}) AS {key}" for key, subquery in _TOTALS_SUBQUERIES.items()
+)
 
-class PDFReporter:
-    """Базовый класс для генерации PDF отчетов"""
+# Постоянные запросы статистического отчета: тексты создаются один раз при импорте
+_PRODUCTIONS_BY_THEATRE_QUERY = """
+    SELECT 
+        t.id,
+        t.name as theatre_name,
+        COUNT(DISTINCT p.id) as production_count
+    FROM production p
+    JOIN performance perf ON p.id = perf.production_id
+    JOIN location l ON perf.location_id = l.id
+    JOIN theatre t ON l.theatre_id = t.id
+    GROUP BY t.id, t.name
+    ORDER BY production_count DESC
+    LIMIT 20
+"""
+
+_PRODUCTIONS_BY_DIRECTOR_QUERY = """
+    SELECT 
+        d.id,
+        d.full_name as director_name,
+        COUNT(p.id) as production_count
+    FROM production p
+    JOIN director d ON p.director_id = d.id
+    GROUP BY d.id, d.full_name
+    ORDER BY production_count DESC
+    LIMIT 10
+"""
+
+_DAILY_ACTIVITY_QUERY = """
+    SELECT 
+        DATE(datetime) as activity_date,
+        COUNT(*) as count
+    FROM rehearsal 
+    WHERE datetime >= DATE_SUB(NOW(), INTERVAL 30 DAY)
+    GROUP BY DATE(datetime)
+    ORDER BY activity_date DESC
+"""
+
+# Месяц группируется числом ГГГГММ, строка 'ГГГГ-ММ' собирается в Python
+_REHEARSALS_BY_MONTH_QUERY = """
+    SELECT 
+        YEAR(datetime) * 100 + MONTH(datetime) as month_key,
+        COUNT(*) as count
+    FROM rehearsal 
+    WHERE datetime >= DATE_SUB(NOW(), INTERVAL 6 MONTH)
+    GROUP BY month_key
+    ORDER BY month_key DESC
+"""
+
+_PLAYS_BY_GENRE_QUERY = """
+    SELECT 
+        genre,
+        COUNT(*) as count
+    FROM play 
+    GROUP BY genre
+    ORDER BY count DESC
+"""
+
+# Запросы детального отчета
+_DETAILED_ACTORS_QUERY = """
+    SELECT 
+        a.id,
+        a.full_name,
+        a.experience,
+        COUNT(DISTINCT ar.rehearsal_id) as rehearsal_count,
+        COUNT(DISTINCT ap.production_id) as production_count
+    FROM actor a
+    LEFT JOIN actor_rehearsal ar ON a.id = ar.actor_id
+    LEFT JOIN actor_production ap ON a.id = ap.actor_id
+    GROUP BY a.id, a.full_name, a.experience
+    ORDER BY a.id
+"""
+
+_DETAILED_PRODUCTIONS_QUERY = """
+    SELECT p.id, p.title, p.production_date, 
+        pl.id as play_id, pl.title as play_title, pl.genre,
+        d.id as director_id, d.full_name as director_name
+    FROM production p
+    JOIN play pl ON p.play_id = pl.id
+    JOIN director d ON p.director_id = d.id
+    ORDER BY p.production_date DESC
+"""
+
+_DETAILED_REHEARSALS_QUERY = """
+    SELECT r.id, r.datetime,
+        t.id as theatre_id, t.name as theatre_name, 
+        l.id as location_id, l.hall_name,
+        pr.id as production_id, pr.title as production_title
+    FROM rehearsal r
+    JOIN location l ON r.location_id = l.id
+    JOIN theatre t ON l.theatre_id = t.id
+    JOIN production pr ON r.production_id = pr.id
+    ORDER BY r.datetime DESC
+"""
+
+_DETAILED_PERFORMANCES_QUERY = """
+    SELECT p.id, p.datetime,
+        t.id as theatre_id, t.name as theatre_name, 
+        l.id as location_id, l.hall_name,
+        pr.id as production_id, pr.title as production_title
+    FROM performance p
+    JOIN location l ON p.location_id = l.id
+    JOIN theatre t ON l.theatre_id = t.id
+    JOIN production pr ON p.production_id = pr.id
+    ORDER BY p.datetime DESC
+"""
+
+# Кандидаты TTF шрифта с кириллицей, в порядке предпочтения
+_FONT_PATHS = (
+    'C:/Windows/Fonts/arial.ttf',
+    'C:/Windows/Fonts/times.ttf',
+    '/usr/share/fonts/truetype/freefont/FreeSans.ttf',
+    '/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf',
+    '/Library/Fonts/Arial.ttf',
+    '/System/Library/Fonts/Arial.ttf',
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _register_cyrillic_font():
+    """
+    Поиск и регистрация кириллического шрифта один раз за процесс.
+    Возвращает имя шрифта для стилей ('CyrillicFont' или 'Helvetica').
+    """
+    try:
+        if 'CyrillicFont' in pdfmetrics.getRegisteredFontNames():
+            return 'CyrillicFont'
+        
+        cyrillic_font_path = next((path for path in _FONT_PATHS if os.path.exists(path)), None)
+        if cyrillic_font_path:
+            pdfmetrics.registerFont(TTFont('CyrillicFont', cyrillic_font_path))
+            pdfmetrics.registerFont(TTFont('CyrillicFont-Bold', cyrillic_font_path))
+            logging.info(f"Используется кириллический шрифт: {cyrillic_font_path}")
+            return 'CyrillicFont'
+        else:
+            logging.warning("Кириллические шрифты не найдены, используем Helvetica")
+            return 'Helvetica'
+            
+    except Exception as e:
+        logging.error(f"Ошибка настройки шрифтов: {e}")
+        return 'Helvetica'
+
+
+# Размер диаграмм отчета в пунктах (5 x 3 дюйма)
+_CHART_WIDTH = 5*inch
+_CHART_HEIGHT = 3*inch
+_CHART_COLORS = (
+    colors.HexColor('#4A90A4'), colors.HexColor('#6B8E7A'), colors.HexColor('#A67C7C'),
+    colors.HexColor('#B8865B'), colors.HexColor('#9370DB'), colors.HexColor('#5B7DB8'),
+    colors.HexColor('#C9A94D'), colors.HexColor('#7A9E9F'),
+)
+
+
+def _chart_title(drawing, text, font):
+    """Заголовок диаграммы по центру верхнего края рисунка"""
+    drawing.add(String(drawing.width / 2, drawing.height - 14, text,
+                       fontName=font, fontSize=11, textAnchor='middle'))
+
+
+def _make_pie(genres, counts, font):
+    """
+    Круговая диаграмма распределения пьес по жанрам (векторный рисунок reportlab).
+    Рисунок новый на каждый отчет: Drawing - Flowable, и reportlab ставит ему canv
+    на время отрисовки, так что общий объект нельзя рисовать из разных потоков.
+    """
+    drawing = Drawing(_CHART_WIDTH, _CHART_HEIGHT)
+    _chart_title(drawing, 'Распределение пьес по жанрам', font)
     
-    def __init__(self):
-        self.cyrillic_font = self.setup_fonts()
-        self.styles = getSampleStyleSheet()
-        self.setup_styles()
+    total = sum(counts) or 1
+    pie = Pie()
+    pie.width = pie.height = _CHART_HEIGHT - 60
+    pie.x = (_CHART_WIDTH - pie.width) / 2
+    pie.y = 20
+    pie.data = list(counts)
+    pie.labels = [f"{genre} ({count * 100 / total:.1f}%)" for genre, count in zip(genres, counts)]
+    pie.startAngle = 90
+    pie.sideLabels = True
+    pie.slices.fontName = font
+    pie.slices.fontSize = 7
+    pie.slices.strokeColor = colors.white
+    for i in range(len(counts)):
+        pie.slices[i].fillColor = _CHART_COLORS[i % len(_CHART_COLORS)]
+    drawing.add(pie)
+    return drawing
+
+
+def _make_bar(months, counts, font):
+    """Столбчатая диаграмма репетиций по месяцам (векторный рисунок reportlab), новая на каждый отчет"""
+    drawing = Drawing(_CHART_WIDTH, _CHART_HEIGHT)
+    _chart_title(drawing, 'Репетиции по месяцам', font)
+    # Подпись оси Y повернута на 90 градусов
+    drawing.add(Group(
+        String(0, 0, 'Количество репетиций', fontName=font, fontSize=8, textAnchor='middle'),
+        transform=(0, 1, -1, 0, 12, _CHART_HEIGHT / 2)
+    ))
     
-    def setup_fonts(self):
-        """Регистрация кириллических шрифтов"""
-        try:
-            font_paths = [
-                'C:/Windows/Fonts/arial.ttf',
-                'C:/Windows/Fonts/times.ttf',
-                '/usr/share/fonts/truetype/freefont/FreeSans.ttf',
-                '/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf',
-                '/Library/Fonts/Arial.ttf',
-                '/System/Library/Fonts/Arial.ttf',
-            ]
-            
-            cyrillic_font_path = None
-            for font_path in font_paths:
-                if os.path.exists(font_path):
-                    cyrillic_font_path = font_path
-                    break
-            
-            if cyrillic_font_path:
-                pdfmetrics.registerFont(TTFont('CyrillicFont', cyrillic_font_path))
-                pdfmetrics.registerFont(TTFont('CyrillicFont-Bold', cyrillic_font_path))
-                logging.info(f"Используется кириллический шрифт: {cyrillic_font_path}")
-                return 'CyrillicFont'
-            else:
-                logging.warning("Кириллические шрифты не найдены, используем Helvetica")
-                return 'Helvetica'
-                
-        except Exception as e:
-            logging.error(f"Ошибка настройки шрифтов: {e}")
-            return 'Helvetica'
-        
-    def setup_styles(self):
-        """Настройка стилей для PDF с кириллическими шрифтами"""
-        self.title_style = ParagraphStyle(
+    chart = VerticalBarChart()
+    chart.x = 50
+    chart.y = 45
+    chart.width = _CHART_WIDTH - 70
+    chart.height = _CHART_HEIGHT - 80
+    chart.data = [list(counts)]
+    chart.bars[0].fillColor = colors.skyblue
+    chart.bars[0].strokeColor = None
+    chart.valueAxis.valueMin = 0
+    chart.valueAxis.valueStep = max(1, (max(counts) + 4) // 5)  # Только целые деления
+    chart.valueAxis.labels.fontName = font
+    chart.valueAxis.labels.fontSize = 7
+    chart.categoryAxis.categoryNames = list(months)
+    chart.categoryAxis.labels.fontName = font
+    chart.categoryAxis.labels.fontSize = 7
+    chart.categoryAxis.labels.angle = 45
+    chart.categoryAxis.labels.boxAnchor = 'ne'
+    drawing.add(chart)
+    return drawing
+
+
+@functools.lru_cache(maxsize=None)
+def _report_styles(font):
+    """Стили абзацев PDF для шрифта font: создаются один раз и общие для всех отчетов"""
+    sample = getSampleStyleSheet()
+    return SimpleNamespace(
+        sample=sample,
+        title=ParagraphStyle(
             'CustomTitle',
-            parent=self.styles['Heading1'],
-            fontName=f'{self.cyrillic_font}-Bold',
+            parent=sample['Heading1'],
+            fontName=f'{font}-Bold',
             fontSize=18,
             spaceAfter=30,
             alignment=1,
             textColor=colors.darkblue
-        )
-        
-        self.heading_style = ParagraphStyle(
+        ),
+        heading=ParagraphStyle(
             'CustomHeading',
-            parent=self.styles['Heading2'],
-            fontName=f'{self.cyrillic_font}-Bold',
+            parent=sample['Heading2'],
+            fontName=f'{font}-Bold',
             fontSize=14,
             spaceAfter=12,
             textColor=colors.darkblue
-        )
-        
-        self.normal_style = ParagraphStyle(
+        ),
+        normal=ParagraphStyle(
             'CustomNormal',
-            parent=self.styles['Normal'],
-            fontName=self.cyrillic_font,
+            parent=sample['Normal'],
+            fontName=font,
             fontSize=10,
             spaceAfter=6,
             leading=12,
             textColor=colors.black,
             alignment=0
-        )
-        
-        self.table_header_style = ParagraphStyle(
+        ),
+        table_header=ParagraphStyle(
             'TableHeader',
-            parent=self.styles['Normal'],
-            fontName=f'{self.cyrillic_font}-Bold',
+            parent=sample['Normal'],
+            fontName=f'{font}-Bold',
             fontSize=9,
             spaceAfter=3,
             leading=11,
             alignment=1,  # Центрирование
             textColor=colors.white
-        )
-        
-        self.table_cell_style = ParagraphStyle(
+        ),
+        table_cell=ParagraphStyle(
             'TableCell',
-            parent=self.styles['Normal'],
-            fontName=self.cyrillic_font,
+            parent=sample['Normal'],
+            fontName=font,
             fontSize=8,
             spaceAfter=3,
             leading=10,
             alignment=0,  # Выравнивание по левому краю
             wordWrap='CJK'  # Перенос слов
-        )
-        
-        self.table_cell_center_style = ParagraphStyle(
+        ),
+        table_cell_center=ParagraphStyle(
             'TableCellCenter',
-            parent=self.styles['Normal'],
-            fontName=self.cyrillic_font,
+            parent=sample['Normal'],
+            fontName=font,
             fontSize=8,
             spaceAfter=3,
             leading=10,
             alignment=1,  # Центрирование
             wordWrap='CJK'
-        )
-        
-        self.table_cell_small_style = ParagraphStyle(
+        ),
+        table_cell_small=ParagraphStyle(
             'TableCellSmall',
-            parent=self.styles['Normal'],
-            fontName=self.cyrillic_font,
+            parent=sample['Normal'],
+            fontName=font,
             fontSize=7,
             spaceAfter=2,
             leading=9,
             alignment=0,
             wordWrap='CJK'
+        ),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _make_two_col_style(font, header_bg, body_bg, center_columns=(1,)):
+    """
+    Общий TableStyle статистических таблиц: заголовок header_bg, тело body_bg,
+    центрирование столбцов center_columns. Кэшируется по набору параметров.
+    """
+    return TableStyle([
+        ('FONTNAME', (0, 1), (-1, -1), font),
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(header_bg)),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        *(('ALIGN', (col, 0), (col, -1), 'CENTER') for col in center_columns),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor(body_bg)),
+        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#CCCCCC')),
+        ('FONTSIZE', (0, 0), (-1, -1), 8),
+        ('LEFTPADDING', (0, 0), (-1, -1), 8),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 8),
+        ('TOPPADDING', (0, 0), (-1, -1), 6),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 6)
+    ])
+
+
+@functools.lru_cache(maxsize=None)
+def _make_detail_style(font, header_bg, body_bg, center_columns=(0,)):
+    """
+    Общий TableStyle таблиц детального отчета: отличается от статистического
+    выравниванием по верху, тонкой сеткой и меньшими отступами.
+    """
+    return TableStyle([
+        ('FONTNAME', (0, 1), (-1, -1), font),
+        ('FONTSIZE', (0, 1), (-1, -1), 8),
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(header_bg)),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        *(('ALIGN', (col, 0), (col, -1), 'CENTER') for col in center_columns),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor(body_bg)),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#CCCCCC')),
+        ('LEFTPADDING', (0, 0), (-1, -1), 6),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 6),
+        ('TOPPADDING', (0, 0), (-1, -1), 4),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 4)
+    ])
+
+
+@functools.lru_cache(maxsize=None)
+def _plain_frag(style):
+    """Фрагмент-образец стиля style для текста без разметки (разбирается один раз)"""
+    return ParaParser().parse('x', style)[1][0]
+
+
+def _fast_paragraph(text, style):
+    """
+    Paragraph без XML-разбора: текст без &, <, > превращается в один фрагмент
+    по образцу стиля. Текст с разметкой или пустой идет в обычный Paragraph.
+    """
+    if '<' in text or '>' in text or '&' in text:
+        return Paragraph(text, style)
+    cleaned = cleanBlockQuotedText(text)
+    if not cleaned:
+        return Paragraph(text, style)
+    frags = [_plain_frag(style).clone(text=cleaned)]
+    textTransformFrags(frags, style)
+    return Paragraph(cleaned, style, frags=frags)
+
+
+_MARKUP_ESCAPE_TABLE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+_NEEDS_ESCAPE = re.compile(r'[&<>]')
+
+
+def _escape_markup(text):
+    """
+    Экранирование &, <, > для текста Paragraph (один проход по строке).
+    Большинство имен и биографий таких символов не содержит - они возвращаются как есть.
+    """
+    if _NEEDS_ESCAPE.search(text) is None:
+        return text
+    return text.translate(_MARKUP_ESCAPE_TABLE)
+
+
+class _StreamingTable(Flowable):
+    """
+    Таблица, строки которой создаются по мере верстки: в памяти только Paragraph
+    еще не выведенных строк (около страницы), а не всех записей сразу.
+    make_row(idx, record) строит строку по записи; заголовок повторяется на каждой
+    странице. Высота строки измеряется один раз и передается LongTable частей,
+    поэтому при разбиении строки заново не размечаются.
+    """
+    
+    def __init__(self, header, records, make_row, col_widths, style, start=0, rows=None, heights=None, metrics=None):
+        super().__init__()
+        self.header = header
+        self.records = records
+        self.make_row = make_row
+        self.col_widths = col_widths
+        self.style = style
+        self.start = start  # Первая запись, для которой строка еще не создана
+        self.hAlign = 'CENTER'
+        self._rows = rows or []  # Созданные, но еще не выведенные строки
+        self._heights = heights or []  # Их измеренные высоты
+        self._metrics = metrics  # (высота заголовка, высота пустой строки)
+    
+    def _table(self, data, heights=None):
+        table = LongTable(data, colWidths=self.col_widths, rowHeights=heights, repeatRows=1)
+        table.setStyle(self.style)
+        return table
+    
+    def _measure(self, availWidth, availHeight):
+        """
+        Добавляет строку следующей записи и измеряет ее: строка ставится под пустую,
+        чтобы к ней применились стили тела таблицы, а не заголовка.
+        """
+        blank = [''] * len(self.col_widths)
+        if self._metrics is None:
+            self._metrics = (
+                self._table([list(self.header)]).wrap(availWidth, availHeight)[1],
+                self._table([blank]).wrap(availWidth, availHeight)[1],
+            )
+        row = self.make_row(self.start + 1, self.records[self.start])
+        height = self._table([blank, list(row)]).wrap(availWidth, availHeight)[1] - self._metrics[1]
+        self._rows.append(row)
+        self._heights.append(height)
+        self.start += 1
+    
+    def wrap(self, availWidth, availHeight):
+        if self._metrics is None and not self.records:
+            self._metrics = (self._table([list(self.header)]).wrap(availWidth, availHeight)[1], 0)
+        # Строки добавляются, пока не перекроют доступную высоту или не кончатся записи
+        while self.start < len(self.records) and (
+            self._metrics is None or self._metrics[0] + sum(self._heights) <= availHeight
+        ):
+            self._measure(availWidth, availHeight)
+        self.width = sum(self.col_widths)
+        self.height = self._metrics[0] + sum(self._heights)
+        return self.width, self.height
+    
+    def _part(self, count):
+        """LongTable из заголовка и первых count созданных строк"""
+        return self._table(
+            [list(self.header)] + [list(row) for row in self._rows[:count]],
+            [self._metrics[0]] + self._heights[:count]
         )
+    
+    def split(self, availWidth, availHeight):
+        self.wrap(availWidth, availHeight)
+        count, used = 0, self._metrics[0]
+        while count < len(self._rows) and used + self._heights[count] <= availHeight:
+            used += self._heights[count]
+            count += 1
+        if count == 0:
+            return []
+        first = self._part(count)
+        if count == len(self._rows) and self.start >= len(self.records):
+            return [first]
+        rest = _StreamingTable(
+            self.header, self.records, self.make_row, self.col_widths, self.style,
+            start=self.start, rows=self._rows[count:], heights=self._heights[count:],
+            metrics=self._metrics
+        )
+        return [first, rest]
+    
+    def draw(self):
+        table = self._part(len(self._rows))
+        table.wrap(self.width, self.height)
+        table.drawOn(self.canv, 0, 0)
+
+
+class _MetricsTable(Flowable):
+    """
+    Таблица метрик фиксированной структуры (две колонки, короткие строки):
+    рисуется прямо на холсте, без разметки Table и Paragraph.
+    Оформление повторяет _make_two_col_style.
+    """
+    HEADER_HEIGHT = 23
+    ROW_HEIGHT = 22
+    PADDING = 8
+    
+    def __init__(self, header, rows, font, col_widths, header_bg, body_bg):
+        super().__init__()
+        self.header = header
+        self.rows = rows
+        self.font = font
+        self.col_widths = col_widths
+        self.header_bg = colors.HexColor(header_bg)
+        self.body_bg = colors.HexColor(body_bg)
+        self.hAlign = 'CENTER'
+        self.width = sum(col_widths)
+        self.height = self.HEADER_HEIGHT + self.ROW_HEIGHT * len(rows)
+    
+    def wrap(self, availWidth, availHeight):
+        return self.width, self.height
+    
+    def draw(self):
+        c = self.canv
+        c.saveState()
+        label_width, value_width = self.col_widths
+        value_center = label_width + value_width / 2
+        body_height = self.height - self.HEADER_HEIGHT
+        
+        # Фон заголовка и тела
+        c.setFillColor(self.header_bg)
+        c.rect(0, body_height, self.width, self.HEADER_HEIGHT, stroke=0, fill=1)
+        c.setFillColor(self.body_bg)
+        c.rect(0, 0, self.width, body_height, stroke=0, fill=1)
+        
+        # Заголовок
+        c.setFillColor(colors.white)
+        c.setFont(f'{self.font}-Bold', 9)
+        baseline = body_height + (self.HEADER_HEIGHT - 9) / 2 + 2
+        c.drawCentredString(label_width / 2, baseline, self.header[0])
+        c.drawCentredString(value_center, baseline, self.header[1])
+        
+        # Строки: метрика слева, значение по центру
+        c.setFillColor(colors.black)
+        c.setFont(self.font, 8)
+        for i, (label, value) in enumerate(self.rows):
+            baseline = body_height - (i + 1) * self.ROW_HEIGHT + (self.ROW_HEIGHT - 8) / 2 + 2
+            c.drawString(self.PADDING, baseline, label)
+            c.drawCentredString(value_center, baseline, str(value))
+        
+        # Сетка
+        c.setStrokeColor(colors.HexColor('#CCCCCC'))
+        c.setLineWidth(1)
+        c.rect(0, 0, self.width, self.height, stroke=1, fill=0)
+        c.line(label_width, 0, label_width, self.height)
+        for i in range(len(self.rows)):
+            y = body_height - i * self.ROW_HEIGHT
+            c.line(0, y, self.width, y)
+        c.restoreState()
+
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+if not RL_ACCEL_AVAILABLE:
+    logging.debug("C-ускоритель reportlab не найден, таблицы строятся медленнее (pip install rl_accel)")
+
+class PDFReporter:
+    """Базовый класс для генерации PDF отчетов"""
+    
+    __slots__ = (
+        'db_manager', 'cyrillic_font', 'styles',
+        'title_style', 'heading_style', 'normal_style', 'table_header_style',
+        'table_cell_style', 'table_cell_center_style', 'table_cell_small_style',
+    )
+    
+    def __init__(self):
+        self.db_manager = None
+        self.cyrillic_font = self.setup_fonts()
+        self.setup_styles()
+    
+    async def execute_query(self, query, args=None, **kwargs):
+        """
+        Запрос через DatabaseManager отчета (или глобальный db_manager):
+        каждый вызов берет отдельное соединение из его пула.
+        """
+        manager = self.db_manager if self.db_manager else db_manager
+        if not manager:
+            raise RuntimeError("DatabaseManager не инициализирован")
+        return await manager.execute_query(query, args, **kwargs)
+    
+    def _cell(self, value, style):
+        """
+        Ячейка таблицы: короткое значение с центрированием выводится строкой
+        (шрифт и выравнивание задает TableStyle), остальное - через Paragraph.
+        """
+        text = str(value)
+        if style is self.table_cell_center_style and len(text) < 20:
+            return text
+        return Paragraph(text, style)
+    
+    def setup_fonts(self):
+        """Регистрация кириллических шрифтов"""
+        return _register_cyrillic_font()
+        
+    def setup_styles(self):
+        """Настройка стилей для PDF с кириллическими шрифтами"""
+        styles = _report_styles(self.cyrillic_font)
+        self.styles = styles.sample
+        self.title_style = styles.title
+        self.heading_style = styles.heading
+        self.normal_style = styles.normal
+        self.table_header_style = styles.table_header
+        self.table_cell_style = styles.table_cell
+        self.table_cell_center_style = styles.table_cell_center
+        self.table_cell_small_style = styles.table_cell_small
 
 class StatisticalReport(PDFReporter):
     """Класс для генерации статистического отчета"""
     
+    # Собранные показатели общие для всех отчетов: повторный отчет в течение
+    # METRICS_CACHE_TTL секунд не обращается к БД
+    METRICS_CACHE_TTL = 60
+    _metrics_cache = None  # (time.monotonic() на момент сбора, metrics_data)
+    # Текущий сбор показателей: одновременные отчеты ждут его, а не запускают свой
+    _metrics_task = None
+    
+    __slots__ = ('metrics_data', 'chart_data')
+    
     def __init__(self, db_manager_instance=None):
         super().__init__()
         self.metrics_data = {}
@@ -189,245 +676,133 @@ class StatisticalReport(PDFReporter):
         
     async def collect_data(self):
         """Сбор данных для статистического отчета с использованием агрегирующих SQL-запросов"""
+        cls = StatisticalReport
+        cached = cls._metrics_cache
+        if cached and time.monotonic() - cached[0] < self.METRICS_CACHE_TTL:
+            self.metrics_data = cached[1]
+            return True
+        
+        task = cls._metrics_task
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            task = cls._metrics_task = asyncio.ensure_future(self._load_metrics())
         try:
-            # Основные метрики через агрегирующие запросы
-            total_actors = await self.get_total_count('actor')
-            total_productions = await self.get_total_count('production')
-            total_rehearsals = await self.get_total_count('rehearsal')
-            total_roles = await self.get_total_count('role')
-            total_plays = await self.get_total_count('play')
-            total_performances = await self.get_total_count('performance')
-            
-            # Статистика по репетициям по месяцам
-            monthly_rehearsals = await self.get_rehearsals_by_month()
-            
-            # Статистика по жанрам пьес
-            plays_by_genre = await self.get_plays_by_genre()
-            
-            # Статистика по театрам
-            productions_by_theatre = await self.get_productions_by_theatre()
-            
-            # Статистика по режиссерам
-            productions_by_director = await self.get_productions_by_director()
-            
-            # Активность за последние 30 дней
-            daily_activity = await self.get_daily_activity_last_30_days()
-            
-            # Топ-5 активных актеров
-            top_actors = await self.get_top_actors_by_rehearsals(5)
-            
-            # Новые записи за последний месяц
-            new_actors_month = await self.get_new_records_last_month('actor')
-            new_productions_month = await self.get_new_records_last_month('production')
-            
-            self.metrics_data = {
-                'total_actors': total_actors,
-                'total_productions': total_productions,
-                'total_rehearsals': total_rehearsals,
-                'total_roles': total_roles,
-                'total_plays': total_plays,
-                'total_performances': total_performances,
-                'monthly_rehearsals': monthly_rehearsals,
-                'plays_by_genre': plays_by_genre,
-                'productions_by_theatre': productions_by_theatre,
-                'productions_by_director': productions_by_director,
-                'daily_activity': daily_activity,
-                'top_actors': top_actors,
-                'new_actors_month': new_actors_month,
-                'new_productions_month': new_productions_month
-            }
-            
+            self.metrics_data = await asyncio.shield(task)
             return True
         except Exception as e:
             logging.error(f"Ошибка сбора данных для статистического отчета: {e}")
             return False
 
+    async def _load_metrics(self):
+        """Выполняет запросы показателей и сохраняет результат в кэш класса"""
+        # Запросы независимы: выполняются параллельно на разных соединениях пула
+        (
+            totals,                   # Основные метрики и новые записи за месяц
+            monthly_rehearsals,       # Репетиции по месяцам
+            plays_by_genre,           # Жанры пьес
+            productions_by_theatre,   # Постановки по театрам
+            productions_by_director,  # Постановки по режиссерам
+            daily_activity,           # Активность за последние 30 дней
+            top_actors,               # Топ-5 активных актеров
+        ) = await asyncio.gather(
+            self.get_all_totals(),
+            self.get_rehearsals_by_month(),
+            self.get_plays_by_genre(),
+            self.get_productions_by_theatre(),
+            self.get_productions_by_director(),
+            self.get_daily_activity_last_30_days(),
+            self.get_top_actors_by_rehearsals(5),
+        )
+        
+        metrics_data = {
+            **totals,
+            'monthly_rehearsals': monthly_rehearsals,
+            'plays_by_genre': plays_by_genre,
+            'productions_by_theatre': productions_by_theatre,
+            'productions_by_director': productions_by_director,
+            'daily_activity': daily_activity,
+            'top_actors': top_actors
+        }
+        StatisticalReport._metrics_cache = (time.monotonic(), metrics_data)
+        return metrics_data
+
+    async def get_all_totals(self):
+        """Общие количества записей и новые записи за месяц одним запросом"""
+        result = await self.execute_query(_TOTALS_QUERY, is_select=True)
+        row = result[0] if result else {}
+        return {key: row.get(key) or 0 for key in _TOTALS_SUBQUERIES}
+    
     async def get_total_count(self, table_name):
-        """Получить общее количество записей в таблице"""
-        query = f"SELECT COUNT(*) as total FROM {table_name}"
-        manager = self.db_manager if self.db_manager else db_manager
-        if not manager:
-            raise RuntimeError("DatabaseManager не инициализирован")
-        result = await manager.execute_query(query)
+        """Получить общее количество записей в таблице (только таблицы из Queries.COUNT_BY_TABLE)"""
+        query = Queries.COUNT_BY_TABLE.get(table_name)
+        if query is None:
+            logging.error(f"Неизвестная таблица для подсчета: {table_name}")
+            return 0
+        result = await self.execute_query(query)
         if result and len(result) > 0:
             return result[0].get('total', 0)
         return 0
     
     async def get_new_records_last_month(self, table_name):
         """Получить количество новых записей за последний месяц"""
-        query = f"""
-        SELECT COUNT(*) as count 
-        FROM {table_name} 
-        WHERE created_at >= DATE_SUB(NOW(), INTERVAL 1 MONTH)
-        """
-        manager = self.db_manager if self.db_manager else db_manager
-        if not manager:
-            raise RuntimeError("DatabaseManager не инициализирован")
-        result = await manager.execute_query(query)
+        query = Queries.NEW_RECORDS_LAST_MONTH_BY_TABLE.get(table_name)
+        if query is None:
+            logging.error(f"Неизвестная таблица для подсчета: {table_name}")
+            return 0
+        result = await self.execute_query(query)
         if result and len(result) > 0:
             return result[0].get('count', 0)
         return 0
     
     async def get_productions_by_theatre(self):
         """Статистика постановок по театрам"""
-        query = """
-        SELECT 
-            t.id,
-            t.name as theatre_name,
-            COUNT(DISTINCT p.id) as production_count
-        FROM production p
-        JOIN performance perf ON p.id = perf.production_id
-        JOIN location l ON perf.location_id = l.id
-        JOIN theatre t ON l.theatre_id = t.id
-        GROUP BY t.id, t.name
-        ORDER BY production_count DESC
-        """
-        manager = self.db_manager if self.db_manager else db_manager
-        if not manager:
-            raise RuntimeError("DatabaseManager не инициализирован")
-        return await manager.execute_query(query)
+        return await self.execute_query(_PRODUCTIONS_BY_THEATRE_QUERY, is_select=True)
     
     async def get_productions_by_director(self):
         """Статистика постановок по режиссерам"""
-        query = """
-        SELECT 
-            d.id,
-            d.full_name as director_name,
-            COUNT(p.id) as production_count
-        FROM production p
-        JOIN director d ON p.director_id = d.id
-        GROUP BY d.id, d.full_name
-        ORDER BY production_count DESC
-        LIMIT 10
-        """
-        manager = self.db_manager if self.db_manager else db_manager
-        if not manager:
-            raise RuntimeError("DatabaseManager не инициализирован")
-        return await manager.execute_query(query)
+        return await self.execute_query(_PRODUCTIONS_BY_DIRECTOR_QUERY, is_select=True)
     
     async def get_daily_activity_last_30_days(self):
         """Активность по дням за последние 30 дней"""
-        query = """
-        SELECT 
-            DATE(datetime) as activity_date,
-            COUNT(*) as count
-        FROM rehearsal 
-        WHERE datetime >= DATE_SUB(NOW(), INTERVAL 30 DAY)
-        GROUP BY DATE(datetime)
-        ORDER BY activity_date DESC
-        """
-        manager = self.db_manager if self.db_manager else db_manager
-        if not manager:
-            raise RuntimeError("DatabaseManager не инициализирован")
-        return await manager.execute_query(query)
+        return await self.execute_query(_DAILY_ACTIVITY_QUERY, is_select=True)
     
     async def get_rehearsals_by_month(self):
         """Статистика репетиций по месяцам"""
-        query = """
-        SELECT 
-            DATE_FORMAT(datetime, '%%Y-%%m') as month,
-            COUNT(*) as count
-        FROM rehearsal 
-        WHERE datetime >= DATE_SUB(NOW(), INTERVAL 6 MONTH)
-        GROUP BY DATE_FORMAT(datetime, '%%Y-%%m')
-        ORDER BY month DESC
-        """
-        manager = self.db_manager if self.db_manager else db_manager
-        if not manager:
-            raise RuntimeError("DatabaseManager не инициализирован")
-        return await manager.execute_query(query)
+        rows = await self.execute_query(_REHEARSALS_BY_MONTH_QUERY, is_select=True)
+        if not rows:
+            return rows
+        return [
+            {'month': f"{row['month_key'] // 100}-{row['month_key'] % 100:02d}", 'count': row['count']}
+            for row in rows
+        ]
     
     async def get_plays_by_genre(self):
         """Распределение пьес по жанрам"""
-        query = """
-        SELECT 
-            genre,
-            COUNT(*) as count
-        FROM play 
-        GROUP BY genre
-        ORDER BY count DESC
-        """
-        manager = self.db_manager if self.db_manager else db_manager
-        if not manager:
-            raise RuntimeError("DatabaseManager не инициализирован")
-        return await manager.execute_query(query)
+        return await self.execute_query(_PLAYS_BY_GENRE_QUERY, is_select=True)
     
     async def get_top_actors_by_rehearsals(self, limit=5):
         """Топ актеров по количеству репетиций"""
-        query = """
-        SELECT 
-            a.id,
-            a.full_name,
-            COUNT(ar.rehearsal_id) as rehearsal_count
-        FROM actor a
-        LEFT JOIN actor_rehearsal ar ON a.id = ar.actor_id
-        GROUP BY a.id, a.full_name
-        ORDER BY rehearsal_count DESC
-        LIMIT %s
-        """
-        manager = self.db_manager if self.db_manager else db_manager
-        if not manager:
-            raise RuntimeError("DatabaseManager не инициализирован")
-        return await manager.execute_query(query, (limit,))
+        query, params = Queries.top_actors_by_rehearsals(limit)
+        return await self.execute_query(query, params)
+    
+    # Строки таблицы метрик: подпись -> ключ metrics_data
+    METRICS_ROWS = (
+        ("Всего актеров", 'total_actors'),
+        ("Всего постановок", 'total_productions'),
+        ("Всего репетиций", 'total_rehearsals'),
+        ("Всего ролей", 'total_roles'),
+        ("Всего пьес", 'total_plays'),
+        ("Всего спектаклей", 'total_performances'),
+        ("Новых актеров за месяц", 'new_actors_month'),
+        ("Новых постановок за месяц", 'new_productions_month'),
+    )
     
     def create_metrics_table(self):
-        """Создание таблицы с метриками"""
-        header_data = [
-            Paragraph("Метрика", self.table_header_style),
-            Paragraph("Значение", self.table_header_style)
-        ]
-        data = [header_data]
-        
-        # Добавляем данные с использованием Paragraph для правильного переноса
-        data.append([
-            Paragraph("Всего актеров", self.table_cell_style),
-            Paragraph(str(self.metrics_data['total_actors']), self.table_cell_center_style)
-        ])
-        data.append([
-            Paragraph("Всего постановок", self.table_cell_style),
-            Paragraph(str(self.metrics_data['total_productions']), self.table_cell_center_style)
-        ])
-        data.append([
-            Paragraph("Всего репетиций", self.table_cell_style),
-            Paragraph(str(self.metrics_data['total_rehearsals']), self.table_cell_center_style)
-        ])
-        data.append([
-            Paragraph("Всего ролей", self.table_cell_style),
-            Paragraph(str(self.metrics_data['total_roles']), self.table_cell_center_style)
-        ])
-        data.append([
-            Paragraph("Всего пьес", self.table_cell_style),
-            Paragraph(str(self.metrics_data['total_plays']), self.table_cell_center_style)
-        ])
-        data.append([
-            Paragraph("Всего спектаклей", self.table_cell_style),
-            Paragraph(str(self.metrics_data['total_performances']), self.table_cell_center_style)
-        ])
-        data.append([
-            Paragraph("Новых актеров за месяц", self.table_cell_style),
-            Paragraph(str(self.metrics_data['new_actors_month']), self.table_cell_center_style)
-        ])
-        data.append([
-            Paragraph("Новых постановок за месяц", self.table_cell_style),
-            Paragraph(str(self.metrics_data['new_productions_month']), self.table_cell_center_style)
-        ])
-        
-        table = Table(data, colWidths=[3.5*inch, 2*inch])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4A90A4')),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('ALIGN', (1, 0), (1, -1), 'CENTER'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#E8F4F8')),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#CCCCCC')),
-            ('FONTSIZE', (0, 0), (-1, -1), 8),
-            ('LEFTPADDING', (0, 0), (-1, -1), 8),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 8),
-            ('TOPPADDING', (0, 0), (-1, -1), 6),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6)
-        ]))
-        
-        return table
+        """Создание таблицы с метриками (рисуется на холсте, структура фиксирована)"""
+        rows = [(label, self.metrics_data[key]) for label, key in self.METRICS_ROWS]
+        return _MetricsTable(
+            ("Метрика", "Значение"), rows, self.cyrillic_font,
+            (3.5*inch, 2*inch), '#4A90A4', '#E8F4F8'
+        )
     
     def create_genre_distribution_table(self):
         """Создание таблицы распределения по жанрам"""
@@ -441,30 +816,19 @@ class StatisticalReport(PDFReporter):
         if not plays_by_genre or len(plays_by_genre) == 0:
             data.append([
                 Paragraph("Нет данных", self.table_cell_style),
-                Paragraph("0", self.table_cell_center_style)
+                self._cell("0", self.table_cell_center_style)
             ])
         else:
-            for item in plays_by_genre:
-                genre = item.get('genre', 'Неизвестно')
-                data.append([
-                    Paragraph(genre, self.table_cell_style),
-                    Paragraph(str(item.get('count', 0)), self.table_cell_center_style)
-                ])
+            labels = [item.get('genre', 'Неизвестно') for item in plays_by_genre]
+            counts = [item.get('count', 0) for item in plays_by_genre]
+            label_style, count_style = self.table_cell_style, self.table_cell_center_style
+            data += [
+                [Paragraph(label, label_style), self._cell(count, count_style)]
+                for label, count in zip(labels, counts)
+            ]
         
         table = Table(data, colWidths=[3.5*inch, 2*inch])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#6B8E7A')),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('ALIGN', (1, 0), (1, -1), 'CENTER'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#F0F8F4')),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#CCCCCC')),
-            ('FONTSIZE', (0, 0), (-1, -1), 8),
-            ('LEFTPADDING', (0, 0), (-1, -1), 8),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 8),
-            ('TOPPADDING', (0, 0), (-1, -1), 6),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6)
-        ]))
+        table.setStyle(_make_two_col_style(self.cyrillic_font, '#6B8E7A', '#F0F8F4'))
         
         return table
     
@@ -480,30 +844,19 @@ class StatisticalReport(PDFReporter):
         if not monthly_rehearsals or len(monthly_rehearsals) == 0:
             data.append([
                 Paragraph("Нет данных", self.table_cell_style),
-                Paragraph("0", self.table_cell_center_style)
+                self._cell("0", self.table_cell_center_style)
             ])
         else:
-            for item in monthly_rehearsals:
-                month = item.get('month', 'Неизвестно')
-                data.append([
-                    Paragraph(month, self.table_cell_style),
-                    Paragraph(str(item.get('count', 0)), self.table_cell_center_style)
-                ])
+            labels = [item.get('month', 'Неизвестно') for item in monthly_rehearsals]
+            counts = [item.get('count', 0) for item in monthly_rehearsals]
+            label_style, count_style = self.table_cell_style, self.table_cell_center_style
+            data += [
+                [Paragraph(label, label_style), self._cell(count, count_style)]
+                for label, count in zip(labels, counts)
+            ]
         
         table = Table(data, colWidths=[3.5*inch, 2*inch])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#A67C7C')),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('ALIGN', (1, 0), (1, -1), 'CENTER'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#F8F0F0')),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#CCCCCC')),
-            ('FONTSIZE', (0, 0), (-1, -1), 8),
-            ('LEFTPADDING', (0, 0), (-1, -1), 8),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 8),
-            ('TOPPADDING', (0, 0), (-1, -1), 6),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6)
-        ]))
+        table.setStyle(_make_two_col_style(self.cyrillic_font, '#A67C7C', '#F8F0F0'))
         
         return table
     
@@ -519,30 +872,19 @@ class StatisticalReport(PDFReporter):
         if not top_actors or len(top_actors) == 0:
             data.append([
                 Paragraph("Нет данных", self.table_cell_style),
-                Paragraph("0", self.table_cell_center_style)
+                self._cell("0", self.table_cell_center_style)
             ])
         else:
-            for actor in top_actors:
-                name = actor.get('full_name', 'Неизвестно')
-                data.append([
-                    Paragraph(name, self.table_cell_style),
-                    Paragraph(str(actor.get('rehearsal_count', 0)), self.table_cell_center_style)
-                ])
+            labels = [actor.get('full_name', 'Неизвестно') for actor in top_actors]
+            counts = [actor.get('rehearsal_count', 0) for actor in top_actors]
+            label_style, count_style = self.table_cell_style, self.table_cell_center_style
+            data += [
+                [Paragraph(label, label_style), self._cell(count, count_style)]
+                for label, count in zip(labels, counts)
+            ]
         
         table = Table(data, colWidths=[4*inch, 1.5*inch])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#B8865B')),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('ALIGN', (1, 0), (1, -1), 'CENTER'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#FFF8F0')),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#CCCCCC')),
-            ('FONTSIZE', (0, 0), (-1, -1), 8),
-            ('LEFTPADDING', (0, 0), (-1, -1), 8),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 8),
-            ('TOPPADDING', (0, 0), (-1, -1), 6),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6)
-        ]))
+        table.setStyle(_make_two_col_style(self.cyrillic_font, '#B8865B', '#FFF8F0'))
         
         return table
     
@@ -558,34 +900,21 @@ class StatisticalReport(PDFReporter):
         productions_by_theatre = self.metrics_data.get('productions_by_theatre', [])
         if not productions_by_theatre or len(productions_by_theatre) == 0:
             data.append([
-                Paragraph("Нет данных", self.table_cell_center_style),
+                self._cell("Нет данных", self.table_cell_center_style),
                 Paragraph("Нет данных", self.table_cell_style),
-                Paragraph("0", self.table_cell_center_style)
+                self._cell("0", self.table_cell_center_style)
             ])
         else:
-            for idx, item in enumerate(productions_by_theatre, start=1):
-                theatre_name = item.get('theatre_name', 'Неизвестно')
-                data.append([
-                    Paragraph(str(idx), self.table_cell_center_style),
-                    Paragraph(theatre_name, self.table_cell_style),
-                    Paragraph(str(item.get('production_count', 0)), self.table_cell_center_style)
-                ])
+            labels = [item.get('theatre_name', 'Неизвестно') for item in productions_by_theatre]
+            counts = [item.get('production_count', 0) for item in productions_by_theatre]
+            label_style, count_style = self.table_cell_style, self.table_cell_center_style
+            data += [
+                [self._cell(idx, count_style), Paragraph(label, label_style), self._cell(count, count_style)]
+                for idx, (label, count) in enumerate(zip(labels, counts), start=1)
+            ]
         
         table = Table(data, colWidths=[0.8*inch, 3.2*inch, 1.5*inch])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#6B8E7A')),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('ALIGN', (0, 0), (0, -1), 'CENTER'),
-            ('ALIGN', (2, 0), (2, -1), 'CENTER'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#F0F8F4')),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#CCCCCC')),
-            ('FONTSIZE', (0, 0), (-1, -1), 8),
-            ('LEFTPADDING', (0, 0), (-1, -1), 8),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 8),
-            ('TOPPADDING', (0, 0), (-1, -1), 6),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6)
-        ]))
+        table.setStyle(_make_two_col_style(self.cyrillic_font, '#6B8E7A', '#F0F8F4', (0, 2)))
         
         return table
     
@@ -601,75 +930,57 @@ class StatisticalReport(PDFReporter):
         productions_by_director = self.metrics_data.get('productions_by_director', [])
         if not productions_by_director or len(productions_by_director) == 0:
             data.append([
-                Paragraph("Нет данных", self.table_cell_center_style),
+                self._cell("Нет данных", self.table_cell_center_style),
                 Paragraph("Нет данных", self.table_cell_style),
-                Paragraph("0", self.table_cell_center_style)
+                self._cell("0", self.table_cell_center_style)
             ])
         else:
-            for idx, item in enumerate(productions_by_director, start=1):
-                director_name = item.get('director_name', 'Неизвестно')
-                data.append([
-                    Paragraph(str(idx), self.table_cell_center_style),
-                    Paragraph(director_name, self.table_cell_style),
-                    Paragraph(str(item.get('production_count', 0)), self.table_cell_center_style)
-                ])
+            labels = [item.get('director_name', 'Неизвестно') for item in productions_by_director]
+            counts = [item.get('production_count', 0) for item in productions_by_director]
+            label_style, count_style = self.table_cell_style, self.table_cell_center_style
+            data += [
+                [self._cell(idx, count_style), Paragraph(label, label_style), self._cell(count, count_style)]
+                for idx, (label, count) in enumerate(zip(labels, counts), start=1)
+            ]
         
         table = Table(data, colWidths=[0.8*inch, 3.2*inch, 1.5*inch])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#9370DB')),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('ALIGN', (0, 0), (0, -1), 'CENTER'),
-            ('ALIGN', (2, 0), (2, -1), 'CENTER'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#F5F0FF')),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#CCCCCC')),
-            ('FONTSIZE', (0, 0), (-1, -1), 8),
-            ('LEFTPADDING', (0, 0), (-1, -1), 8),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 8),
-            ('TOPPADDING', (0, 0), (-1, -1), 6),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6)
-        ]))
+        table.setStyle(_make_two_col_style(self.cyrillic_font, '#9370DB', '#F5F0FF', (0, 2)))
         
         return table
     
-    def generate_chart_image(self, chart_type='genre'):
-        """Генерация изображения диаграммы"""
+    # Данные metrics_data для каждого типа диаграммы
+    CHART_DATA_KEYS = {
+        'genre': 'plays_by_genre',
+        'monthly': 'monthly_rehearsals',
+    }
+    
+    # Построитель векторной диаграммы для каждого типа и поле подписи категорий
+    CHART_BUILDERS = {
+        'genre': (_make_pie, 'genre'),
+        'monthly': (_make_bar, 'month'),
+    }
+    
+    def create_chart(self, chart_type):
+        """Диаграмма reportlab (Drawing) по metrics_data; None, если данных нет"""
         try:
-            plt.figure(figsize=(8, 6))
-            
-            if chart_type == 'genre' and self.metrics_data.get('plays_by_genre'):
-                genres = [item.get('genre', 'Неизвестно') for item in self.metrics_data['plays_by_genre']]
-                counts = [item.get('count', 0) for item in self.metrics_data['plays_by_genre']]
-                
-                plt.pie(counts, labels=genres, autopct='%1.1f%%', startangle=90)
-                plt.title('Распределение пьес по жанрам')
-                
-            elif chart_type == 'monthly' and self.metrics_data.get('monthly_rehearsals'):
-                months = [item.get('month', '') for item in self.metrics_data['monthly_rehearsals']]
-                counts = [item.get('count', 0) for item in self.metrics_data['monthly_rehearsals']]
-                
-                plt.bar(months, counts, color='skyblue')
-                plt.title('Репетиции по месяцам')
-                plt.xticks(rotation=45)
-                plt.ylabel('Количество репетиций')
-            
-            plt.tight_layout()
-            
-            # Сохраняем изображение в буфер
-            img_buffer = io.BytesIO()
-            plt.savefig(img_buffer, format='png', dpi=150, bbox_inches='tight')
-            img_buffer.seek(0)
-            plt.close()
-            
-            return img_buffer
-            
+            items = self.metrics_data.get(self.CHART_DATA_KEYS.get(chart_type))
+            if not items:
+                return None
+            build, label_key = self.CHART_BUILDERS[chart_type]
+            labels = tuple(str(item.get(label_key) or 'Неизвестно') for item in items)
+            counts = tuple(item.get('count', 0) for item in items)
+            return build(labels, counts, self.cyrillic_font)
         except Exception as e:
             logging.error(f"Ошибка генерации диаграммы: {e}")
             return None
     
-    async def generate_report(self, filename=None):
-        """Генерация полного отчета"""
-        if not filename:
+    async def generate_report(self, filename=None, output=None):
+        """
+        Генерация полного отчета.
+        output - необязательный записываемый поток (например, BytesIO):
+        если передан, PDF пишется в него, а не в файл filename.
+        """
+        if output is None and not filename:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"Статистический_отчет_{timestamp}.pdf"
         
@@ -681,7 +992,7 @@ class StatisticalReport(PDFReporter):
                 return False
             
             # Создаем документ
-            doc = SimpleDocTemplate(filename, pagesize=A4, topMargin=1*inch)
+            doc = SimpleDocTemplate(output if output is not None else filename, pagesize=A4, topMargin=1*inch)
             story = []
             
             # Титульная страница
@@ -720,13 +1031,12 @@ class StatisticalReport(PDFReporter):
             story.append(genre_table)
             
             # Добавляем круговую диаграмму
-            genre_chart = self.generate_chart_image('genre')
-            if genre_chart:
+            genre_chart = self.create_chart('genre')
+            if genre_chart is not None:
                 story.append(Spacer(1, 0.2*inch))
                 chart_title = Paragraph("Диаграмма распределения по жанрам:", self.normal_style)
                 story.append(chart_title)
-                chart_img = Image(genre_chart, width=5*inch, height=3*inch)
-                story.append(chart_img)
+                story.append(genre_chart)
             
             story.append(PageBreak())
             
@@ -739,13 +1049,12 @@ class StatisticalReport(PDFReporter):
             story.append(monthly_table)
             
             # Добавляем столбчатую диаграмму
-            monthly_chart = self.generate_chart_image('monthly')
-            if monthly_chart:
+            monthly_chart = self.create_chart('monthly')
+            if monthly_chart is not None:
                 story.append(Spacer(1, 0.2*inch))
                 chart_title = Paragraph("Диаграмма репетиций по месяцам:", self.normal_style)
                 story.append(chart_title)
-                chart_img = Image(monthly_chart, width=5*inch, height=3*inch)
-                story.append(chart_img)
+                story.append(monthly_chart)
             
             story.append(PageBreak())
             
@@ -803,9 +1112,9 @@ class StatisticalReport(PDFReporter):
             analysis_para = Paragraph(analysis_text, self.normal_style)
             story.append(analysis_para)
             
-            # Строим документ
-            doc.build(story)
-            logging.info(f"Статистический отчет успешно создан: {filename}")
+            # Строим документ в потоке, чтобы не блокировать цикл событий
+            await asyncio.get_running_loop().run_in_executor(None, doc.build, story)
+            logging.info(f"Статистический отчет успешно создан: {filename if output is None else 'поток'}")
             return True
             
         except Exception as e:
@@ -815,9 +1124,53 @@ class StatisticalReport(PDFReporter):
 class DetailedReport(PDFReporter):
     """Класс для генерации детального табличного отчета"""
     
+    # Разделы в порядке вывода: ключ -> (атрибут с данными, метод построения таблицы,
+    # название, описание для оглавления)
+    SECTIONS = {
+        'actors': ('actors_data', 'create_actors_table', 'Актеры', 'Информация об актерах театральной труппы'),
+        'productions': ('productions_data', 'create_productions_table', 'Постановки', 'Список постановок с деталями'),
+        'rehearsals': ('rehearsals_data', 'create_rehearsals_table', 'Репетиции', 'Расписание и информация о репетициях'),
+        'performances': ('performances_data', 'create_performances_table', 'Спектакли', 'Расписание спектаклей'),
+        'plays': ('plays_data', 'create_plays_table', 'Пьесы', 'Каталог пьес'),
+        'authors': ('authors_data', 'create_authors_table', 'Авторы', 'Информация об авторах пьес'),
+        'directors': ('directors_data', 'create_directors_table', 'Режиссеры', 'Информация о режиссерах'),
+    }
+    # Метод загрузки данных для каждого раздела
+    SECTION_FETCHERS = {
+        'actors': 'get_actors_grouped_by_id',
+        'productions': 'get_all_productions_with_details',
+        'rehearsals': 'get_all_rehearsals_with_details',
+        'performances': 'get_all_performances_with_details',
+        'plays': 'get_all_plays',
+        'authors': 'get_all_authors',
+        'directors': 'get_all_directors',
+    }
+    
+    # Ширины столбцов таблиц разделов для A4: одни и те же для всех отчетов
+    COL_WIDTHS = {
+        'actors': [0.5*inch, 2.0*inch, 2.0*inch, 0.8*inch, 0.8*inch],
+        'productions': [0.5*inch, 2.0*inch, 0.8*inch, 1.5*inch, 1.7*inch],
+        'rehearsals': [0.5*inch, 1.2*inch, 2.0*inch, 2.8*inch],
+        'performances': [0.5*inch, 1.2*inch, 2.0*inch, 2.8*inch],
+        'plays': [0.5*inch, 3.0*inch, 1.5*inch, 0.7*inch],
+        'authors': [0.5*inch, 1.5*inch, 4.5*inch],
+        'directors': [0.5*inch, 1.5*inch, 4.5*inch],
+    }
+    
+    # Заголовки столбцов таблиц разделов
+    HEADERS = {
+        'actors': ("№", "ФИО", "Опыт", " Кол-во Репетиций", "Кол- во Постановок"),
+        'productions': ("№", "Название", "Дата", "Пьеса", "Режиссер"),
+        'rehearsals': ("№", "Дата и время", "Место", "Постановка"),
+        'performances': ("№", "Дата и время", "Место", "Постановка"),
+        'plays': ("№", "Название", "Жанр", "Год"),
+        'authors': ("№", "ФИО", "Биография"),
+        'directors': ("№", "ФИО", "Биография"),
+    }
+    
     def __init__(self, db_manager_instance=None):
         super().__init__()
-        self.tables_data = {}
+        self.total_records = 0
         # Отдельные атрибуты для каждого типа данных
         self.actors_data = []
         self.productions_data = []
@@ -826,45 +1179,45 @@ class DetailedReport(PDFReporter):
         self.authors_data = []
         self.directors_data = []
         self.performances_data = []
+        # Заглушки «Не указано» этого отчета: один Paragraph на стиль, а не новый в каждой строке
+        self._ph_cell = Paragraph('Не указано', self.table_cell_style)
+        self._ph_center = Paragraph('Не указано', self.table_cell_center_style)
+        # Paragraph заголовков создаются один раз на отчет; таблицам отдаются копии списков
+        self._headers = {
+            key: [Paragraph(label, self.table_header_style) for label in labels]
+            for key, labels in self.HEADERS.items()
+        }
         self.db_manager = db_manager_instance
         if not self.db_manager:
             logging.warning("DetailedReport: db_manager_instance не передан, будет использован глобальный db_manager")
         else:
             logging.info(f"DetailedReport: db_manager установлен: {type(self.db_manager)}")
         
-    async def collect_data(self, start_date=None, end_date=None):
-        """Сбор данных для детального отчета"""
+    async def _fetch_section(self, key, on_loaded=None):
+        """Загрузка данных раздела key в его атрибут; затем вызывается on_loaded(key)"""
+        rows = await getattr(self, self.SECTION_FETCHERS[key])()
+        setattr(self, self.SECTIONS[key][0], rows if rows else [])
+        if on_loaded:
+            on_loaded(key)
+    
+    async def collect_data(self, start_date=None, end_date=None, on_loaded=None):
+        """
+        Сбор данных для детального отчета.
+        on_loaded(key) вызывается по готовности каждого раздела, пока остальные
+        запросы еще выполняются.
+        """
         try:
             logging.info("Начало сбора данных для детального отчета")
             
-            # Получаем данные из всех таблиц БД
-            actors = await self.get_actors_grouped_by_id()
-            productions = await self.get_all_productions_with_details()
-            rehearsals = await self.get_all_rehearsals_with_details()
-            plays = await self.get_all_plays()
-            authors = await self.get_all_authors()
-            directors = await self.get_all_directors()
-            performances = await self.get_all_performances_with_details()
-            
-            # Сохраняем данные в отдельных переменных
-            self.actors_data = actors if actors else []
-            self.productions_data = productions if productions else []
-            self.rehearsals_data = rehearsals if rehearsals else []
-            self.plays_data = plays if plays else []
-            self.authors_data = authors if authors else []
-            self.directors_data = directors if directors else []
-            self.performances_data = performances if performances else []
+            # Получаем данные из всех таблиц БД: запросы независимы и идут
+            # параллельно, каждый на своем соединении из пула
+            await asyncio.gather(*(self._fetch_section(key, on_loaded) for key in self.SECTIONS))
             
-            # Также сохраняем в общем словаре для обратной совместимости
-            self.tables_data = {
-                'actors': self.actors_data,
-                'productions': self.productions_data,
-                'rehearsals': self.rehearsals_data,
-                'plays': self.plays_data,
-                'authors': self.authors_data,
-                'directors': self.directors_data,
-                'performances': self.performances_data
-            }
+            self.total_records = (
+                len(self.actors_data) + len(self.productions_data) + len(self.rehearsals_data)
+                + len(self.plays_data) + len(self.authors_data) + len(self.directors_data)
+                + len(self.performances_data)
+            )
             
             # Детальное логирование
             logging.info(f"Актеров: {len(self.actors_data)}")
@@ -882,27 +1235,39 @@ class DetailedReport(PDFReporter):
             logging.error(traceback.format_exc())
             return False
 
-    async def generate_report(self, filename=None):
-        """Генерация детального отчета"""
-        if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"Детальный_отчет_{timestamp}.pdf"
-        
-        # Убеждаемся, что путь существует
-        import os
-        directory = os.path.dirname(filename) if os.path.dirname(filename) else os.getcwd()
-        if directory and not os.path.exists(directory):
-            os.makedirs(directory, exist_ok=True)
+    async def generate_report(self, filename=None, output=None):
+        """
+        Генерация детального отчета.
+        output - необязательный записываемый поток (например, BytesIO):
+        если передан, PDF пишется в него, а не в файл filename.
+        """
+        if output is None:
+            if not filename:
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                filename = f"Детальный_отчет_{timestamp}.pdf"
+            
+            # Убеждаемся, что путь существует
+            directory = os.path.dirname(filename) if os.path.dirname(filename) else os.getcwd()
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory, exist_ok=True)
         
         try:
-            # Собираем данные
-            success = await self.collect_data()
+            # Собираем данные; таблица раздела строится, как только пришли его строки,
+            # пока остальные запросы еще в пути
+            tables = {}
+            
+            def build_table(key):
+                attr, builder, _, _ = self.SECTIONS[key]
+                if getattr(self, attr):
+                    tables[key] = getattr(self, builder)()
+            
+            success = await self.collect_data(on_loaded=build_table)
             if not success:
                 logging.error("Не удалось собрать данные для детального отчета")
                 return False
             
             # Создаем документ
-            doc = SimpleDocTemplate(filename, pagesize=A4, topMargin=1*inch)
+            doc = SimpleDocTemplate(output if output is not None else filename, pagesize=A4, topMargin=1*inch)
             story = []
             
             # Титульная страница
@@ -917,8 +1282,7 @@ class DetailedReport(PDFReporter):
             
             story.append(Spacer(1, 0.5*inch))
             
-            total_records = sum(len(data) for data in self.tables_data.values())
-            records_info = Paragraph(f"Всего записей в отчете: {total_records}", self.normal_style)
+            records_info = Paragraph(f"Всего записей в отчете: {self.total_records}", self.normal_style)
             story.append(records_info)
             
             story.append(PageBreak())
@@ -928,22 +1292,12 @@ class DetailedReport(PDFReporter):
             story.append(toc_title)
             story.append(Spacer(1, 0.3*inch))
             
-            # Определяем доступные разделы
-            sections = []
-            if len(self.actors_data) > 0:
-                sections.append(('actors', 'Актеры', 'Информация об актерах театральной труппы'))
-            if len(self.productions_data) > 0:
-                sections.append(('productions', 'Постановки', 'Список постановок с деталями'))
-            if len(self.rehearsals_data) > 0:
-                sections.append(('rehearsals', 'Репетиции', 'Расписание и информация о репетициях'))
-            if len(self.performances_data) > 0:
-                sections.append(('performances', 'Спектакли', 'Расписание спектаклей'))
-            if len(self.plays_data) > 0:
-                sections.append(('plays', 'Пьесы', 'Каталог пьес'))
-            if len(self.authors_data) > 0:
-                sections.append(('authors', 'Авторы', 'Информация об авторах пьес'))
-            if len(self.directors_data) > 0:
-                sections.append(('directors', 'Режиссеры', 'Информация о режиссерах'))
+            # Определяем доступные разделы (только с данными)
+            sections = [
+                (key, name, desc)
+                for key, (attr, _, name, desc) in self.SECTIONS.items()
+                if getattr(self, attr)
+            ]
             
             # Добавляем разделы в оглавление
             if len(sections) == 0:
@@ -963,37 +1317,8 @@ class DetailedReport(PDFReporter):
                 story.append(section_title)
                 story.append(Spacer(1, 0.1*inch))
                 
-                # Используем прямые переменные вместо словаря tables_data
-                if key == 'actors':
-                    data_list = self.actors_data
-                    count = len(self.actors_data)
-                    table = self.create_actors_table()
-                elif key == 'productions':
-                    data_list = self.productions_data
-                    count = len(self.productions_data)
-                    table = self.create_productions_table()
-                elif key == 'rehearsals':
-                    data_list = self.rehearsals_data
-                    count = len(self.rehearsals_data)
-                    table = self.create_rehearsals_table()
-                elif key == 'performances':
-                    data_list = self.performances_data
-                    count = len(self.performances_data)
-                    table = self.create_performances_table()
-                elif key == 'plays':
-                    data_list = self.plays_data
-                    count = len(self.plays_data)
-                    table = self.create_plays_table()
-                elif key == 'authors':
-                    data_list = self.authors_data
-                    count = len(self.authors_data)
-                    table = self.create_authors_table()
-                elif key == 'directors':
-                    data_list = self.directors_data
-                    count = len(self.directors_data)
-                    table = self.create_directors_table()
-                else:
-                    continue
+                count = len(getattr(self, self.SECTIONS[key][0]))
+                table = tables[key]
                 
                 count_info = Paragraph(f"Всего записей: {count}", self.normal_style)
                 story.append(count_info)
@@ -1016,7 +1341,7 @@ class DetailedReport(PDFReporter):
                 <br/><br/>
                 • Отчет содержит данные из {len(sections)} различных разделов системы
                 <br/>
-                • Всего обработано записей: {total_records}
+                • Всего обработано записей: {self.total_records}
                 <br/>
                 • Данные актуальны на: {datetime.now().strftime('%d.%m.%Y %H:%M')}
                 <br/>
@@ -1028,9 +1353,9 @@ class DetailedReport(PDFReporter):
                 conclusion_para = Paragraph(conclusion_text, self.normal_style)
                 story.append(conclusion_para)
             
-            # Строим документ
-            doc.build(story)
-            logging.info(f"Детальный отчет успешно создан: {filename}")
+            # Строим документ в потоке, чтобы не блокировать цикл событий
+            await asyncio.get_running_loop().run_in_executor(None, doc.build, story)
+            logging.info(f"Детальный отчет успешно создан: {filename if output is None else 'поток'}")
             
             return True
             
@@ -1043,102 +1368,68 @@ class DetailedReport(PDFReporter):
     # Методы для получения данных из БД
     async def get_actors_grouped_by_id(self):
         """Получить всех актеров с группировкой по ID и статистикой"""
-        query = """
-        SELECT 
-            a.id,
-            a.full_name,
-            a.experience,
-            COUNT(DISTINCT ar.rehearsal_id) as rehearsal_count,
-            COUNT(DISTINCT ap.production_id) as production_count
-        FROM actor a
-        LEFT JOIN actor_rehearsal ar ON a.id = ar.actor_id
-        LEFT JOIN actor_production ap ON a.id = ap.actor_id
-        GROUP BY a.id, a.full_name, a.experience
-        ORDER BY a.id
-        """
-        manager = self.db_manager if self.db_manager else db_manager
-        if not manager:
-            raise RuntimeError("DatabaseManager не инициализирован")
-        return await manager.execute_query(query)
+        return await self.execute_query(_DETAILED_ACTORS_QUERY, is_select=True)
 
     async def get_all_productions_with_details(self, start_date=None, end_date=None):
         """Получить все постановки с деталями"""
-        query = """
-        SELECT p.id, p.title, p.production_date, 
-            pl.id as play_id, pl.title as play_title, pl.genre,
-            d.id as director_id, d.full_name as director_name
-        FROM production p
-        JOIN play pl ON p.play_id = pl.id
-        JOIN director d ON p.director_id = d.id
-        ORDER BY p.production_date DESC
-        """
-        
-        manager = self.db_manager if self.db_manager else db_manager
-        if not manager:
-            raise RuntimeError("DatabaseManager не инициализирован")
-        return await manager.execute_query(query)
+        return await self.execute_query(_DETAILED_PRODUCTIONS_QUERY, is_select=True)
 
     async def get_all_rehearsals_with_details(self, start_date=None, end_date=None):
         """Получить все репетиции с деталями"""
-        query = """
-        SELECT r.id, r.datetime,
-            t.id as theatre_id, t.name as theatre_name, 
-            l.id as location_id, l.hall_name,
-            pr.id as production_id, pr.title as production_title
-        FROM rehearsal r
-        JOIN location l ON r.location_id = l.id
-        JOIN theatre t ON l.theatre_id = t.id
-        JOIN production pr ON r.production_id = pr.id
-        ORDER BY r.datetime DESC
-        """
-        
-        manager = self.db_manager if self.db_manager else db_manager
-        if not manager:
-            raise RuntimeError("DatabaseManager не инициализирован")
-        return await manager.execute_query(query)
+        return await self.execute_query(_DETAILED_REHEARSALS_QUERY, is_select=True)
 
     async def get_all_plays(self):
         """Получить все пьесы"""
-        manager = self.db_manager if self.db_manager else db_manager
-        if not manager:
-            raise RuntimeError("DatabaseManager не инициализирован")
-        return await manager.execute_query("SELECT * FROM play ORDER BY id")
+        return await self.execute_query("SELECT * FROM play ORDER BY id", is_select=True)
 
     async def get_all_authors(self):
         """Получить всех авторов"""
-        manager = self.db_manager if self.db_manager else db_manager
-        if not manager:
-            raise RuntimeError("DatabaseManager не инициализирован")
-        return await manager.execute_query("SELECT * FROM author ORDER BY id")
+        return await self.execute_query("SELECT * FROM author ORDER BY id", is_select=True)
 
     async def get_all_directors(self):
         """Получить всех режиссеров"""
-        manager = self.db_manager if self.db_manager else db_manager
-        if not manager:
-            raise RuntimeError("DatabaseManager не инициализирован")
-        return await manager.execute_query("SELECT * FROM director ORDER BY id")
+        return await self.execute_query("SELECT * FROM director ORDER BY id", is_select=True)
 
     async def get_all_performances_with_details(self, start_date=None, end_date=None):
         """Получить все спектакли с деталями"""
-        query = """
-        SELECT p.id, p.datetime,
-            t.id as theatre_id, t.name as theatre_name, 
-            l.id as location_id, l.hall_name,
-            pr.id as production_id, pr.title as production_title
-        FROM performance p
-        JOIN location l ON p.location_id = l.id
-        JOIN theatre t ON l.theatre_id = t.id
-        JOIN production pr ON p.production_id = pr.id
-        ORDER BY p.datetime DESC
-        """
-        
-        manager = self.db_manager if self.db_manager else db_manager
-        if not manager:
-            raise RuntimeError("DatabaseManager не инициализирован")
-        return await manager.execute_query(query)
+        return await self.execute_query(_DETAILED_PERFORMANCES_QUERY, is_select=True)
 
     # Вспомогательные методы
-    def truncate_text(self, text, max_length=200):
+    @staticmethod
+    def _location_text(record):
+        """Место проведения «театр, зал» по строке репетиции или спектакля"""
+        theatre_name = record.get('theatre_name') or 'Не указано'
+        hall_name = record.get('hall_name') or 'Не указано'
+        if theatre_name != 'Не указано' or hall_name != 'Не указано':
+            return f"{theatre_name}, {hall_name}"
+        return 'Не указано'
+    
+    def _build_table(self, header, records, make_row, col_widths, style):
+        """
+        Таблица раздела: строки записей создаются постранично при сборке документа
+        (_StreamingTable). Таблицы строятся только для разделов с данными.
+        """
+        return _StreamingTable(header, records, make_row, col_widths, style)
+    
+    def _text_cell(self, text, style=None):
+        """
+        Текстовая ячейка. «Не указано» - заглушка отчета: Table переразмечает ячейку
+        перед отрисовкой, так что внутри одной сборки объект можно ставить в любые
+        ячейки; другим отчетам (и потокам) заглушки не передаются.
+        """
+        style = style or self.table_cell_style
+        if text == 'Не указано':
+            if style is self.table_cell_style:
+                return self._ph_cell
+            if style is self.table_cell_center_style:
+                return self._ph_center
+        return _fast_paragraph(text, style)
+    
+    # Форматтеры вызываются для каждой строки, а значения часто повторяются
+    # (одни и те же даты, «Не указано»), поэтому результаты кэшируются
+    @staticmethod
+    @functools.lru_cache(maxsize=8192)
+    def truncate_text(text, max_length=200):
         """Обрезка текста с добавлением многоточия"""
         if not text:
             return ""
@@ -1146,7 +1437,9 @@ class DetailedReport(PDFReporter):
             return text[:max_length-3] + "..."
         return text
 
-    def format_date_for_display(self, date_value):
+    @staticmethod
+    @functools.lru_cache(maxsize=8192)
+    def format_date_for_display(date_value):
         """Форматирование даты для отображения"""
         if not date_value:
             return ''
@@ -1161,7 +1454,9 @@ class DetailedReport(PDFReporter):
         except:
             return str(date_value)
 
-    def format_datetime_for_display(self, datetime_value):
+    @staticmethod
+    @functools.lru_cache(maxsize=8192)
+    def format_datetime_for_display(datetime_value):
         """Форматирование даты и времени для отображения"""
         if not datetime_value:
             return ''
@@ -1182,376 +1477,136 @@ class DetailedReport(PDFReporter):
         except:
             return str(datetime_value)
 
-    # Методы создания таблиц с использованием Paragraph для всех ячеек
+    # Методы создания таблиц: Paragraph для текстовых ячеек, короткие
+    # номера, счетчики и даты - строками (см. PDFReporter._cell).
+    # Строки создаются постранично через make_row (см. _build_table)
     def create_actors_table(self):
         """Создание таблицы актеров"""
-        header_data = [
-            Paragraph("№", self.table_header_style),
-            Paragraph("ФИО", self.table_header_style),
-            Paragraph("Опыт", self.table_header_style),
-            Paragraph(" Кол-во Репетиций", self.table_header_style),
-            Paragraph("Кол- во Постановок", self.table_header_style)
-        ]
-        data = [header_data]
+        cell, text_cell, center = self._cell, self._text_cell, self.table_cell_center_style
         
-        actors = self.actors_data
-        if not actors:
-            no_data_row = [
-                Paragraph("Нет данных", self.table_cell_style),
-                Paragraph("Нет данных", self.table_cell_style),
-                Paragraph("Нет данных", self.table_cell_style),
-                Paragraph("Нет данных", self.table_cell_center_style),
-                Paragraph("Нет данных", self.table_cell_center_style)
+        def make_row(idx, actor):
+            return [
+                cell(idx, center),
+                text_cell(actor.get('full_name') or 'Не указано'),
+                text_cell(actor.get('experience') or 'Не указано'),
+                cell(actor.get('rehearsal_count', 0), center),
+                cell(actor.get('production_count', 0), center)
             ]
-            data.append(no_data_row)
-        else:
-            for idx, actor in enumerate(actors, start=1):
-                full_name = actor.get('full_name', 'Не указано') or 'Не указано'
-                experience = actor.get('experience', 'Не указано') or 'Не указано'
-                
-                row = [
-                    Paragraph(str(idx), self.table_cell_center_style),
-                    Paragraph(full_name, self.table_cell_style),
-                    Paragraph(experience, self.table_cell_style),
-                    Paragraph(str(actor.get('rehearsal_count', 0)), self.table_cell_center_style),
-                    Paragraph(str(actor.get('production_count', 0)), self.table_cell_center_style)
-                ]
-                data.append(row)
-        
-        # Оптимальные ширины столбцов для A4
-        col_widths = [0.5*inch, 2.0*inch, 2.0*inch, 0.8*inch, 0.8*inch]
-        
-        table = Table(data, colWidths=col_widths, repeatRows=1)
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4A90A4')),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('ALIGN', (0, 0), (0, -1), 'CENTER'),
-            ('ALIGN', (3, 0), (4, -1), 'CENTER'),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#E8F4F8')),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#CCCCCC')),
-            ('LEFTPADDING', (0, 0), (-1, -1), 6),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 6),
-            ('TOPPADDING', (0, 0), (-1, -1), 4),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 4)
-        ]))
         
-        return table
+        return self._build_table(
+            list(self._headers['actors']),
+            self.actors_data, make_row, self.COL_WIDTHS['actors'],
+            _make_detail_style(self.cyrillic_font, '#4A90A4', '#E8F4F8', (0, 3, 4))
+        )
 
     def create_productions_table(self):
         """Создание таблицы постановок"""
-        header_data = [
-            Paragraph("№", self.table_header_style),
-            Paragraph("Название", self.table_header_style),
-            Paragraph("Дата", self.table_header_style),
-            Paragraph("Пьеса", self.table_header_style),
-            Paragraph("Режиссер", self.table_header_style)
-        ]
-        data = [header_data]
+        cell, text_cell, center = self._cell, self._text_cell, self.table_cell_center_style
         
-        productions = self.productions_data
-        if not productions:
-            no_data_row = [
-                Paragraph("Нет данных", self.table_cell_center_style),
-                Paragraph("Нет данных", self.table_cell_style),
-                Paragraph("Нет данных", self.table_cell_center_style),
-                Paragraph("Нет данных", self.table_cell_style),
-                Paragraph("Нет данных", self.table_cell_style)
+        def make_row(idx, production):
+            return [
+                cell(idx, center),
+                text_cell(production.get('title') or 'Не указано'),
+                cell(self.format_date_for_display(production.get('production_date')) or 'Не указано', center),
+                text_cell(production.get('play_title') or 'Не указано'),
+                text_cell(production.get('director_name') or 'Не указано')
             ]
-            data.append(no_data_row)
-        else:
-            for idx, production in enumerate(productions, start=1):
-                title = production.get('title', 'Не указано') or 'Не указано'
-                play_title = production.get('play_title', 'Не указано') or 'Не указано'
-                director_name = production.get('director_name', 'Не указано') or 'Не указано'
-                
-                row = [
-                    Paragraph(str(idx), self.table_cell_center_style),
-                    Paragraph(title, self.table_cell_style),
-                    Paragraph(self.format_date_for_display(production.get('production_date')) or 'Не указано', self.table_cell_center_style),
-                    Paragraph(play_title, self.table_cell_style),
-                    Paragraph(director_name, self.table_cell_style)
-                ]
-                data.append(row)
-        
-        col_widths = [0.5*inch, 2.0*inch, 0.8*inch, 1.5*inch, 1.7*inch]
         
-        table = Table(data, colWidths=col_widths, repeatRows=1)
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#6B8E7A')),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('ALIGN', (0, 0), (0, -1), 'CENTER'),
-            ('ALIGN', (2, 0), (2, -1), 'CENTER'),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#F0F8F4')),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#CCCCCC')),
-            ('LEFTPADDING', (0, 0), (-1, -1), 6),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 6),
-            ('TOPPADDING', (0, 0), (-1, -1), 4),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 4)
-        ]))
-        
-        return table
+        return self._build_table(
+            list(self._headers['productions']),
+            self.productions_data, make_row, self.COL_WIDTHS['productions'],
+            _make_detail_style(self.cyrillic_font, '#6B8E7A', '#F0F8F4', (0, 2))
+        )
 
     def create_rehearsals_table(self):
         """Создание таблицы репетиций"""
-        header_data = [
-            Paragraph("№", self.table_header_style),
-            Paragraph("Дата и время", self.table_header_style),
-            Paragraph("Место", self.table_header_style),
-            Paragraph("Постановка", self.table_header_style)
-        ]
-        data = [header_data]
+        cell, text_cell, center = self._cell, self._text_cell, self.table_cell_center_style
         
-        rehearsals = self.rehearsals_data
-        if not rehearsals:
-            no_data_row = [
-                Paragraph("Нет данных", self.table_cell_center_style),
-                Paragraph("Нет данных", self.table_cell_center_style),
-                Paragraph("Нет данных", self.table_cell_style),
-                Paragraph("Нет данных", self.table_cell_style)
+        def make_row(idx, rehearsal):
+            return [
+                cell(idx, center),
+                cell(self.format_datetime_for_display(rehearsal.get('datetime')) or 'Не указано', center),
+                text_cell(self._location_text(rehearsal)),
+                text_cell(rehearsal.get('production_title') or 'Не указано')
             ]
-            data.append(no_data_row)
-        else:
-            for idx, rehearsal in enumerate(rehearsals, start=1):
-                theatre_name = rehearsal.get('theatre_name', 'Не указано') or 'Не указано'
-                hall_name = rehearsal.get('hall_name', 'Не указано') or 'Не указано'
-                location = f"{theatre_name}, {hall_name}" if theatre_name != 'Не указано' or hall_name != 'Не указано' else 'Не указано'
-                production_title = rehearsal.get('production_title', 'Не указано') or 'Не указано'
-                
-                row = [
-                    Paragraph(str(idx), self.table_cell_center_style),
-                    Paragraph(self.format_datetime_for_display(rehearsal.get('datetime')) or 'Не указано', self.table_cell_center_style),
-                    Paragraph(location, self.table_cell_style),
-                    Paragraph(production_title, self.table_cell_style)
-                ]
-                data.append(row)
-        
-        col_widths = [0.5*inch, 1.2*inch, 2.0*inch, 2.8*inch]
         
-        table = Table(data, colWidths=col_widths, repeatRows=1)
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#A67C7C')),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('ALIGN', (0, 0), (0, -1), 'CENTER'),
-            ('ALIGN', (1, 0), (1, -1), 'CENTER'),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#F8F0F0')),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#CCCCCC')),
-            ('LEFTPADDING', (0, 0), (-1, -1), 6),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 6),
-            ('TOPPADDING', (0, 0), (-1, -1), 4),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 4)
-        ]))
-        
-        return table
+        return self._build_table(
+            list(self._headers['rehearsals']),
+            self.rehearsals_data, make_row, self.COL_WIDTHS['rehearsals'],
+            _make_detail_style(self.cyrillic_font, '#A67C7C', '#F8F0F0', (0, 1))
+        )
 
     def create_performances_table(self):
         """Создание таблицы спектаклей"""
-        header_data = [
-            Paragraph("№", self.table_header_style),
-            Paragraph("Дата и время", self.table_header_style),
-            Paragraph("Место", self.table_header_style),
-            Paragraph("Постановка", self.table_header_style)
-        ]
-        data = [header_data]
+        cell, text_cell, center = self._cell, self._text_cell, self.table_cell_center_style
         
-        performances = self.performances_data
-        if not performances:
-            no_data_row = [
-                Paragraph("Нет данных", self.table_cell_center_style),
-                Paragraph("Нет данных", self.table_cell_center_style),
-                Paragraph("Нет данных", self.table_cell_style),
-                Paragraph("Нет данных", self.table_cell_style)
+        def make_row(idx, performance):
+            return [
+                cell(idx, center),
+                cell(self.format_datetime_for_display(performance.get('datetime')) or 'Не указано', center),
+                text_cell(self._location_text(performance)),
+                text_cell(performance.get('production_title') or 'Не указано')
             ]
-            data.append(no_data_row)
-        else:
-            for idx, performance in enumerate(performances, start=1):
-                theatre_name = performance.get('theatre_name', 'Не указано') or 'Не указано'
-                hall_name = performance.get('hall_name', 'Не указано') or 'Не указано'
-                location = f"{theatre_name}, {hall_name}" if theatre_name != 'Не указано' or hall_name != 'Не указано' else 'Не указано'
-                production_title = performance.get('production_title', 'Не указано') or 'Не указано'
-                
-                row = [
-                    Paragraph(str(idx), self.table_cell_center_style),
-                    Paragraph(self.format_datetime_for_display(performance.get('datetime')) or 'Не указано', self.table_cell_center_style),
-                    Paragraph(location, self.table_cell_style),
-                    Paragraph(production_title, self.table_cell_style)
-                ]
-                data.append(row)
-        
-        col_widths = [0.5*inch, 1.2*inch, 2.0*inch, 2.8*inch]
         
-        table = Table(data, colWidths=col_widths, repeatRows=1)
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#B8865B')),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('ALIGN', (0, 0), (0, -1), 'CENTER'),
-            ('ALIGN', (1, 0), (1, -1), 'CENTER'),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#FFF8F0')),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#CCCCCC')),
-            ('LEFTPADDING', (0, 0), (-1, -1), 6),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 6),
-            ('TOPPADDING', (0, 0), (-1, -1), 4),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 4)
-        ]))
-        
-        return table
+        return self._build_table(
+            list(self._headers['performances']),
+            self.performances_data, make_row, self.COL_WIDTHS['performances'],
+            _make_detail_style(self.cyrillic_font, '#B8865B', '#FFF8F0', (0, 1))
+        )
 
     def create_plays_table(self):
         """Создание таблицы пьес"""
-        header_data = [
-            Paragraph("№", self.table_header_style),
-            Paragraph("Название", self.table_header_style),
-            Paragraph("Жанр", self.table_header_style),
-            Paragraph("Год", self.table_header_style)
-        ]
-        data = [header_data]
+        cell, text_cell, center = self._cell, self._text_cell, self.table_cell_center_style
         
-        plays = self.plays_data
-        if not plays:
-            no_data_row = [
-                Paragraph("Нет данных", self.table_cell_center_style),
-                Paragraph("Нет данных", self.table_cell_style),
-                Paragraph("Нет данных", self.table_cell_style),
-                Paragraph("Нет данных", self.table_cell_center_style)
+        def make_row(idx, play):
+            return [
+                cell(idx, center),
+                text_cell(play.get('title') or 'Не указано'),
+                text_cell(play.get('genre') or 'Не указано'),
+                cell(play.get('year_written') or 'Не указано', center)
             ]
-            data.append(no_data_row)
-        else:
-            for idx, play in enumerate(plays, start=1):
-                title = play.get('title', 'Не указано') or 'Не указано'
-                genre = play.get('genre', 'Не указано') or 'Не указано'
-                year = str(play.get('year_written', '')) if play.get('year_written') else 'Не указано'
-                
-                row = [
-                    Paragraph(str(idx), self.table_cell_center_style),
-                    Paragraph(title, self.table_cell_style),
-                    Paragraph(genre, self.table_cell_style),
-                    Paragraph(year, self.table_cell_center_style)
-                ]
-                data.append(row)
-        
-        col_widths = [0.5*inch, 3.0*inch, 1.5*inch, 0.7*inch]
         
-        table = Table(data, colWidths=col_widths, repeatRows=1)
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#8B7A9E')),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('ALIGN', (0, 0), (0, -1), 'CENTER'),
-            ('ALIGN', (3, 0), (3, -1), 'CENTER'),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#F5F0FA')),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#CCCCCC')),
-            ('LEFTPADDING', (0, 0), (-1, -1), 6),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 6),
-            ('TOPPADDING', (0, 0), (-1, -1), 4),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 4)
-        ]))
-        
-        return table
+        return self._build_table(
+            list(self._headers['plays']),
+            self.plays_data, make_row, self.COL_WIDTHS['plays'],
+            _make_detail_style(self.cyrillic_font, '#8B7A9E', '#F5F0FA', (0, 3))
+        )
 
     def create_authors_table(self):
         """Создание таблицы авторов с полным отображением биографии"""
-        header_data = [
-            Paragraph("№", self.table_header_style),
-            Paragraph("ФИО", self.table_header_style),
-            Paragraph("Биография", self.table_header_style)
-        ]
-        data = [header_data]
+        cell, text_cell, center = self._cell, self._text_cell, self.table_cell_center_style
         
-        authors = self.authors_data
-        if not authors:
-            no_data_row = [
-                Paragraph("Нет данных", self.table_cell_center_style),
-                Paragraph("Нет данных", self.table_cell_style),
-                Paragraph("Нет данных", self.table_cell_style)
-            ]
-            data.append(no_data_row)
-        else:
-            for idx, author in enumerate(authors, start=1):
-                full_name = author.get('full_name', '') or 'Не указано'
-                bio = author.get('biography', '') or 'Не указано'
-                
+        def make_row(idx, author):
+            return [
+                cell(idx, center),
                 # Экранируем HTML символы для Paragraph
-                full_name_escaped = full_name.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-                bio_escaped = bio.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-                
-                row = [
-                    Paragraph(str(idx), self.table_cell_center_style),
-                    Paragraph(full_name_escaped, self.table_cell_style),
-                    Paragraph(bio_escaped, self.table_cell_style)
-                ]
-                data.append(row)
-        
-        col_widths = [0.5*inch, 1.5*inch, 4.5*inch]
-        
-        table = Table(data, colWidths=col_widths, repeatRows=1)
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#5F9EA0')),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('ALIGN', (0, 0), (0, -1), 'CENTER'),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#F0F8F8')),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#CCCCCC')),
-            ('LEFTPADDING', (0, 0), (-1, -1), 6),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 6),
-            ('TOPPADDING', (0, 0), (-1, -1), 4),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 4)
-        ]))
+                text_cell(_escape_markup(author.get('full_name') or 'Не указано')),
+                text_cell(_escape_markup(author.get('biography') or 'Не указано'))
+            ]
         
-        return table
+        return self._build_table(
+            list(self._headers['authors']),
+            self.authors_data, make_row, self.COL_WIDTHS['authors'],
+            _make_detail_style(self.cyrillic_font, '#5F9EA0', '#F0F8F8')
+        )
 
     def create_directors_table(self):
         """Создание таблицы режиссеров с полным отображением биографии"""
-        header_data = [
-            Paragraph("№", self.table_header_style),
-            Paragraph("ФИО", self.table_header_style),
-            Paragraph("Биография", self.table_header_style)
-        ]
-        data = [header_data]
+        cell, text_cell, center = self._cell, self._text_cell, self.table_cell_center_style
         
-        directors = self.directors_data
-        if not directors:
-            no_data_row = [
-                Paragraph("Нет данных", self.table_cell_center_style),
-                Paragraph("Нет данных", self.table_cell_style),
-                Paragraph("Нет данных", self.table_cell_style)
-            ]
-            data.append(no_data_row)
-        else:
-            for idx, director in enumerate(directors, start=1):
-                full_name = director.get('full_name', '') or 'Не указано'
-                bio = director.get('biography', '') or 'Не указано'
-                
+        def make_row(idx, director):
+            return [
+                cell(idx, center),
                 # Экранируем HTML символы для Paragraph
-                full_name_escaped = full_name.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-                bio_escaped = bio.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-                
-                row = [
-                    Paragraph(str(idx), self.table_cell_center_style),
-                    Paragraph(full_name_escaped, self.table_cell_style),
-                    Paragraph(bio_escaped, self.table_cell_style)
-                ]
-                data.append(row)
-        
-        col_widths = [0.5*inch, 1.5*inch, 4.5*inch]
-        
-        table = Table(data, colWidths=col_widths, repeatRows=1)
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#9370DB')),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('ALIGN', (0, 0), (0, -1), 'CENTER'),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#F5F0FF')),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#CCCCCC')),
-            ('LEFTPADDING', (0, 0), (-1, -1), 6),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 6),
-            ('TOPPADDING', (0, 0), (-1, -1), 4),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 4)
-        ]))
+                text_cell(_escape_markup(director.get('full_name') or 'Не указано')),
+                text_cell(_escape_markup(director.get('biography') or 'Не указано'))
+            ]
         
-        return table
+        return self._build_table(
+            list(self._headers['directors']),
+            self.directors_data, make_row, self.COL_WIDTHS['directors'],
+            _make_detail_style(self.cyrillic_font, '#9370DB', '#F5F0FF')
+        )
 
 async def init_database():
     """Инициализация базы данных для формирования отчетов."""
@@ -1583,12 +1638,12 @@ async def main():
     statistical_report = StatisticalReport()
     detailed_report = DetailedReport()
     
-    # Генерируем отчеты
-    logging.info("Начало генерации статистического отчета...")
-    stat_success = await statistical_report.generate_report()
-    
-    logging.info("Начало генерации детального отчета...")
-    det_success = await detailed_report.generate_report()
+    # Генерируем отчеты одновременно: оба берут соединения из одного пула
+    logging.info("Начало генерации статистического и детального отчетов...")
+    stat_success, det_success = await asyncio.gather(
+        statistical_report.generate_report(),
+        detailed_report.generate_report(),
+    )
     
     # Закрываем соединение с БД
     if db_manager:
@@ -6,12 +6,15 @@
 - aiomysql: асинхронный драйвер для работы с MySQL базой данных
   - aiomysql.create_pool: создание пула соединений для эффективной работы с БД
   - aiomysql.DictCursor: курсор, возвращающий результаты в виде словарей
+  - aiomysql.Cursor: курсор, возвращающий кортежи (для больших выборок)
+- collections.namedtuple: строки больших выборок с доступом к полям по имени
 - xlsxwriter: создание Excel файлов (.xlsx) с форматированием, диаграммами и стилями
 - datetime: форматирование дат в отчетах
 """
 import asyncio
 import aiomysql
 import xlsxwriter
+from collections import namedtuple
 from datetime import datetime
 from typing import Optional
 import logging
@@ -21,20 +24,23 @@ import os
 # Универсальный импорт конфигурации - работает и как модуль, и при прямом запуске
 try:
     # Пытаемся импортировать как модуль (относительный импорт)
-    from config.database import DB_CONFIG
+    from config.database import get_db_config
 except ImportError:
     # Если не работает, пытаемся абсолютный импорт
     try:
-        from config.database import DB_CONFIG
+        from config.database import get_db_config
     except ImportError:
         # Если и это не работает, добавляем родительскую директорию в путь
         import sys
         import os
         sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        from config.database import DB_CONFIG
+        from config.database import get_db_config
 
 _POOL = None
 
+# Классы строк по набору колонок: создаются один раз на форму результата
+_RECORD_TYPES = {}
+
 # Настройка логирования
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -43,7 +49,7 @@ async def get_pool():
     """Возвращает общий пул соединений aiomysql."""
     global _POOL
     if _POOL is None:
-        _POOL = await aiomysql.create_pool(**DB_CONFIG)
+        _POOL = await aiomysql.create_pool(**get_db_config())
         logging.info("Пул соединений с базой данных создан")
     return _POOL
 
@@ -66,6 +72,19 @@ async def get_data_from_db(query, params=None):
             await cursor.execute(query, params or ())
             return await cursor.fetchall()
 
+async def get_records_from_db(query, params=None):
+    """Большие выборки: кортежи строк без словаря на каждую строку, поля доступны по имени"""
+    pool = await get_pool()
+    async with pool.acquire() as conn:
+        async with conn.cursor(aiomysql.Cursor) as cursor:
+            await cursor.execute(query, params or ())
+            rows = await cursor.fetchall()
+            columns = tuple(column[0] for column in cursor.description)
+    record_type = _RECORD_TYPES.get(columns)
+    if record_type is None:
+        record_type = _RECORD_TYPES[columns] = namedtuple('Record', columns, rename=True)
+    return [record_type._make(row) for row in rows]
+
 async def get_all_productions_data():
     query = """
         SELECT 
@@ -96,7 +115,7 @@ async def get_all_productions_data():
         LEFT JOIN director d ON p.director_id = d.id
         ORDER BY p.production_date DESC, p.title
     """
-    return await get_data_from_db(query)
+    return await get_records_from_db(query)
 
 async def get_analytics_data():
     analytics = {}
@@ -300,23 +319,23 @@ def create_report(filepath=None):
 
     for row_idx, record in enumerate(productions_data, start=4):
         worksheet_data.write_number(row_idx, 0, row_idx - 3, id_format) 
-        worksheet_data.write(row_idx, 1, record['production_title'] or '', text_format) 
+        worksheet_data.write(row_idx, 1, record.production_title or '', text_format) 
         
-        if record['production_date']:
-            worksheet_data.write_datetime(row_idx, 2, record['production_date'], date_format)  
+        if record.production_date:
+            worksheet_data.write_datetime(row_idx, 2, record.production_date, date_format)  
         else:
             worksheet_data.write(row_idx, 2, '', center_format)
         
-        worksheet_data.write(row_idx, 3, record['play_title'] or '', text_format) 
-        worksheet_data.write(row_idx, 4, record['genre'] or '', center_format) 
-        worksheet_data.write_number(row_idx, 5, record['year_written'] or 0, year_format) 
-        worksheet_data.write(row_idx, 6, record['director_name'] or '', text_format) 
-        worksheet_data.write(row_idx, 7, record['author_name'] or '', text_format) 
-        worksheet_data.write(row_idx, 8, record['theatre_name'] or '', text_format)  
-        worksheet_data.write(row_idx, 9, record['city'] or '', center_format)  
-        worksheet_data.write_number(row_idx, 10, record['performances_count'] or 0, number_format) 
-        worksheet_data.write_number(row_idx, 11, record['rehearsals_count'] or 0, number_format) 
-        worksheet_data.write_number(row_idx, 12, record['actors_count'] or 0, number_format)  
+        worksheet_data.write(row_idx, 3, record.play_title or '', text_format) 
+        worksheet_data.write(row_idx, 4, record.genre or '', center_format) 
+        worksheet_data.write_number(row_idx, 5, record.year_written or 0, year_format) 
+        worksheet_data.write(row_idx, 6, record.director_name or '', text_format) 
+        worksheet_data.write(row_idx, 7, record.author_name or '', text_format) 
+        worksheet_data.write(row_idx, 8, record.theatre_name or '', text_format)  
+        worksheet_data.write(row_idx, 9, record.city or '', center_format)  
+        worksheet_data.write_number(row_idx, 10, record.performances_count or 0, number_format) 
+        worksheet_data.write_number(row_idx, 11, record.rehearsals_count or 0, number_format) 
+        worksheet_data.write_number(row_idx, 12, record.actors_count or 0, number_format)  
 
     column_widths = [6, 30, 15, 25, 15, 12, 25, 25, 25, 15, 15, 15, 15]
     for col, width in enumerate(column_widths):
@@ -56,8 +56,23 @@ db_manager = None
 event_loop = None
 db_initialized = False
 
-line_chart_data = []
-pie_chart_data = []
+# Ключи DatabaseManager.TABLE_CONFIG по названию таблицы в интерфейсе
+TABLE_KEYS = {
+    "Актеры": 'actors',
+    "Авторы": 'authors',
+    "Режиссеры": 'directors',
+    "Пьесы": 'plays',
+    "Постановки": 'productions',
+    "Спектакли": 'performances',
+    "Репетиции": 'rehearsals',
+    "Роли": 'roles',
+    "Локации": 'locations',
+    "Театры": 'theatres',
+}
+
+# Данные диаграмм: {'labels': [...], 'counts': [...]}
+line_chart_data = {'labels': [], 'counts': []}
+pie_chart_data = {'labels': [], 'counts': []}
 
 # ThemeManager и DatabaseManager импортируются из соответствующих модулей
 
@@ -1108,14 +1123,20 @@ async def refresh_all_data():
         actors_task = db_manager.get_all_actors()
         productions_task = db_manager.get_all_productions()
         roles_task = db_manager.get_total_roles()
-        monthly_data_task = db_manager.get_rehearsals_by_month(current_filters)
         genre_data_task = db_manager.get_plays_by_genre()
-        filtered_rehearsals_count_task = db_manager.get_filtered_rehearsals_count(current_filters)
+        dashboard_task = db_manager.get_rehearsal_dashboard(current_filters, 10)
         
-        actors, productions, roles_count, monthly_data, genre_data, filtered_rehearsals_count = await asyncio.gather(
-            actors_task, productions_task, roles_task, monthly_data_task, genre_data_task, filtered_rehearsals_count_task,
+        actors, productions, roles_count, genre_data, dashboard = await asyncio.gather(
+            actors_task, productions_task, roles_task, genre_data_task, dashboard_task,
             return_exceptions=True
         )
+        if isinstance(dashboard, Exception):
+            # Ошибка обрабатывается ниже вместе с остальными результатами
+            monthly_data = upcoming_rehearsals = filtered_rehearsals_count = dashboard
+        else:
+            monthly_data = dashboard['by_month']
+            upcoming_rehearsals = dashboard['upcoming']
+            filtered_rehearsals_count = dashboard['count']
         
         if isinstance(actors, Exception):
             logging.error(f"Ошибка загрузки актеров: {actors}")
@@ -1128,10 +1149,10 @@ async def refresh_all_data():
             roles_count = 0
         if isinstance(monthly_data, Exception):
             logging.error(f"Ошибка загрузки месячных данных: {monthly_data}")
-            monthly_data = []
+            monthly_data = {'labels': [], 'counts': []}
         if isinstance(genre_data, Exception):
             logging.error(f"Ошибка загрузки данных по жанрам: {genre_data}")
-            genre_data = []
+            genre_data = {'labels': [], 'counts': []}
         if isinstance(filtered_rehearsals_count, Exception):
             logging.error(f"Ошибка загрузки количества репетиций: {filtered_rehearsals_count}")
             filtered_rehearsals_count = 0
@@ -1144,11 +1165,10 @@ async def refresh_all_data():
             'roles_count': roles_count if not isinstance(roles_count, Exception) else 0
         }
         
-        line_chart_data = monthly_data if monthly_data and not isinstance(monthly_data, Exception) else []
-        pie_chart_data = genre_data if genre_data and not isinstance(genre_data, Exception) else []
+        line_chart_data = monthly_data
+        pie_chart_data = genre_data
         
-        # Загружаем репетиции для таблицы
-        upcoming_rehearsals = await db_manager.get_upcoming_rehearsals(10, current_filters)
+        # Репетиции для таблицы
         rehearsals_data = []
         
         if upcoming_rehearsals and not isinstance(upcoming_rehearsals, Exception):
@@ -1398,42 +1418,31 @@ class EditActorDialog(ValidatedDialog):
         if not self.actor_id:
             return
         
-        # Загружаем роли
-        future_roles = run_async(db_manager.get_actor_roles(self.actor_id))
-        if future_roles:
-            try:
-                roles_result = future_roles.result(timeout=10) or []
-                self.roles_data = []
-                for role in roles_result:
-                    self.roles_data.append({
-                        'role_id': role.get('role_id'),
-                        'production_id': role.get('production_id'),
-                        'role_name': role.get('role_name', ''),
-                        'production_title': role.get('production_title', '')
-                    })
-                self.update_roles_listbox()
-            except Exception as e:
-                logging.error(f"Ошибка загрузки ролей: {e}")
+        # Роли, репетиции и постановки загружаются одновременно
+        future = run_async(db_manager.get_actor_profile_bundle(self.actor_id))
+        if not future:
+            return
+        try:
+            roles_result, rehearsals_result, productions_result = future.result(timeout=10)
+        except Exception as e:
+            logging.error(f"Ошибка загрузки связей актера: {e}")
+            return
         
-        # Загружаем репетиции
-        future_rehs = run_async(db_manager.get_actor_rehearsals(self.actor_id))
-        if future_rehs:
-            try:
-                rehearsals_result = future_rehs.result(timeout=10) or []
-                self.rehearsal_ids = [r.get('rehearsal_id') for r in rehearsals_result]
-                self.update_rehearsals_listbox()
-            except Exception as e:
-                logging.error(f"Ошибка загрузки репетиций: {e}")
+        self.roles_data = []
+        for role in roles_result or []:
+            self.roles_data.append({
+                'role_id': role.get('role_id'),
+                'production_id': role.get('production_id'),
+                'role_name': role.get('role_name', ''),
+                'production_title': role.get('production_title', '')
+            })
+        self.update_roles_listbox()
         
-        # Загружаем постановки
-        future_prods = run_async(db_manager.get_actor_productions(self.actor_id))
-        if future_prods:
-            try:
-                productions_result = future_prods.result(timeout=10) or []
-                self.production_ids = [p.get('production_id') for p in productions_result]
-                self.update_productions_listbox()
-            except Exception as e:
-                logging.error(f"Ошибка загрузки постановок: {e}")
+        self.rehearsal_ids = [r.get('rehearsal_id') for r in rehearsals_result or []]
+        self.update_rehearsals_listbox()
+        
+        self.production_ids = [p.get('production_id') for p in productions_result or []]
+        self.update_productions_listbox()
         
     def init_ui(self):
         panel = wx.Panel(self)
@@ -1812,32 +1821,22 @@ class ViewActorDialog(wx.Dialog):
         if not self.actor_id:
             return
         
-        # Загружаем роли
-        future_roles = run_async(db_manager.get_actor_roles(self.actor_id))
-        if future_roles:
-            try:
-                self.roles_data = future_roles.result(timeout=10) or []
-                self.update_roles_listbox()
-            except Exception as e:
-                logging.error(f"Ошибка загрузки ролей актера: {e}")
+        # Роли, репетиции и постановки загружаются одновременно
+        future = run_async(db_manager.get_actor_profile_bundle(self.actor_id))
+        if not future:
+            return
+        try:
+            roles, rehearsals, productions = future.result(timeout=10)
+        except Exception as e:
+            logging.error(f"Ошибка загрузки связей актера: {e}")
+            return
         
-        # Загружаем репетиции
-        future_rehearsals = run_async(db_manager.get_actor_rehearsals(self.actor_id))
-        if future_rehearsals:
-            try:
-                self.rehearsals_data = future_rehearsals.result(timeout=10) or []
-                self.update_rehearsals_listbox()
-            except Exception as e:
-                logging.error(f"Ошибка загрузки репетиций актера: {e}")
-        
-        # Загружаем постановки
-        future_productions = run_async(db_manager.get_actor_productions(self.actor_id))
-        if future_productions:
-            try:
-                self.productions_data = future_productions.result(timeout=10) or []
-                self.update_productions_listbox()
-            except Exception as e:
-                logging.error(f"Ошибка загрузки постановок актера: {e}")
+        self.roles_data = roles or []
+        self.update_roles_listbox()
+        self.rehearsals_data = rehearsals or []
+        self.update_rehearsals_listbox()
+        self.productions_data = productions or []
+        self.update_productions_listbox()
         
     def init_ui(self):
         scroll = wx.ScrolledWindow(self)
@@ -4083,48 +4082,18 @@ def create_table_panel(parent, table_name):
                     data = []
                     headers = []
                     
-                    # Если есть поисковый текст - используем поисковые методы
-                    if search_text:
-                        search_methods = {
-                            "Актеры": db_manager.search_actors_sorted,
-                            "Авторы": db_manager.search_authors_sorted,
-                            "Режиссеры": db_manager.search_directors_sorted,
-                            "Пьесы": db_manager.search_plays_sorted,
-                            "Постановки": db_manager.search_productions_sorted,
-                            "Спектакли": db_manager.search_performances_sorted,
-                            "Репетиции": db_manager.search_rehearsals_sorted,
-                            "Роли": db_manager.search_roles_sorted,
-                            "Локации": db_manager.search_locations_sorted,
-                            "Театры": db_manager.search_theatres_sorted
-                        }
-                        
-                        search_method = search_methods.get(table_name)
-                        if search_method:
-                            results = await search_method(search_text, db_column, actual_sort_asc)
-                            
-                            # Если есть результаты поиска - преобразуем их
-                            if results:
-                                data = await convert_results_to_grid_format(results, table_name)
-                    else:
-                        # Если поиск пустой - загружаем все данные с сортировкой
-                        load_methods = {
-                            "Актеры": lambda: db_manager.get_all_actors_sorted(db_column, actual_sort_asc, force_refresh=True),
-                            "Авторы": lambda: db_manager.get_all_authors_sorted(db_column, actual_sort_asc, force_refresh=True),
-                            "Режиссеры": lambda: db_manager.get_all_directors_sorted(db_column, actual_sort_asc, force_refresh=True),
-                            "Пьесы": lambda: db_manager.get_all_plays_sorted(db_column, actual_sort_asc, force_refresh=True),
-                            "Постановки": lambda: db_manager.get_all_productions_sorted(db_column, actual_sort_asc, force_refresh=True),
-                            "Спектакли": lambda: db_manager.get_all_performances_sorted(db_column, actual_sort_asc, force_refresh=True),
-                            "Репетиции": lambda: db_manager.get_all_rehearsals_sorted(db_column, actual_sort_asc, force_refresh=True),
-                            "Роли": lambda: db_manager.get_all_roles_sorted(db_column, actual_sort_asc, force_refresh=True),
-                            "Локации": lambda: db_manager.get_all_locations_sorted(db_column, actual_sort_asc, force_refresh=True),
-                            "Театры": lambda: db_manager.get_all_theatres_sorted(db_column, actual_sort_asc, force_refresh=True)
-                        }
-                        
-                        load_method = load_methods.get(table_name)
-                        if load_method:
-                            results = await load_method()
-                            if results:
-                                data = await convert_results_to_grid_format(results, table_name)
+                    table_key = TABLE_KEYS.get(table_name)
+                    if table_key:
+                        if search_text:
+                            # Если есть поисковый текст - ищем в БД
+                            results = await db_manager.search(table_key, search_text, db_column, actual_sort_asc)
+                        else:
+                            # Если поиск пустой - загружаем все данные с сортировкой
+                            results = await db_manager.get_all(
+                                table_key, db_column, actual_sort_asc, force_refresh=True
+                            )
+                        if results:
+                            data = await convert_results_to_grid_format(results, table_name)
                     
                     # Получаем заголовки таблицы
                     _, table_headers_temp = await get_sample_data()
@@ -4851,9 +4820,9 @@ def create_table_panel(parent, table_name):
                                         )
                                         
                                         # Получаем текущие связи
-                                        current_roles = await db_manager.get_actor_roles(record_id)
-                                        current_rehearsals = await db_manager.get_actor_rehearsals(record_id)
-                                        current_productions = await db_manager.get_actor_productions(record_id)
+                                        current_roles, current_rehearsals, current_productions = (
+                                            await db_manager.get_actor_profile_bundle(record_id)
+                                        )
                                         
                                         # Удаляем старые роли
                                         for role in current_roles:
@@ -5893,13 +5862,10 @@ class DashboardPanel(wx.Panel):
         legend_bg = '#ffffff' if not is_dark else '#323232'
         legend_edge = '#cccccc' if not is_dark else '#666666'
         
-        months = []
-        rehearsals_count = []
+        months = line_chart_data['labels']
+        rehearsals_count = line_chart_data['counts']
         
-        if line_chart_data and len(line_chart_data) > 0:
-            months = [item['month'] for item in line_chart_data]
-            rehearsals_count = [item['count'] for item in line_chart_data]
-            
+        if rehearsals_count:
             if len(months) == len(rehearsals_count) and len(rehearsals_count) > 0:
                 x_positions = range(len(months))
                 
@@ -5961,9 +5927,9 @@ class DashboardPanel(wx.Panel):
         legend_bg = '#ffffff' if not is_dark else '#323232'
         legend_edge = '#cccccc' if not is_dark else '#666666'
         
-        if pie_chart_data and len(pie_chart_data) > 0:
-            categories = [item['genre'] for item in pie_chart_data]
-            category_values = [item['count'] for item in pie_chart_data]
+        if pie_chart_data['counts']:
+            categories = pie_chart_data['labels']
+            category_values = pie_chart_data['counts']
             
             if len(categories) == len(category_values):
                 colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFE66D', '#FF8E53', '#6A0572', '#1A535C', '#4ECDC4', '#FF6B6B']
@@ -14,7 +14,6 @@ except ImportError:
     WX_AVAILABLE = False
     logging.warning("wxPython не доступен, диалоги выбора будут отключены")
 
-from config.database import DB_CONFIG
 from src.database.connection import DatabaseManager
 
 logger = logging.getLogger(__name__)